@@ -1,4 +1,6 @@
+from .core.instrumentation import set_collector
 from .core.logger import set_log_level
+from .decorators.decorators import set_args_validation
 from .ml import set_ml_backend
 
-__all__ = ["set_log_level", "set_ml_backend"]
+__all__ = ["set_args_validation", "set_collector", "set_log_level", "set_ml_backend"]
@@ -1,10 +1,11 @@
 import os
+import sys
 from argparse import ArgumentParser
 
+from . import parsers, pipelines  # parsers and pipelines are imported lazily
 from .chunkers import MarkdownChunker
 from .core.logger import LOGGER
-from .parsers import DocxParser, HTMLParser, MarkdownParser, PdfParser, WikitJsonParser
-from .pipelines import BasePipeline, WikitJsonPipeline
+from .pipelines import BasePipeline
 
 
 def parse_arguments():
@@ -71,6 +72,21 @@ def parse_arguments():
 
 
 def main():
+    # "chunknorris ingest ..." chunks a whole directory
+    if sys.argv[1:2] == ["ingest"]:
+        # pylint: disable=import-outside-toplevel
+        from .pipelines.corpus_pipeline import main as ingest_main
+
+        ingest_main(sys.argv[2:])
+        return
+    # "chunknorris serve ..." starts a chunking server
+    if sys.argv[1:2] == ["serve"]:
+        # pylint: disable=import-outside-toplevel
+        from .server import main as serve_main
+
+        serve_main(sys.argv[2:])
+        return
+
     args = parse_arguments()
 
     filename, fileext = os.path.splitext(args.filepath)
@@ -86,24 +102,24 @@ def main():
 
     match fileext:
         case ".md":
-            parser = MarkdownParser()
+            parser = parsers.MarkdownParser()
             pipeline = BasePipeline(parser, chunker)
         case ".html":
-            parser = HTMLParser()
+            parser = parsers.HTMLParser()
             pipeline = BasePipeline(parser, chunker)
         case ".pdf":
-            parser = PdfParser(
+            parser = parsers.PdfParser(
                 extract_tables=args.extract_tables,
                 ocr_language=args.ocr_language,
                 use_ocr=args.use_ocr,
             )
             pipeline = BasePipeline(parser, chunker)
         case ".docx":
-            parser = DocxParser()
+            parser = parsers.DocxParser()
             pipeline = BasePipeline(parser, chunker)
         case ".json":
-            parser = WikitJsonParser()
-            pipeline = WikitJsonPipeline(parser, chunker)
+            parser = parsers.WikitJsonParser()
+            pipeline = pipelines.WikitJsonPipeline(parser, chunker)
         case _:
             raise ValueError(
                 "ChunkNorris currently only supports .md, .html, .pdf, .docx and .json files."
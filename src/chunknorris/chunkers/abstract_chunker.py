@@ -1,9 +1,10 @@
 import json
 import os
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Iterable
 
 from ..core.components import Chunk
+from ..core.writers import JsonLinesWriter
 
 
 class AbstractChunker(ABC):
@@ -27,26 +28,31 @@ class AbstractChunker(ABC):
         return self.chunk(string)
 
     def save_chunks(
-        self, chunks: list[Chunk], output_filename: str, remove_links: bool = False
+        self,
+        chunks: Iterable[Chunk],
+        output_filename: str,
+        remove_links: bool = False,
     ) -> None:
-        """Saves the chunks in .md files at the designated location.
+        """Saves the chunks at the designated location.
+        If the filename ends with ".jsonl" (or ".jsonl.gz" for a compressed output),
+        chunks are streamed one JSON line at a time, which is faster and keeps memory flat
+        on large outputs. Otherwise, they are saved as a JSON list.
 
         Args:
-            chunks (Chunks): the chunks.
-            output_filename (str): the JSON file where to save the files. Must be json.
+            chunks (Iterable[Chunk]): the chunks.
+            output_filename (str): the JSON (or JSON lines) file where to save the files.
             remove_links (bool): Whether or not links should be remove from the chunk's text content.
         """
+        if output_filename.endswith((".jsonl", ".jsonl.gz")):
+            with JsonLinesWriter(output_filename) as writer:
+                writer.write_chunks(chunks, remove_links)
+            return
+
         directory = os.path.dirname(os.path.abspath(output_filename))
         if not os.path.exists(directory):
             os.makedirs(directory)
         content = [
-            {
-                "text": chunk.get_text(remove_links=remove_links),
-                "start_page": chunk.start_page,
-                "end_page": chunk.end_page,
-                "start_line": chunk.start_line,
-            }
-            for chunk in chunks
+            JsonLinesWriter.chunk_to_record(chunk, remove_links) for chunk in chunks
         ]
         with open(output_filename, "w", encoding="utf8") as f:
             json.dump(content, f, ensure_ascii=False, indent=4)
@@ -1,6 +1,7 @@
 from typing import Any, Literal, Protocol, runtime_checkable
 
 from ..core.components import Chunk, MarkdownDoc, MarkdownLine, TocTree
+from ..core.instrumentation import annotate, trace
 from ..decorators.decorators import timeit, validate_args
 from .abstract_chunker import AbstractChunker
 
@@ -65,8 +66,10 @@ class MarkdownChunker(AbstractChunker):
         Returns:
             list[Chunk]: the chunks.
         """
-        toc_tree = self.get_toc_tree(content.content)
+        with trace("chunker.toc_tree"):
+            toc_tree = self.get_toc_tree(content.content)
         chunks = self.get_chunks(toc_tree)
+        annotate(chunk_count=len(chunks))
 
         return chunks
 
@@ -120,9 +123,11 @@ class MarkdownChunker(AbstractChunker):
         Returns:
             Chunks: the chunks text, formatted.
         """
-        chunks = self.build_chunks(toc_tree)
-        chunks = self.split_big_chunks_wordbased(chunks)
-        chunks = self.split_big_chunks_tokenbased(chunks)
+        with trace("chunker.split"):
+            chunks = self.build_chunks(toc_tree)
+            chunks = self.split_big_chunks_wordbased(chunks)
+        with trace("chunker.tokenize"):
+            chunks = self.split_big_chunks_tokenbased(chunks)
         chunks = self.remove_small_chunks(chunks)
 
         return chunks
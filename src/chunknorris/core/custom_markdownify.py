@@ -1,16 +1,16 @@
 import copy
-from io import StringIO
+import re
 from typing import Any
 
-import pandas as pd
 from bs4.element import Tag  # type: ignore : no stubs
 from markdownify import MarkdownConverter  # type: ignore : no stubs
 
-from .logger import LOGGER
-
 _STRUCTURAL_ATTRS = {"rowspan", "colspan"}
 _CONTENT_ATTRS = {"a": {"href", "title"}}
 
+_RE_WHITESPACE = re.compile(r"[\s\xa0]+")
+_RE_NUMBER = re.compile(r"^[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?$")
+
 
 def _has_merged_cells(el: Tag) -> bool:
     """Returns True if any cell in the table has a rowspan or colspan > 1."""
@@ -31,31 +31,132 @@ def _strip_attrs(el: Tag) -> Tag:
     return el_copy
 
 
+def _get_table_rows(el: Tag) -> tuple[list[Tag], list[Tag], list[Tag]]:
+    """Splits the rows of a table into its (header, body, footer) sections.
+    Rows of nested tables are ignored. Rows that are direct children of
+    the <table> element are considered part of the body.
+
+    Returns:
+        tuple[list[Tag], list[Tag], list[Tag]]: the <tr> elements of the
+            thead, tbody and tfoot sections, in document order.
+    """
+    head: list[Tag] = []
+    body: list[Tag] = []
+    foot: list[Tag] = []
+    for row in el.find_all("tr"):
+        if row.find_parent("table") is not el:
+            continue
+        if row.parent.name == "thead":
+            head.append(row)
+        elif row.parent.name == "tfoot":
+            foot.append(row)
+        else:
+            body.append(row)
+    return head, body, foot
+
+
+def _get_row_cells(row: Tag) -> list[Tag]:
+    """Returns the <td> and <th> cells of a row."""
+    return row.find_all(["td", "th"], recursive=False)
+
+
+def _get_cell_text(cell: Tag) -> str:
+    """Returns the whitespace-normalized text of a cell,
+    with pipes escaped so that they do not break the table."""
+    text = _RE_WHITESPACE.sub(" ", cell.get_text()).strip()
+    return text.replace("|", "\\|")
+
+
+def build_pipe_table(header: list[str], rows: list[list[str]]) -> str:
+    """Builds a compact markdown pipe-table from cell texts.
+    Rows shorter than the widest row are padded with empty cells.
+    Columns whose values are all numbers are right-aligned, others left-aligned.
+
+    Args:
+        header (list[str]): the text of the header cells.
+        rows (list[list[str]]): the text of the cells, row by row.
+
+    Returns:
+        str: the markdown table.
+    """
+    n_cols = max(len(row) for row in [header] + rows)
+    header = header + [""] * (n_cols - len(header))
+    separator = [
+        (
+            "---:"
+            if any(i < len(row) and row[i] for row in rows)
+            and all(_RE_NUMBER.match(row[i]) for row in rows if i < len(row) and row[i])
+            else ":---"
+        )
+        for i in range(n_cols)
+    ]
+    lines = [
+        "| " + " | ".join(header) + " |",
+        "|" + "|".join(separator) + "|",
+    ]
+    lines.extend(
+        "| " + " | ".join(row + [""] * (n_cols - len(row))) + " |" for row in rows
+    )
+
+    return "\n".join(lines)
+
+
+def _table_to_markdown(el: Tag) -> str:
+    """Renders a table without merged cells as a pipe-table, reading the cells
+    straight from the parsed tree.
+
+    The header is inferred the same way pandas.read_html() does it:
+    - rows in <thead> are the header;
+    - otherwise, the leading rows made only of <th> cells are the header;
+    - otherwise, the first row is used as header.
+    Multiple header rows are merged column-wise.
+
+    Args:
+        el (Tag): the <table> element.
+
+    Returns:
+        str: the markdown table. Empty string if the table has no rows.
+    """
+    head, body, foot = _get_table_rows(el)
+    if not head:
+        while body and all(cell.name == "th" for cell in _get_row_cells(body[0])):
+            head.append(body.pop(0))
+    rows = [[_get_cell_text(cell) for cell in _get_row_cells(row)] for row in body]
+    rows += [[_get_cell_text(cell) for cell in _get_row_cells(row)] for row in foot]
+    header_rows = [
+        [_get_cell_text(cell) for cell in _get_row_cells(row)] for row in head
+    ]
+    if not header_rows:
+        if not rows:
+            return ""
+        header_rows = [rows.pop(0)]
+
+    n_cols = max(len(row) for row in header_rows + rows)
+    header = [
+        " ".join(
+            dict.fromkeys(row[i] for row in header_rows if i < len(row) and row[i])
+        )
+        for i in range(n_cols)
+    ]
+
+    return build_pipe_table(header, rows)
+
+
 class CustomMarkdownConverter(MarkdownConverter):
     """A custom MarkdownConverter that handles HTML tables.
 
     - Tables with merged cells (rowspan/colspan) are kept as raw HTML,
       since flattening merged cells can spread long cell values across many columns.
       Non-structural attributes (class, style, …) are stripped for token efficiency.
-    - Tables without merged cells are converted to pipe-table Markdown via pandas,
-      which is more token-efficient.
+    - Tables without merged cells are converted to pipe-table Markdown,
+      which is more token-efficient. Cells are read directly from the BS4 tree.
 
-    In both cases, convert_table uses str(el) to access the original BS4 element
-    directly — markdownify never mutates elements in place, so no No-Op overrides
+    In both cases, convert_table uses the original BS4 element directly —
+    markdownify never mutates elements in place, so no No-Op overrides
     on td/tr/th are needed.
     """
 
     def convert_table(self, el: Tag, text: str, parent_tags: Any) -> str:
         if _has_merged_cells(el):
             return "\n\n" + str(_strip_attrs(el)) + "\n\n"
-        try:
-            df = pd.read_html(StringIO(str(el)), displayed_only=False)[0]  # type: ignore : missing typing in pandas
-            df = df.fillna("")  # type: ignore : missing typing in pandas
-            # if no table header -> set first row as header
-            if all(df.columns == list(range(len(df.columns)))):
-                df.columns = df.iloc[0]
-                df = df.iloc[1:]
-            return "\n\n" + df.to_markdown(index=False) + "\n\n"
-        except Exception as e:
-            LOGGER.warning("Error converting table: %s", e)
-            return "\n\n"
+        return "\n\n" + _table_to_markdown(el) + "\n\n"
@@ -0,0 +1,477 @@
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from types import TracebackType
+from typing import Any, Callable, TypeVar
+
+ResultT = TypeVar("ResultT")
+
+# collector receiving the spans. None means instrumentation is disabled.
+_COLLECTOR: "AbstractCollector | None" = None
+
+# innermost span being recorded, used for labels inheritance and annotate()
+_CURRENT_SPAN: "ContextVar[Span | None]" = ContextVar(
+    "chunknorris_current_span", default=None
+)
+
+# attributes summed by the aggregating collectors
+COUNTED_ATTRIBUTES = ("page_count", "span_count", "chunk_count", "skipped_page_count")
+
+try:
+    _PAGE_SIZE = os.sysconf("SC_PAGE_SIZE")
+except (AttributeError, ValueError, OSError):
+    _PAGE_SIZE = 4096
+
+
+@dataclass
+class SpanRecord:
+    """A finished span, as received by the collectors."""
+
+    name: str
+    start_time: float  # seconds since the epoch
+    duration: float  # seconds
+    rss: int | None  # resident memory at the end of the span, in bytes
+    labels: dict[str, str] = field(default_factory=dict)
+    attributes: dict[str, Any] = field(default_factory=dict)
+    parent: str | None = None
+
+
+class AbstractCollector(ABC):
+    """Receives the spans emitted by the pipeline stages.
+    Activate a collector with set_collector().
+    """
+
+    record_rss: bool = True
+
+    @abstractmethod
+    def record(self, span: SpanRecord) -> None:
+        """Records a finished span. Might be called from several threads.
+
+        Args:
+            span (SpanRecord): the span.
+        """
+
+    def flush(self) -> None:
+        """Exports what has been recorded, if relevant."""
+
+
+@dataclass
+class SpanStats:
+    """Aggregated statistics of the spans of the same name and labels."""
+
+    count: int = 0
+    total_duration: float = 0.0
+    max_duration: float = 0.0
+    max_rss: int = 0
+    counts: dict[str, int] = field(default_factory=dict)
+
+
+class InMemoryCollector(AbstractCollector):
+    """Aggregates the spans in memory, by name and labels.
+    Use summary() to get the aggregated statistics.
+    """
+
+    def __init__(self, record_rss: bool = True) -> None:
+        """Initializes an in-memory collector.
+
+        Args:
+            record_rss (bool, optional): whether or not to read the resident memory
+                at the end of each span. Defaults to True.
+        """
+        self.record_rss = record_rss
+        self.stats: dict[tuple[str, tuple[tuple[str, str], ...]], SpanStats] = {}
+        self._lock = threading.Lock()
+
+    def record(self, span: SpanRecord) -> None:
+        key = (span.name, tuple(sorted(span.labels.items())))
+        with self._lock:
+            stats = self.stats.get(key)
+            if stats is None:
+                stats = self.stats[key] = SpanStats()
+            stats.count += 1
+            stats.total_duration += span.duration
+            stats.max_duration = max(stats.max_duration, span.duration)
+            if span.rss is not None:
+                stats.max_rss = max(stats.max_rss, span.rss)
+            for attribute in COUNTED_ATTRIBUTES:
+                if isinstance(value := span.attributes.get(attribute), int):
+                    stats.counts[attribute] = stats.counts.get(attribute, 0) + value
+
+    def summary(self) -> list[dict[str, Any]]:
+        """Gets the aggregated statistics, the most time consuming stages first.
+
+        Returns:
+            list[dict[str, Any]]: one entry per span name and labels, such as
+                {"name": "pdf.ocr", "labels": {...}, "count": 3, "total_duration": 1.2, ...}.
+        """
+        with self._lock:
+            entries = [
+                {
+                    "name": name,
+                    "labels": dict(labels),
+                    "count": stats.count,
+                    "total_duration": stats.total_duration,
+                    "max_duration": stats.max_duration,
+                    "max_rss": stats.max_rss,
+                }
+                | stats.counts
+                for (name, labels), stats in self.stats.items()
+            ]
+        entries.sort(key=lambda entry: entry["total_duration"], reverse=True)
+
+        return entries
+
+    def reset(self) -> None:
+        """Clears the aggregated statistics."""
+        with self._lock:
+            self.stats.clear()
+
+
+class PrometheusTextFileCollector(InMemoryCollector):
+    """Aggregates the spans in memory and writes them to a file using the
+    Prometheus text exposition format, to be picked up by the node exporter's textfile collector.
+    The file is written by flush().
+    """
+
+    def __init__(
+        self, filepath: str, prefix: str = "chunknorris", record_rss: bool = True
+    ) -> None:
+        """Initializes a Prometheus text file collector.
+
+        Args:
+            filepath (str): the path to the .prom file to write.
+            prefix (str, optional): the prefix of the metric names. Defaults to "chunknorris".
+            record_rss (bool, optional): whether or not to read the resident memory
+                at the end of each span. Defaults to True.
+        """
+        super().__init__(record_rss)
+        self.filepath = filepath
+        self.prefix = prefix
+
+    def flush(self) -> None:
+        """Writes the metrics file. The file is replaced atomically
+        so that it is never read half written.
+        """
+        tmp_filepath = f"{self.filepath}.{os.getpid()}.tmp"
+        with open(tmp_filepath, "w", encoding="utf8") as file:
+            file.write(self.to_text())
+        os.replace(tmp_filepath, self.filepath)
+
+    def to_text(self) -> str:
+        """Gets the metrics in the Prometheus text exposition format.
+
+        Returns:
+            str: the metrics.
+        """
+        metrics: list[tuple[str, str, str, str]] = [
+            ("stage_calls_total", "counter", "Number of runs of the stage.", "count"),
+            (
+                "stage_duration_seconds_total",
+                "counter",
+                "Total duration of the stage.",
+                "total_duration",
+            ),
+            (
+                "stage_duration_seconds_max",
+                "gauge",
+                "Longest run of the stage.",
+                "max_duration",
+            ),
+            (
+                "stage_rss_bytes_max",
+                "gauge",
+                "Highest resident memory at the end of the stage.",
+                "max_rss",
+            ),
+        ] + [
+            (
+                f"stage_{attribute}_total",
+                "counter",
+                f"Sum of the {attribute} of the stage.",
+                attribute,
+            )
+            for attribute in COUNTED_ATTRIBUTES
+        ]
+        entries = self.summary()
+        lines: list[str] = []
+        for metric, metric_type, description, key in metrics:
+            samples = [entry for entry in entries if key in entry]
+            if not samples:
+                continue
+            metric_name = f"{self.prefix}_{metric}"
+            lines.append(f"# HELP {metric_name} {description}")
+            lines.append(f"# TYPE {metric_name} {metric_type}")
+            for entry in samples:
+                labels = {"stage": entry["name"]} | entry["labels"]
+                labels_text = ",".join(
+                    f'{name}="{_escape_label_value(str(value))}"'
+                    for name, value in labels.items()
+                )
+                lines.append(f"{metric_name}{{{labels_text}}} {entry[key]}")
+
+        return "\n".join(lines) + "\n"
+
+
+class OpenTelemetryCollector(AbstractCollector):
+    """Forwards the spans to OpenTelemetry, so that they are exported
+    by the configured OpenTelemetry SDK (OTLP, Jaeger, console...).
+    Requires the opentelemetry-api package.
+    """
+
+    def __init__(self, tracer: Any = None, record_rss: bool = True) -> None:
+        """Initializes an OpenTelemetry collector.
+
+        Args:
+            tracer (Any, optional): the opentelemetry tracer to use.
+                If None, uses the tracer of the global tracer provider. Defaults to None.
+            record_rss (bool, optional): whether or not to read the resident memory
+                at the end of each span. Defaults to True.
+        """
+        if tracer is None:
+            try:
+                # pylint: disable=import-outside-toplevel
+                from opentelemetry import trace as otel_trace  # type: ignore
+            except ImportError as e:
+                raise ImportError(
+                    "OpenTelemetryCollector requires opentelemetry. Install it with : pip install opentelemetry-api"
+                ) from e
+            tracer = otel_trace.get_tracer("chunknorris")
+        self.tracer = tracer
+        self.record_rss = record_rss
+
+    def record(self, span: SpanRecord) -> None:
+        attributes = {
+            key: value
+            for key, value in (span.labels | span.attributes).items()
+            if isinstance(value, (str, bool, int, float))
+        }
+        if span.rss is not None:
+            attributes["process.memory.rss"] = span.rss
+        if span.parent is not None:
+            attributes["chunknorris.parent"] = span.parent
+        start_time = int(span.start_time * 1e9)
+        otel_span = self.tracer.start_span(
+            span.name, start_time=start_time, attributes=attributes
+        )
+        otel_span.end(end_time=start_time + int(span.duration * 1e9))
+
+
+class _ListCollector(AbstractCollector):
+    """Keeps the spans in a list, to be sent to another process."""
+
+    def __init__(self, record_rss: bool) -> None:
+        self.record_rss = record_rss
+        self.spans: list[SpanRecord] = []
+
+    def record(self, span: SpanRecord) -> None:
+        self.spans.append(span)
+
+
+class Span:
+    """A stage being recorded. Use trace() to create it."""
+
+    __slots__ = (
+        "name",
+        "labels",
+        "attributes",
+        "_collector",
+        "_parent",
+        "_token",
+        "_start_time",
+        "_start",
+    )
+
+    def __init__(
+        self,
+        collector: AbstractCollector,
+        name: str,
+        labels: dict[str, str] | None,
+        attributes: dict[str, Any],
+    ) -> None:
+        self.name = name
+        self.labels = labels or {}
+        self.attributes = attributes
+        self._collector = collector
+        self._parent: Span | None = None
+
+    def set(self, **attributes: Any) -> None:
+        """Sets attributes of the span, such as page_count=12."""
+        self.attributes.update(attributes)
+
+    def __enter__(self) -> "Span":
+        self._parent = _CURRENT_SPAN.get()
+        if self._parent is not None:
+            self.labels = self._parent.labels | self.labels
+        self._token = _CURRENT_SPAN.set(self)
+        self._start_time = time.time()
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        duration = time.perf_counter() - self._start
+        _CURRENT_SPAN.reset(self._token)
+        if exc_type is not None:
+            self.attributes["error"] = exc_type.__name__
+        self._collector.record(
+            SpanRecord(
+                name=self.name,
+                start_time=self._start_time,
+                duration=duration,
+                rss=_get_rss() if self._collector.record_rss else None,
+                labels=self.labels,
+                attributes=self.attributes,
+                parent=self._parent.name if self._parent is not None else None,
+            )
+        )
+
+
+class _NoopSpan:
+    """Span returned by trace() when instrumentation is disabled."""
+
+    __slots__ = ()
+
+    def set(self, **attributes: Any) -> None:
+        pass
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        pass
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+def set_collector(collector: AbstractCollector | None) -> None:
+    """Sets the collector receiving the spans of all the pipeline stages.
+    Instrumentation is disabled by default, and costs almost nothing while disabled.
+
+    Args:
+        collector (AbstractCollector | None): the collector, such as InMemoryCollector().
+            None to disable instrumentation.
+    """
+    global _COLLECTOR  # pylint: disable=global-statement
+    _COLLECTOR = collector
+
+
+def get_collector() -> AbstractCollector | None:
+    """Gets the collector receiving the spans, or None if instrumentation is disabled."""
+    return _COLLECTOR
+
+
+def trace(
+    name: str, labels: dict[str, str] | None = None, **attributes: Any
+) -> Span | _NoopSpan:
+    """Records the duration of a stage, to be used as a context manager:
+    ```
+    with trace("pdf.ocr", page_count=1) as span:
+        ...
+        span.set(span_count=len(spans))
+    ```
+
+    Args:
+        name (str): the name of the stage.
+        labels (dict[str, str] | None, optional): labels of the span, such as {"file_type": ".pdf"}.
+            They are inherited by the nested spans, and the spans are aggregated by name and labels.
+            Defaults to None.
+        **attributes (Any): attributes of the span, such as page_count.
+
+    Returns:
+        Span | _NoopSpan: the span. A no-op span if instrumentation is disabled.
+    """
+    collector = _COLLECTOR
+    if collector is None:
+        return _NOOP_SPAN
+    return Span(collector, name, labels, attributes)
+
+
+def get_worker_options() -> bool | None:
+    """Gets how the spans of a worker process must be recorded, to be passed
+    to call_recording_spans() : None if instrumentation is disabled,
+    else the record_rss option of the collector.
+    """
+    collector = _COLLECTOR
+    return None if collector is None else collector.record_rss
+
+
+def call_recording_spans(
+    options: bool | None, function: Callable[..., ResultT], *args: Any
+) -> tuple[ResultT, list[SpanRecord]]:
+    """Calls a function and records the spans it emits, so that they can be sent
+    to the collector of another process with replay_spans(). Collectors are per process :
+    meant to run the tasks of worker processes.
+
+    Args:
+        options (bool | None): how to record the spans, obtained with get_worker_options()
+            in the process that submitted the task. If None, no span is recorded.
+        function (Callable[..., ResultT]): the function to call.
+        *args (Any): the arguments of the function.
+
+    Returns:
+        tuple[ResultT, list[SpanRecord]]: the result of the function, and the spans it emitted.
+    """
+    if options is None:
+        return function(*args), []
+    global _COLLECTOR  # pylint: disable=global-statement
+    previous_collector = _COLLECTOR
+    collector = _ListCollector(record_rss=options)
+    _COLLECTOR = collector
+    try:
+        result = function(*args)
+    finally:
+        _COLLECTOR = previous_collector
+
+    return result, collector.spans
+
+
+def replay_spans(spans: list[SpanRecord]) -> None:
+    """Sends spans recorded in another process with call_recording_spans()
+    to the collector, if instrumentation is enabled.
+
+    Args:
+        spans (list[SpanRecord]): the spans.
+    """
+    collector = _COLLECTOR
+    if collector is None:
+        return
+    for span in spans:
+        collector.record(span)
+
+
+def annotate(**attributes: Any) -> None:
+    """Sets attributes of the innermost span being recorded, if any.
+    Useful to add counts to a span opened by a caller.
+    """
+    if _COLLECTOR is None:
+        return
+    span = _CURRENT_SPAN.get()
+    if span is not None:
+        span.set(**attributes)
+
+
+def _get_rss() -> int | None:
+    """Gets the resident memory of the current process, in bytes."""
+    try:
+        with open("/proc/self/statm", "rb") as file:
+            return int(file.read().split()[1]) * _PAGE_SIZE
+    except OSError:
+        pass
+    try:
+        import psutil  # pylint: disable=import-outside-toplevel
+
+        return psutil.Process().memory_info().rss
+    except ImportError:
+        return None
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
@@ -0,0 +1,134 @@
+import gzip
+import io
+import json
+import os
+from types import TracebackType
+from typing import IO, Any, Iterable
+
+from .components import Chunk
+
+try:
+    import orjson  # type: ignore : optional dependency
+except ImportError:
+    orjson = None
+
+
+class JsonLinesWriter:
+    """Writes records to a JSON lines file, one record at a time,
+    so that output starts immediately and memory stays flat however many records are written.
+    Files ending with ".gz" are gzip-compressed.
+
+    Use it as a context manager:
+    ```
+    with JsonLinesWriter("chunks.jsonl.gz") as writer:
+        writer.write_chunks(chunks)
+    ```
+    """
+
+    def __init__(
+        self,
+        filepath: str,
+        compress: bool | None = None,
+        use_orjson: bool = True,
+        buffer_size: int = 1 << 20,
+    ) -> None:
+        """Initializes a JSON lines writer.
+
+        Args:
+            filepath (str): the path to the output file.
+            compress (bool | None, optional): whether or not to gzip the output.
+                If None, the output is compressed if the filepath ends with ".gz". Defaults to None.
+            use_orjson (bool, optional): whether or not to serialize with orjson, if installed.
+                Faster than the json module. Defaults to True.
+            buffer_size (int, optional): size of the write buffer, in bytes. Defaults to 1MB.
+        """
+        self.filepath = filepath
+        self.compress = filepath.endswith(".gz") if compress is None else compress
+        self.use_orjson = use_orjson and orjson is not None
+        self.buffer_size = buffer_size
+        self.n_records = 0
+        self._file: IO[bytes] | None = None
+
+    def __enter__(self) -> "JsonLinesWriter":
+        self.open()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def open(self) -> None:
+        """Opens the output file, creating its directory if needed."""
+        directory = os.path.dirname(os.path.abspath(self.filepath))
+        os.makedirs(directory, exist_ok=True)
+        if self.compress:
+            # buffer before compressing, so that zlib works on big blocks
+            self._file = io.BufferedWriter(
+                gzip.GzipFile(self.filepath, mode="wb"), self.buffer_size  # type: ignore : GzipFile is a raw binary stream
+            )
+        else:
+            # the file stays open between calls to write(), close() closes it
+            self._file = open(  # pylint: disable=consider-using-with
+                self.filepath, "wb", buffering=self.buffer_size
+            )
+
+    def close(self) -> None:
+        """Flushes and closes the output file."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def write(self, record: dict[str, Any]) -> None:
+        """Writes a record as a JSON line.
+
+        Args:
+            record (dict[str, Any]): the record. Must be JSON serializable.
+        """
+        if self._file is None:
+            raise RuntimeError(
+                "JsonLinesWriter is not open. Use it as a context manager."
+            )
+        if self.use_orjson:
+            self._file.write(orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE))  # type: ignore : optional dependency
+        else:
+            self._file.write(
+                (json.dumps(record, ensure_ascii=False) + "\n").encode("utf8")
+            )
+        self.n_records += 1
+
+    def write_chunks(
+        self, chunks: Iterable[Chunk], remove_links: bool = False, **metadata: Any
+    ) -> None:
+        """Writes chunks, one JSON line per chunk.
+
+        Args:
+            chunks (Iterable[Chunk]): the chunks.
+            remove_links (bool, optional): Whether or not links should be remove from the chunk's text content.
+                Defaults to False.
+            **metadata (Any): additional fields to write with each chunk, such as the source file.
+        """
+        for chunk in chunks:
+            self.write(metadata | JsonLinesWriter.chunk_to_record(chunk, remove_links))
+
+    @staticmethod
+    def chunk_to_record(chunk: Chunk, remove_links: bool = False) -> dict[str, Any]:
+        """Gets the record of a chunk, as saved by the chunkers.
+
+        Args:
+            chunk (Chunk): the chunk.
+            remove_links (bool, optional): Whether or not links should be remove from the chunk's text content.
+                Defaults to False.
+
+        Returns:
+            dict[str, Any]: the record.
+        """
+        return {
+            "text": chunk.get_text(remove_links=remove_links),
+            "start_page": chunk.start_page,
+            "end_page": chunk.end_page,
+            "start_line": chunk.start_line,
+        }
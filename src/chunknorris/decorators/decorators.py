@@ -7,17 +7,33 @@ from functools import wraps
 from inspect import signature
 from typing import Any, Callable, Generator
 
-import psutil
-
+from ..core.instrumentation import trace  # pylint: disable=E0402
 from ..core.logger import LOGGER  # pylint: disable=E0402
 
 MEMORY_WARNING_LIMIT = 800
 
+_validate_args_enabled: bool = True
+
+
+def set_args_validation(enabled: bool) -> None:
+    """Enables or disables the type checks of the functions decorated with @validate_args,
+    for the entire library. Disabling them removes their overhead in production.
+    They can also be disabled before import by setting the environment variable
+    CHUNKNORRIS_VALIDATE_ARGS=0, in which case the functions are not even wrapped.
+
+    Args:
+        enabled (bool): whether or not arguments should be validated.
+    """
+    global _validate_args_enabled  # pylint: disable=global-statement
+    _validate_args_enabled = enabled
+
 
 def validate_args(function: Callable[..., Any]) -> Any:
     """Meant to be used as a decorator : @validate_args.
     Checks that the types of arguments passed to a function
     matches the typing provided.
+    The annotations to check are computed once, when the function is decorated.
+    Checks can be turned off globally with set_args_validation(False).
 
     Note : pydantic proposes a similar decorator : @validate_call.
     HOWEVER, this causes an error when applied to __ini__() functions.
@@ -28,18 +44,30 @@ def validate_args(function: Callable[..., Any]) -> Any:
     Returns:
         Any: the return of the function.
     """
+    if os.environ.get("CHUNKNORRIS_VALIDATE_ARGS", "1") == "0":
+        return function
+
+    # (position, name, expected type, type name) of the annotated parameters
+    checks = [
+        (
+            position,
+            name,
+            param.annotation,
+            getattr(param.annotation, "__name__", str(param.annotation)),
+        )
+        for position, (name, param) in enumerate(signature(function).parameters.items())
+        if param.annotation is not param.empty
+    ]
 
     @wraps(function)
     def wrapper(*args: tuple[Any], **kwargs: dict[Any, Any]) -> Any:
-        sig = signature(function)
-        for arg_name, arg_value in zip(sig.parameters, args):
-            if (
-                sig.parameters[arg_name].annotation
-                is not sig.parameters[arg_name].empty
-            ):
-                if not isinstance(arg_value, sig.parameters[arg_name].annotation):
+        if _validate_args_enabled:
+            for position, arg_name, annotation, type_name in checks:
+                if position >= len(args):
+                    break
+                if not isinstance(args[position], annotation):
                     raise ValueError(
-                        f"Argument '{arg_name}' must be of type {sig.parameters[arg_name].annotation.__name__}."
+                        f"Argument '{arg_name}' must be of type {type_name}."
                     )
         result = function(*args, **kwargs)
 
@@ -51,7 +79,7 @@ def validate_args(function: Callable[..., Any]) -> Any:
 @contextmanager
 def mem_debug(label: str, sample_interval: float = 0.05) -> Generator[None, None, None]:
     """Context manager that logs memory usage and duration at DEBUG level.
-    Completely skipped (no psutil call, no thread) when log level is above DEBUG.
+    Completely skipped (no psutil import, no thread) when log level is above DEBUG.
 
     Tracks both peak RSS (via a background sampler) and net RSS change, since
     memory freed inside the block would otherwise make the peak invisible.
@@ -64,6 +92,8 @@ def mem_debug(label: str, sample_interval: float = 0.05) -> Generator[None, None
         yield
         return
 
+    import psutil  # pylint: disable=import-outside-toplevel # only needed for debugging
+
     proc = psutil.Process(os.getpid())
     mem_before = proc.memory_info().rss
     peak_rss: list[int] = [mem_before]
@@ -102,6 +132,7 @@ def mem_debug(label: str, sample_interval: float = 0.05) -> Generator[None, None
 def timeit(function: Callable[..., Any]) -> Any:
     """Meant to be used as a decorator using @timeit
     in order to measure the execution time of a function.
+    The call is also recorded as a span if an instrumentation collector is set.
 
     Args:
         function (Callable[..., Any]): the function to measure exec time for.
@@ -113,7 +144,8 @@ def timeit(function: Callable[..., Any]) -> Any:
     @wraps(function)
     def wrapper(*args: tuple[Any], **kwargs: dict[Any, Any]) -> Any:
         start_time = time.perf_counter()
-        result = function(*args, **kwargs)
+        with trace(function.__qualname__):
+            result = function(*args, **kwargs)
         end_time = time.perf_counter()
         total_time = end_time - start_time
         LOGGER.info('Function "%s" took %.4f seconds', function.__name__, total_time)
@@ -1,3 +1,6 @@
+import hashlib
+import json
+import os
 from abc import ABC, abstractmethod
 from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Literal
@@ -32,12 +35,31 @@ class _BasePDFPageClassifier(ABC):  # type: ignore[reportUnusedClass]
             config.get("image_required_classes", [])
         )
         self._precision: str = ""
+        self._weights_digest: str = ""
+        # preprocessing threads, kept across predict() calls
+        self._executor: ThreadPoolExecutor | None = None
+        self._executor_workers: int = 0
 
     @property
     @abstractmethod
     def backend(self) -> Literal["onnx", "openvino"]:
         """Backend used for inference."""
 
+    @property
+    def image_size(self) -> int:
+        """Side, in pixels, of the square images fed to the model."""
+        return self._image_size
+
+    @property
+    def threshold(self) -> float:
+        """Default probability cutoff for a positive prediction."""
+        return self._threshold
+
+    @property
+    def center_crop(self) -> bool:
+        """Whether images are center-cropped to a square before being resized."""
+        return self._center_crop
+
     @property
     def friendly_name(self) -> str:
         return "PDF pages classifier"
@@ -52,6 +74,34 @@ class _BasePDFPageClassifier(ABC):  # type: ignore[reportUnusedClass]
         """Human-readable variant string, e.g. ``'onnx/int8'`` or ``'openvino/fp32'``."""
         return f"{self.friendly_name}, {self.backend}/{self.precision}"
 
+    @property
+    def weights_digest(self) -> str:
+        """Digest of the model files and of the deployment config, which changes
+        whenever the weights are updated. Empty if the model was not loaded from files.
+        """
+        return self._weights_digest
+
+    @staticmethod
+    def _get_weights_digest(model_paths: list[str], config: dict[str, Any]) -> str:
+        """Hash the model files and the deployment config.
+
+        Args:
+            model_paths: Paths to the files of the model. Missing files are skipped.
+            config: Deployment config dict.
+
+        Returns:
+            The digest, as an hexadecimal string.
+        """
+        digest = hashlib.blake2b(digest_size=20)
+        digest.update(json.dumps(config, sort_keys=True).encode())
+        for model_path in model_paths:
+            if not os.path.isfile(model_path):
+                continue
+            with open(model_path, "rb") as file:
+                while chunk := file.read(1 << 20):
+                    digest.update(chunk)
+        return digest.hexdigest()
+
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(variant={self.variant!r})"
 
@@ -114,6 +164,25 @@ class _BasePDFPageClassifier(ABC):  # type: ignore[reportUnusedClass]
 
         return arr
 
+    def _get_executor(self, num_workers: int) -> ThreadPoolExecutor:
+        """Get the thread pool used for preprocessing, created on first use
+        and reused by the next calls as long as ``num_workers`` does not change.
+
+        Args:
+            num_workers: Number of threads of the pool.
+
+        Returns:
+            The thread pool.
+        """
+        if self._executor is None or self._executor_workers != num_workers:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+            self._executor = ThreadPoolExecutor(
+                max_workers=num_workers, thread_name_prefix="chunknorris-preprocess"
+            )
+            self._executor_workers = num_workers
+        return self._executor
+
     def _normalize_batch(
         self, arrays: list[npt.NDArray[np.float32]]
     ) -> npt.NDArray[np.float32]:
@@ -159,6 +228,48 @@ class _BasePDFPageClassifier(ABC):  # type: ignore[reportUnusedClass]
             },
         )
 
+    def pixels_to_input(
+        self, pixels: npt.NDArray[np.uint8], out: npt.NDArray[np.float32]
+    ) -> None:
+        """Normalize an already cropped and resized RGB image into a slot of a
+        preallocated batch, without intermediate full-size copies.
+        Equivalent to ``_pil_to_array`` followed by ``_normalize_batch``.
+
+        Args:
+            pixels: uint8 array of shape (image_size, image_size, 3), such as
+                a view on a pymupdf.Pixmap's samples.
+            out: Float32 array of shape (3, image_size, image_size) to write to.
+        """
+        # (x / 255 - mean) / std == x * scale + offset
+        scale = (1.0 / (255.0 * self._std))[:, None, None]
+        offset = (-self._mean / self._std)[:, None, None]
+        np.multiply(pixels.transpose(2, 0, 1), scale, out=out)
+        out += offset
+        if self._whiteout:
+            out[:, : self._whiteout_cutoff] = (
+                1.0 - self._mean[:, None, None]
+            ) / self._std[:, None, None]
+
+    def predict_input(
+        self,
+        batch_input: npt.NDArray[np.float32],
+        threshold: float | None = None,
+    ) -> list[PdfPagePrediction]:
+        """Classify a batch that is already preprocessed, for instance with
+        ``pixels_to_input``.
+
+        Args:
+            batch_input: Float32 array of shape (N, 3, image_size, image_size).
+            threshold: Override the default probability threshold from config.
+
+        Returns:
+            One ``PdfPagePrediction`` per image of the batch.
+        """
+        effective_threshold = self._threshold if threshold is None else threshold
+        with mem_debug("classifying pages"):
+            probs_batch: npt.NDArray[np.float32] = self._run_batch(batch_input)
+        return [self._format(probs, effective_threshold) for probs in probs_batch]
+
     def predict(
         self,
         images: str | Image.Image | list[Any],
@@ -176,7 +287,8 @@ class _BasePDFPageClassifier(ABC):  # type: ignore[reportUnusedClass]
                 classifier instance.
             batch_size: Number of images to process per inference call.
             num_workers: Number of threads for parallel image loading and
-                preprocessing. Set to 1 to disable threading.
+                preprocessing. The threads are kept for the next calls.
+                Set to 1 to disable threading.
 
         Returns:
             A single ``PdfPagePrediction`` when ``images`` is not a list, or a
@@ -189,28 +301,26 @@ class _BasePDFPageClassifier(ABC):  # type: ignore[reportUnusedClass]
 
         all_results: list[PdfPagePrediction] = []
 
+        map_fn = map if num_workers <= 1 else self._get_executor(num_workers).map
+
         with mem_debug("classifying pages"):
-            with ThreadPoolExecutor(max_workers=num_workers) as executor:
-                for batch_start in range(0, len(image_list), batch_size):
-                    batch_items = image_list[batch_start : batch_start + batch_size]
-
-                    # Load (file I/O + RGB conversion) in parallel, then free after use.
-                    loaded: list[Image.Image] = list(
-                        executor.map(self._load_image, batch_items)
-                    )
-                    # PIL transforms (crop + bicubic resize) in parallel.
-                    arrays: list[npt.NDArray[np.float32]] = list(
-                        executor.map(self._pil_to_array, loaded)
-                    )
-
-                    # Vectorised normalization + transpose, then inference.
-                    batch_input = self._normalize_batch(arrays)  # (N, C, H, W)
-                    probs_batch: npt.NDArray[np.float32] = self._run_batch(batch_input)
-
-                    all_results.extend(
-                        self._format(probs, effective_threshold)
-                        for probs in probs_batch
-                    )
+            for batch_start in range(0, len(image_list), batch_size):
+                batch_items = image_list[batch_start : batch_start + batch_size]
+
+                # Load (file I/O + RGB conversion) in parallel, then free after use.
+                loaded: list[Image.Image] = list(map_fn(self._load_image, batch_items))
+                # PIL transforms (crop + bicubic resize) in parallel.
+                arrays: list[npt.NDArray[np.float32]] = list(
+                    map_fn(self._pil_to_array, loaded)
+                )
+
+                # Vectorised normalization + transpose, then inference.
+                batch_input = self._normalize_batch(arrays)  # (N, C, H, W)
+                probs_batch: npt.NDArray[np.float32] = self._run_batch(batch_input)
+
+                all_results.extend(
+                    self._format(probs, effective_threshold) for probs in probs_batch
+                )
 
             return all_results[0] if is_single else all_results
 
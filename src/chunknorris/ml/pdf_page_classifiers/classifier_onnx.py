@@ -47,6 +47,7 @@ class PDFPageClassifierONNX(_BasePDFPageClassifier):
         super().__init__(config)
         self._session = ort.InferenceSession(model_path)  # type: ignore[unknownMemberType]
         self._input_name: str = self._session.get_inputs()[0].name  # type: ignore[unknownMemberType]
+        self._weights_digest = self._get_weights_digest([model_path], config)
 
     @property
     def backend(self) -> Literal["onnx"]:
@@ -57,6 +57,10 @@ class PDFPageClassifierOV(_BasePDFPageClassifier):
         self._session: CompiledModel = compiled
         self._input_name: str = compiled.input(0).get_any_name()  # type: ignore
         self._output = compiled.output(0)  # type: ignore
+        # the weights of an IR model are in the .bin file next to the .xml
+        self._weights_digest = self._get_weights_digest(
+            [model_path, str(Path(model_path).with_suffix(".bin"))], config
+        )
 
     @property
     def backend(self) -> Literal["openvino"]:
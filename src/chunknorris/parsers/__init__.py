@@ -1,9 +1,42 @@
+# Parsers are imported lazily : importing one parser
+# must not pull the heavy dependencies of the others (pymupdf, pandas, mammoth...)
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from .abstract_parser import AbstractParser, AnyParser
-from .docx.docx_parser import DocxParser
-from .html.html_parser import HTMLParser
-from .json.wikit_parser import WikitJsonParser
-from .markdown.markdown_parser import MarkdownParser
-from .notebook.jupyter_notebook_parser import JupyterNotebookParser
-from .pdf.pdf_parser import PdfParser
-from .sheets.csv_parser import CSVParser
-from .sheets.excel_parser import ExcelParser
+
+if TYPE_CHECKING:
+    from .docx.docx_parser import DocxParser
+    from .html.html_parser import HTMLParser
+    from .json.wikit_parser import WikitJsonParser
+    from .markdown.markdown_parser import MarkdownParser
+    from .notebook.jupyter_notebook_parser import JupyterNotebookParser
+    from .pdf.pdf_parser import PdfParser
+    from .sheets.csv_parser import CSVParser
+    from .sheets.excel_parser import ExcelParser
+
+_LAZY_IMPORTS = {
+    "DocxParser": ".docx.docx_parser",
+    "HTMLParser": ".html.html_parser",
+    "WikitJsonParser": ".json.wikit_parser",
+    "MarkdownParser": ".markdown.markdown_parser",
+    "JupyterNotebookParser": ".notebook.jupyter_notebook_parser",
+    "PdfParser": ".pdf.pdf_parser",
+    "CSVParser": ".sheets.csv_parser",
+    "ExcelParser": ".sheets.excel_parser",
+}
+
+__all__ = ["AbstractParser", "AnyParser", *_LAZY_IMPORTS]
+
+
+# module __getattr__ and __dir__ are dunder names set by PEP 562
+def __getattr__(name: str) -> Any:  # pylint: disable=invalid-name
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_LAZY_IMPORTS[name], __name__), name)
+    globals()[name] = value  # cache, so that __getattr__ is called once per name
+    return value
+
+
+def __dir__() -> list[str]:  # pylint: disable=invalid-name
+    return sorted(__all__)
@@ -1,13 +1,36 @@
 import html
 from pathlib import Path
+from typing import Literal
 
 import mammoth  # type: ignore : No stub files
 
 from ...core.components import MarkdownDoc
 from ..html.html_parser import HTMLParser
+from .docx_xml_converter import DocxXmlConverter
+
+_VALID_ENGINES = ("mammoth", "xml")
 
 
 class DocxParser(HTMLParser):
+    """Parser for Word documents (.docx)."""
+
+    def __init__(self, engine: Literal["mammoth", "xml"] = "mammoth") -> None:
+        """Initializes a Docx parser.
+
+        Args:
+            engine (Literal["mammoth", "xml"], optional): How .docx files are converted.
+                - mammoth: the document is converted to HTML with mammoth,
+                  then to markdown with markdownify.
+                - xml: the document XML is streamed and converted to markdown directly.
+                  Faster and uses flat memory on large documents.
+                Defaults to "mammoth".
+        """
+        if engine not in _VALID_ENGINES:
+            raise ValueError(
+                f"Invalid value for argument 'engine': expected one of "
+                f"{list(_VALID_ENGINES)}. Got '{engine}'."
+            )
+        self.engine = engine
 
     def parse_string(self, string: str) -> MarkdownDoc:
         """Parses a HTML-formatted string.
@@ -26,16 +49,21 @@ class DocxParser(HTMLParser):
         return MarkdownDoc.from_string(formatted_string)
 
     def parse_file(self, filepath: str) -> MarkdownDoc:
-        """Reads and parses a markdown-formatted string.
+        """Reads and parses a .docx file.
         Ensures that the formatting is suited to be passed
         to the MarkdownChunker.
 
         Args:
-            filepath (FilePath): the path to a .html file
+            filepath (FilePath): the path to a .docx file
 
         Returns:
             MarkdownDoc: the parsed document. Can be fed to chunker.
         """
+        if self.engine == "xml":
+            if Path(filepath).suffix != ".docx":
+                raise ValueError("Only .docx files can be passed to DocxParser.")
+            return MarkdownDoc(content=list(DocxXmlConverter(filepath).iter_lines()))
+
         html_string = DocxParser.read_file(filepath)
 
         return self.parse_string(html_string)
@@ -0,0 +1,512 @@
+import html
+import re
+import xml.etree.ElementTree as ET
+import zipfile
+from collections import defaultdict
+from typing import IO, Iterator
+
+from ...core.components import MarkdownLine
+from ...core.custom_markdownify import build_pipe_table
+
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_R = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+_RELS = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+_MC = "{http://schemas.openxmlformats.org/markup-compatibility/2006}"
+
+_RE_HEADING_STYLE = re.compile(r"^heading ([1-6])$", re.IGNORECASE)
+_RE_WHITESPACE = re.compile(r"[ \t\xa0]+")
+# Wrappers whose content is part of the paragraph's text flow
+_RUN_CONTAINERS = {
+    f"{_W}ins",
+    f"{_W}smartTag",
+    f"{_W}sdt",
+    f"{_W}sdtContent",
+    f"{_W}fldSimple",
+    f"{_W}customXml",
+}
+_ORDERED_NUM_FORMATS = {
+    "decimal",
+    "decimalZero",
+    "lowerLetter",
+    "upperLetter",
+    "lowerRoman",
+    "upperRoman",
+}
+
+
+class DocxXmlConverter:
+    """Converts a .docx file to markdown lines by streaming the
+    word/document.xml part with an incremental XML parser,
+    instead of going through an intermediate HTML string.
+
+    Handles headings (styles named "heading N"), paragraphs with bold/italic
+    runs and hyperlinks, bullet and numbered lists, and tables. Tables with
+    merged cells are output as HTML (same as the HTML path), other tables as
+    markdown pipe-tables. The content of the text boxes anchored in a paragraph
+    is output before the paragraph. Images, footnotes and comments are ignored.
+
+    Only the top-level element being converted is held in memory: each
+    paragraph or table is released as soon as its markdown lines are emitted.
+    """
+
+    def __init__(self, file: str | IO[bytes]) -> None:
+        """Initializes the converter.
+
+        Args:
+            file (str | IO[bytes]): the path to a .docx file, or a binary file-like object.
+        """
+        self.file = file
+        self._heading_styles: dict[str, int] = {}
+        self._style_numbering: dict[str, tuple[str, int]] = {}
+        self._ordered_levels: dict[str, set[int]] = {}
+        self._list_keys: dict[str, str] = {}
+        self._restarting_num_ids: set[str] = set()
+        self._hyperlinks: dict[str, str] = {}
+        self._list_counters: defaultdict[str, dict[int, int]] = defaultdict(dict)
+        self._line_idx = 0
+
+    def iter_lines(self) -> Iterator[MarkdownLine]:
+        """Yields the markdown lines of the document, in reading order.
+
+        Yields:
+            MarkdownLine: the lines of the document. Blocks are separated by empty lines.
+        """
+        with zipfile.ZipFile(self.file) as archive:
+            self._read_styles(archive)
+            self._read_numbering(archive)
+            self._read_hyperlinks(archive)
+            with archive.open("word/document.xml") as document:
+                yield from self._iter_document_lines(document)
+
+    def _iter_document_lines(self, document: IO[bytes]) -> Iterator[MarkdownLine]:
+        """Streams the document part and yields the lines of each top-level
+        paragraph and table as soon as its closing tag is parsed.
+
+        Args:
+            document (IO[bytes]): the word/document.xml part.
+        """
+        ancestors: list[ET.Element] = []
+        open_blocks = 0  # number of <w:p> and <w:tbl> currently open
+        for event, elem in ET.iterparse(document, events=("start", "end")):
+            if event == "start":
+                ancestors.append(elem)
+                if elem.tag in (f"{_W}p", f"{_W}tbl"):
+                    open_blocks += 1
+                continue
+            ancestors.pop()
+            if elem.tag not in (f"{_W}p", f"{_W}tbl"):
+                continue
+            open_blocks -= 1
+            if open_blocks:
+                continue  # nested in a table or a text box, handled with its parent
+            for texts in self._convert_block(elem):
+                for text in texts:
+                    yield self._new_line(text)
+                yield self._new_line("")
+            # release the converted element to keep memory flat
+            ancestors[-1].remove(elem)
+
+    def _new_line(self, text: str) -> MarkdownLine:
+        line = MarkdownLine(text=text, line_idx=self._line_idx)
+        self._line_idx += 1
+        return line
+
+    def _read_styles(self, archive: zipfile.ZipFile) -> None:
+        """Maps the paragraph style ids to their heading level,
+        and to the numbering they define if any.
+        """
+        if "word/styles.xml" not in archive.namelist():
+            return
+        root = ET.fromstring(archive.read("word/styles.xml"))
+        for style in root.iter(f"{_W}style"):
+            style_id = style.get(f"{_W}styleId")
+            if style_id is None:
+                continue
+            name = style.find(f"{_W}name")
+            if name is not None:
+                match = _RE_HEADING_STYLE.match(name.get(f"{_W}val", ""))
+                if match:
+                    self._heading_styles[style_id] = int(match[1])
+            num_pr = style.find(f"{_W}pPr/{_W}numPr")
+            if num_pr is not None:
+                numbering = DocxXmlConverter._get_numbering(num_pr)
+                if numbering:
+                    self._style_numbering[style_id] = numbering
+
+    def _read_numbering(self, archive: zipfile.ZipFile) -> None:
+        """Maps each numbering id to the list levels that are ordered
+        (numbers, letters...) rather than bullets, and to the list it continues:
+        numbering ids sharing the same abstract numbering continue each other,
+        except those overriding the start value, which restart the list when first used.
+        """
+        if "word/numbering.xml" not in archive.namelist():
+            return
+        root = ET.fromstring(archive.read("word/numbering.xml"))
+        abstract_ordered_levels: dict[str, set[int]] = {}
+        for abstract_num in root.iter(f"{_W}abstractNum"):
+            abstract_ordered_levels[abstract_num.get(f"{_W}abstractNumId", "")] = {
+                int(lvl.get(f"{_W}ilvl", 0))
+                for lvl in abstract_num.iter(f"{_W}lvl")
+                if (num_fmt := lvl.find(f"{_W}numFmt")) is not None
+                and num_fmt.get(f"{_W}val") in _ORDERED_NUM_FORMATS
+            }
+        for num in root.iter(f"{_W}num"):
+            abstract_num_id = num.find(f"{_W}abstractNumId")
+            if abstract_num_id is None:
+                continue
+            num_id = num.get(f"{_W}numId", "")
+            abstract_id = abstract_num_id.get(f"{_W}val", "")
+            self._ordered_levels[num_id] = abstract_ordered_levels.get(
+                abstract_id, set()
+            )
+            self._list_keys[num_id] = abstract_id
+            if num.find(f"{_W}lvlOverride/{_W}startOverride") is not None:
+                self._restarting_num_ids.add(num_id)
+
+    def _read_hyperlinks(self, archive: zipfile.ZipFile) -> None:
+        """Maps the relationship ids of the document to the hyperlinks targets."""
+        if "word/_rels/document.xml.rels" not in archive.namelist():
+            return
+        root = ET.fromstring(archive.read("word/_rels/document.xml.rels"))
+        for rel in root.iter(f"{_RELS}Relationship"):
+            if rel.get("Type", "").endswith("/hyperlink"):
+                self._hyperlinks[rel.get("Id", "")] = rel.get("Target", "")
+
+    @staticmethod
+    def _get_numbering(num_pr: ET.Element) -> tuple[str, int] | None:
+        """Gets the (numbering id, list level) of a <w:numPr> element.
+        Returns None if the element disables numbering.
+        """
+        num_id = num_pr.find(f"{_W}numId")
+        if num_id is None or num_id.get(f"{_W}val", "0") == "0":
+            return None
+        ilvl = num_pr.find(f"{_W}ilvl")
+        level = int(ilvl.get(f"{_W}val", 0)) if ilvl is not None else 0
+        return num_id.get(f"{_W}val", ""), level
+
+    def _convert_block(self, block: ET.Element) -> Iterator[list[str]]:
+        """Converts a paragraph or a table to markdown. The blocks of the text boxes
+        anchored in a paragraph are converted before the paragraph itself.
+
+        Args:
+            block (ET.Element): the <w:p> or <w:tbl> element.
+
+        Yields:
+            list[str]: the markdown lines of each non-empty block.
+        """
+        if block.tag == f"{_W}tbl":
+            texts = self._convert_table(block)
+        else:
+            for text_box in DocxXmlConverter._find_text_boxes(block):
+                for child in DocxXmlConverter._iter_block_elements(text_box):
+                    yield from self._convert_block(child)
+            texts = self._convert_paragraph(block)
+        if texts:
+            yield texts
+
+    @staticmethod
+    def _find_text_boxes(element: ET.Element) -> Iterator[ET.Element]:
+        """Yields the <w:txbxContent> elements of the text boxes in an element.
+        Of alternate contents, only the first choice is read, or the fallback
+        if there is no choice, as they hold copies of the same text box.
+        """
+        for child in element:
+            if child.tag == f"{_W}txbxContent":
+                yield child
+            elif child.tag == f"{_MC}AlternateContent":
+                alternative = child.find(f"{_MC}Choice")
+                if alternative is None:
+                    alternative = child.find(f"{_MC}Fallback")
+                if alternative is not None:
+                    yield from DocxXmlConverter._find_text_boxes(alternative)
+            else:
+                yield from DocxXmlConverter._find_text_boxes(child)
+
+    @staticmethod
+    def _iter_block_elements(container: ET.Element) -> Iterator[ET.Element]:
+        """Yields the paragraphs and tables of a container such as a text box,
+        including those wrapped in content controls.
+        """
+        for child in container:
+            if child.tag in (f"{_W}p", f"{_W}tbl"):
+                yield child
+            elif child.tag in _RUN_CONTAINERS:
+                yield from DocxXmlConverter._iter_block_elements(child)
+
+    def _convert_paragraph(self, paragraph: ET.Element) -> list[str]:
+        """Converts a top-level paragraph to markdown.
+
+        Args:
+            paragraph (ET.Element): the <w:p> element.
+
+        Returns:
+            list[str]: the markdown lines of the paragraph. Empty if the paragraph has no text.
+        """
+        text = self._get_paragraph_text(paragraph)
+        if not text:
+            return []
+        style = paragraph.find(f"{_W}pPr/{_W}pStyle")
+        style_id = style.get(f"{_W}val", "") if style is not None else ""
+        if style_id in self._heading_styles:
+            return [
+                "#" * self._heading_styles[style_id] + " " + text.replace("\n", " ")
+            ]
+
+        num_pr = paragraph.find(f"{_W}pPr/{_W}numPr")
+        numbering = (
+            DocxXmlConverter._get_numbering(num_pr)
+            if num_pr is not None
+            else self._style_numbering.get(style_id)
+        )
+        if numbering is None:
+            return text.split("\n")
+        num_id, level = numbering
+        list_key = self._list_keys.get(num_id, num_id)
+        if num_id in self._restarting_num_ids:
+            self._restarting_num_ids.discard(num_id)
+            self._list_counters.pop(list_key, None)
+        counters = self._list_counters[list_key]
+        # a new item restarts the numbering of its sub-levels
+        for deeper_level in [lvl for lvl in counters if lvl > level]:
+            del counters[deeper_level]
+        counters[level] = counters.get(level, 0) + 1
+        if level in self._ordered_levels.get(num_id, set()):
+            return [f"{counters[level]}. " + text.replace("\n", " ")]
+        return ["- " + text.replace("\n", " ")]
+
+    def _convert_table(self, table: ET.Element) -> list[str]:
+        """Converts a table to markdown.
+        Tables with merged cells are output as a single HTML line,
+        without markdown emphasis in their cells.
+
+        Args:
+            table (ET.Element): the <w:tbl> element.
+
+        Returns:
+            list[str]: the markdown lines of the table.
+        """
+        # rows of (cell, colspan, is_vertical_merge_continuation, is_vertical_merge_start)
+        cell_rows: list[list[tuple[ET.Element, int, bool, bool]]] = []
+        for tr in table.findall(f"{_W}tr"):
+            cell_row: list[tuple[ET.Element, int, bool, bool]] = []
+            for tc in DocxXmlConverter._get_row_cells(tr):
+                tc_pr = tc.find(f"{_W}tcPr")
+                colspan, v_merge = 1, None
+                if tc_pr is not None:
+                    grid_span = tc_pr.find(f"{_W}gridSpan")
+                    if grid_span is not None:
+                        colspan = int(grid_span.get(f"{_W}val", 1))
+                    v_merge_elem = tc_pr.find(f"{_W}vMerge")
+                    if v_merge_elem is not None:
+                        v_merge = v_merge_elem.get(f"{_W}val", "continue")
+                cell_row.append(
+                    (tc, colspan, v_merge == "continue", v_merge == "restart")
+                )
+            if cell_row:
+                cell_rows.append(cell_row)
+        if not cell_rows:
+            return []
+
+        as_html = any(
+            colspan > 1 or continued or restart
+            for cell_row in cell_rows
+            for _, colspan, continued, restart in cell_row
+        )
+        rows = [
+            [
+                (self._get_cell_text(tc, formatted=not as_html), *cell_specs)
+                for tc, *cell_specs in cell_row
+            ]
+            for cell_row in cell_rows
+        ]
+        if as_html:
+            return [DocxXmlConverter._table_rows_to_html(rows)]
+
+        texts = [[text.replace("|", "\\|") for text, _, _, _ in row] for row in rows]
+        return build_pipe_table(texts[0], texts[1:]).split("\n")
+
+    def _get_cell_text(self, tc: ET.Element, formatted: bool) -> str:
+        """Gets the text of a table cell, as its paragraphs joined by spaces.
+
+        Args:
+            tc (ET.Element): the <w:tc> element.
+            formatted (bool): whether to format the text with markdown emphasis.
+
+        Returns:
+            str: the text of the cell.
+        """
+        return " ".join(
+            text
+            for p in tc.iter(f"{_W}p")
+            if (text := self._get_paragraph_text(p, formatted).replace("\n", " "))
+        )
+
+    @staticmethod
+    def _get_row_cells(tr: ET.Element) -> list[ET.Element]:
+        """Gets the cells of a row, including those wrapped in content controls."""
+        cells: list[ET.Element] = []
+        for child in tr:
+            if child.tag == f"{_W}tc":
+                cells.append(child)
+            elif child.tag in _RUN_CONTAINERS:
+                cells.extend(DocxXmlConverter._get_row_cells(child))
+        return cells
+
+    @staticmethod
+    def _table_rows_to_html(rows: list[list[tuple[str, int, bool, bool]]]) -> str:
+        """Builds an HTML table preserving merged cells with colspan/rowspan.
+        Each merged cell's text is written exactly once.
+
+        Args:
+            rows (list[list[tuple[str, int, bool, bool]]]): the table rows. Each cell is
+                (text, colspan, is_vertical_merge_continuation, is_vertical_merge_start).
+
+        Returns:
+            str: the HTML table string.
+        """
+        # Place cells on the grid to compute the rowspan of vertically merged cells
+        grid_rows: list[list[tuple[int, str, int, bool]]] = []
+        for row in rows:
+            grid_row: list[tuple[int, str, int, bool]] = []
+            col_idx = 0
+            for text, colspan, continued, _ in row:
+                grid_row.append((col_idx, text, colspan, continued))
+                col_idx += colspan
+            grid_rows.append(grid_row)
+        continued_positions = {
+            (row_idx, col_idx)
+            for row_idx, grid_row in enumerate(grid_rows)
+            for col_idx, _, _, continued in grid_row
+            if continued
+        }
+
+        parts = ["<table>"]
+        for row_idx, grid_row in enumerate(grid_rows):
+            tag = "th" if row_idx == 0 else "td"
+            parts.append("<tr>")
+            for col_idx, text, colspan, continued in grid_row:
+                if continued:
+                    continue
+                rowspan = 1
+                while (row_idx + rowspan, col_idx) in continued_positions:
+                    rowspan += 1
+                attrs = ""
+                if colspan > 1:
+                    attrs += f' colspan="{colspan}"'
+                if rowspan > 1:
+                    attrs += f' rowspan="{rowspan}"'
+                parts.append(f"<{tag}{attrs}>{html.escape(text, quote=False)}</{tag}>")
+            parts.append("</tr>")
+        parts.append("</table>")
+
+        return "".join(parts)
+
+    def _get_paragraph_text(self, paragraph: ET.Element, formatted: bool = True) -> str:
+        """Gets the markdown-formatted text of a paragraph:
+        consecutive runs sharing the same formatting are wrapped in ** or * together,
+        and hyperlinks are formatted as [text](target).
+
+        Args:
+            paragraph (ET.Element): the <w:p> element.
+            formatted (bool, optional): whether to wrap bold and italic runs in ** or *.
+                Defaults to True.
+
+        Returns:
+            str: the text. Line breaks are kept as "\\n".
+        """
+        parts: list[str] = []
+        buffer: list[str] = []
+        buffer_format = (False, False)
+
+        def flush() -> None:
+            text = "".join(buffer)
+            buffer.clear()
+            if not text.strip():
+                parts.append(text)
+                return
+            bold, italic = buffer_format
+            marker = ("**" if bold else "") + ("*" if italic else "")
+            stripped = text.strip()
+            parts.append(
+                text[: len(text) - len(text.lstrip())]
+                + marker
+                + stripped
+                + marker[::-1]
+                + text[len(text.rstrip()) :]
+            )
+
+        for item in self._iter_paragraph_runs(paragraph):
+            if isinstance(item, str):  # already formatted text, such as a hyperlink
+                flush()
+                parts.append(item)
+                continue
+            run_format = (
+                DocxXmlConverter._get_run_format(item) if formatted else (False, False)
+            )
+            if run_format != buffer_format:
+                flush()
+                buffer_format = run_format
+            buffer.append(DocxXmlConverter._get_run_text(item))
+        flush()
+
+        text = "".join(parts)
+        return "\n".join(
+            _RE_WHITESPACE.sub(" ", line).strip() for line in text.split("\n")
+        ).strip()
+
+    def _iter_paragraph_runs(self, element: ET.Element) -> Iterator[ET.Element | str]:
+        """Yields the runs of a paragraph in reading order.
+        Hyperlinks are yielded as already-formatted markdown strings.
+        """
+        for child in element:
+            if child.tag == f"{_W}r":
+                yield child
+            elif child.tag == f"{_W}hyperlink":
+                text = "".join(
+                    DocxXmlConverter._get_run_text(run) for run in child.iter(f"{_W}r")
+                ).strip()
+                target = self._hyperlinks.get(child.get(f"{_R}id", ""))
+                anchor = child.get(f"{_W}anchor")
+                if text and target:
+                    yield f"[{text}]({target})"
+                elif text and anchor:
+                    yield f"[{text}](#{anchor})"
+                elif text:
+                    yield text
+            elif child.tag in _RUN_CONTAINERS:
+                yield from self._iter_paragraph_runs(child)
+
+    @staticmethod
+    def _get_run_format(run: ET.Element) -> tuple[bool, bool]:
+        """Gets the (bold, italic) formatting of a run."""
+        r_pr = run.find(f"{_W}rPr")
+        if r_pr is None:
+            return False, False
+        return (
+            DocxXmlConverter._is_toggled(r_pr.find(f"{_W}b")),
+            DocxXmlConverter._is_toggled(r_pr.find(f"{_W}i")),
+        )
+
+    @staticmethod
+    def _is_toggled(elem: ET.Element | None) -> bool:
+        """Whether a toggle property such as <w:b/> is on."""
+        return elem is not None and elem.get(f"{_W}val", "true") not in (
+            "0",
+            "false",
+            "off",
+        )
+
+    @staticmethod
+    def _get_run_text(run: ET.Element) -> str:
+        """Gets the text of a run. Tabs are converted to spaces, breaks to newlines."""
+        text = ""
+        for child in run:
+            if child.tag == f"{_W}t":
+                text += child.text or ""
+            elif child.tag == f"{_W}tab":
+                text += " "
+            elif child.tag in (f"{_W}br", f"{_W}cr"):
+                text += "\n"
+            elif child.tag == f"{_W}noBreakHyphen":
+                text += "-"
+        return text
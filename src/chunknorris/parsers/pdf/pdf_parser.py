@@ -4,9 +4,12 @@ from itertools import groupby
 from pathlib import Path
 from typing import Any, Literal
 
+import numpy as np
+import numpy.typing as npt
 import pymupdf  # type: ignore : no stubs
 
 from ...core.components import MarkdownDoc
+from ...core.instrumentation import trace
 from ...decorators.decorators import mem_debug, timeit, validate_args
 from ...exceptions.exceptions import (
     PageNotFoundException,
@@ -15,11 +18,15 @@ from ...exceptions.exceptions import (
 )
 from .tools import (
     DocSpecsExtraction,
+    PageExtractor,
     PdfExport,
     PdfLinkExtraction,
     PdfPageClassification,
+    PdfPagePredictionCache,
+    PdfPageVisitor,
     PdfParserState,
     PdfPlotter,
+    PdfProfiling,
     PdfTableExtraction,
     PdfTocExtraction,
     TableFinder,
@@ -36,6 +43,8 @@ class PdfParser(
     PdfTocExtraction,
     PdfPlotter,
     PdfExport,
+    PdfPageVisitor,
+    PdfProfiling,
     DocSpecsExtraction,
     PdfParserState,
 ):
@@ -63,6 +72,8 @@ class PdfParser(
         ocr_language: str = "fra+eng",
         body_line_spacing: float | None = None,
         enable_ml_features: bool = False,
+        prediction_cache: PdfPagePredictionCache | None = None,
+        profile: bool = False,
     ) -> None:
         """Initializes a PDF parser.
 
@@ -89,6 +100,14 @@ class PdfParser(
                 Requires ``onnxruntime`` or ``openvino`` and ``huggingface-hub``.
                 Use :func:`chunknorris.ml.set_ml_backend` to select the inference backend.
                 Defaults to False.
+            prediction_cache (PdfPagePredictionCache | None, optional): a persistent cache of the predictions
+                of the page classifier, keyed by the content of the pages. Pages already classified,
+                in this document or another one, are neither rendered nor classified by :meth:`classify_pages`.
+                Defaults to None.
+            profile (bool, optional): if True, each parsing records the wall time, CPU time and python allocations
+                (with tracemalloc) of its stages, and the time spent on each page. The report is available
+                in ``parser.profile_report`` after parsing, and the slowest pages can be saved with
+                :meth:`dump_slowest_pages`. Tracing allocations slows the parsing down. Defaults to False.
         """
         super().__init__()
         self.add_headers = add_headers
@@ -101,6 +120,8 @@ class PdfParser(
         )
         self.table_finder = table_finder
         self._ml_enabled = enable_ml_features
+        self.prediction_cache = prediction_cache
+        self.profile = profile
         if enable_ml_features:
             self._load_page_classifier()
 
@@ -126,8 +147,10 @@ class PdfParser(
         Returns:
             MarkdownDoc: The MarkdownDoc to be passed to MarkdownChunker.
         """
-        self.read_file(filepath)
-        return self._parse_and_export(page_start, page_end)
+        with self._profiling():
+            with self._profile_stage("read_file"):
+                self.read_file(filepath)
+            return self._parse_and_export(page_start, page_end)
 
     @timeit
     @validate_args
@@ -145,8 +168,10 @@ class PdfParser(
         Returns:
             MarkdownDoc: The MarkdownDoc to be passed to MarkdownChunker.
         """
-        self.read_file(string)
-        return self._parse_and_export(page_start, page_end)
+        with self._profiling():
+            with self._profile_stage("read_file"):
+                self.read_file(string)
+            return self._parse_and_export(page_start, page_end)
 
     @mem_debug("read_file")
     def read_file(self, filepath_or_stream: str | bytes) -> None:
@@ -176,7 +201,8 @@ class PdfParser(
         try:
             self._set_page_range(page_start, page_end)
             self._parse_document()
-            return self.to_markdown_doc()
+            with trace("pdf.export"), self._profile_stage("export"):
+                return self.to_markdown_doc()
         except Exception:
             if isinstance(self._document, pymupdf.Document):
                 self._document.close()
@@ -203,19 +229,38 @@ class PdfParser(
     def _parse_document(self) -> None:
         """Parses a pdf document."""
 
-        self.spans = self._create_spans()
+        page_count = self.page_end - self.page_start  # type: ignore : page_end is set by _set_page_range()
+        # the per-page extractions are recorded under the stages below
+        self._visit_pages()
+        with (
+            trace("pdf.extract_spans", page_count=page_count) as stage,
+            self._profile_stage("create_spans"),
+        ):
+            self.spans = self._create_spans()
+            stage.set(span_count=len(self.spans))
         if not self.spans or all(span.is_header_footer for span in self.spans):
             raise TextNotFoundException(
                 'No text content found in document. You may want to set use_ocr="always".'
             )
-        self.tables = self.get_tables() if self.extract_tables else []
-        self.spans = self._flag_table_spans(self.spans)
-        self.lines = PdfParser._create_lines(self.spans)
-        self.blocks = self._create_blocks(self.lines)
-        self._set_document_specifications()
-        self._flag_footnotes(self.spans)
-        self.main_title = self._get_document_main_title()
-        self.toc = self.get_toc() if self.add_headers else []
+        with (
+            trace("pdf.find_tables", page_count=page_count) as stage,
+            self._profile_stage("get_tables"),
+        ):
+            self.tables = self.get_tables() if self.extract_tables else []
+            if self.extract_tables:
+                stage.set(skipped_page_count=self._count_pages_without_line_work())
+            self.spans = self._flag_table_spans(self.spans)
+        with (
+            trace("pdf.layout", span_count=len(self.spans)),
+            self._profile_stage("layout"),
+        ):
+            self.lines = PdfParser._create_lines(self.spans)
+            self.blocks = self._create_blocks(self.lines)
+            self._set_document_specifications()
+            self._flag_footnotes(self.spans)
+            self.main_title = self._get_document_main_title()
+        with trace("pdf.toc"), self._profile_stage("get_toc"):
+            self.toc = self.get_toc() if self.add_headers else []
 
     def check_ocr_config_is_valid(self) -> None:
         """Check that the OCR configuration is valid."""
@@ -240,41 +285,60 @@ class PdfParser(
         Returns:
             list[textSpan]: the spans, after preprocessing.
         """
-        spans = self._extract_spans()
+        with self._profile_stage("extract_spans"):
+            spans = self._extract_spans()
         for i, span in enumerate(spans):
             span.order = i
-        spans = self._flag_headers_footers(spans)
-        spans = self._bind_links_to_spans(spans)
+        with self._profile_stage("flag_headers_footers"):
+            spans = self._flag_headers_footers(spans)
+        with self._profile_stage("bind_links"):
+            spans = self._bind_links_to_spans(spans)
 
         return spans
 
+    def _get_page_extractors(self) -> dict[str, PageExtractor]:
+        return super()._get_page_extractors() | {
+            "spans": PageExtractor(
+                self._extract_page_spans,
+                trace_name="pdf.extract_spans",
+                profile_stages=("create_spans", "extract_spans"),
+            )
+        }
+
     def _extract_spans(self) -> list[TextSpan]:
-        """Get the spans of the pages."""
-
-        spans: list[TextSpan] = []
-        for page in self.document.pages(start=self.page_start, stop=self.page_end):  # type: ignore : missing typing in pymupdf -> document.pages() : generator[Page]
-            match self.use_ocr:
-                case "always":
-                    textpage: pymupdf.TextPage = page.get_textpage_ocr(  # type: ignore : missing typing in pymupdf
-                        language=self.ocr_language, dpi=72, full=False
-                    )
-                case "auto":
-                    textpage: pymupdf.TextPage = page.get_textpage()  # type: ignore : missing typing in pymupdf
-                    page_spans = PdfParser._extract_spans_from_textpage(
-                        textpage, page.number  # type: ignore : missing typing in pymupdf -> page.number: int
-                    )
-                    if page_spans:
-                        spans.extend(page_spans)
-                        continue
-                    else:
-                        textpage: pymupdf.TextPage = page.get_textpage_ocr(  # type: ignore : missing typing in pymupdf
-                            language=self.ocr_language, dpi=72, full=False
-                        )
-                case "never":
-                    textpage: pymupdf.TextPage = page.get_textpage()  # type: ignore : missing typing in pymupdf
-            spans.extend(PdfParser._extract_spans_from_textpage(textpage, page.number))  # type: ignore : missing typing in pymupdf -> page.number: int
+        """Get the spans of the pages, extracted by _visit_pages()."""
 
-        return spans
+        return [
+            span
+            for page_content in self.pages_content.values()
+            for span in page_content["spans"]
+        ]
+
+    def _extract_page_spans(self, page: pymupdf.Page) -> list[TextSpan]:
+        """Get the spans of a page, using OCR if needed.
+
+        Args:
+            page (pymupdf.Page): the page.
+
+        Returns:
+            list[TextSpan]: the spans of the page.
+        """
+        if self.use_ocr == "auto":
+            textpage: pymupdf.TextPage = page.get_textpage()  # type: ignore : missing typing in pymupdf
+            page_spans = PdfParser._extract_spans_from_textpage(
+                textpage, page.number  # type: ignore : missing typing in pymupdf -> page.number: int
+            )
+            if page_spans:
+                return page_spans
+        if self.use_ocr == "never":
+            textpage = page.get_textpage()  # type: ignore : missing typing in pymupdf
+        else:
+            with trace("pdf.ocr", page_count=1), self._profile_page("ocr", page.number):  # type: ignore : missing typing in pymupdf -> page.number: int
+                textpage = page.get_textpage_ocr(  # type: ignore : missing typing in pymupdf
+                    language=self.ocr_language, dpi=72, full=False
+                )
+
+        return PdfParser._extract_spans_from_textpage(textpage, page.number)  # type: ignore : missing typing in pymupdf -> page.number: int
 
     @staticmethod
     def _extract_spans_from_textpage(
@@ -313,13 +377,49 @@ class PdfParser(
         for table in self.tables:
             page_tables[table.page].append(table.bbox)
 
-        for span in spans:
-            span.isin_table = any(
-                rect.contains(span.origin) for rect in page_tables[span.page]  # type: ignore : missing typing in pymupdf | Rect.contains(x) : bool
+        for page, spans_on_page_iter in groupby(spans, key=lambda span: span.page):
+            spans_on_page = list(spans_on_page_iter)
+            if page not in page_tables:
+                for span in spans_on_page:
+                    span.isin_table = False
+                continue
+            # coordinates as float32, as compared by pymupdf's Rect.contains()
+            origins = np.array(
+                [tuple(span.origin) for span in spans_on_page], dtype=np.float32
+            )
+            tables_bboxes = np.array(
+                [tuple(bbox) for bbox in page_tables[page]], dtype=np.float32
             )
+            isin_table = PdfParser._get_points_in_rects_mask(origins, tables_bboxes)
+            for span, span_isin_table in zip(spans_on_page, isin_table.tolist()):
+                span.isin_table = span_isin_table
 
         return spans
 
+    @staticmethod
+    def _get_points_in_rects_mask(
+        points: npt.NDArray[np.float32], rects: npt.NDArray[np.float32]
+    ) -> npt.NDArray[np.bool_]:
+        """Checks which points are inside at least one of the rectangles.
+        Like pymupdf's Rect.contains(point), the bottom and right edges are excluded.
+
+        Args:
+            points (npt.NDArray[np.float32]): the points. Shape : (n_points, 2).
+            rects (npt.NDArray[np.float32]): the rectangles. Shape : (n_rects, 4).
+
+        Returns:
+            npt.NDArray[np.bool_]: True if the point is in a rectangle. Shape : (n_points,).
+        """
+        x, y = points[:, 0:1], points[:, 1:2]
+        inside = (
+            (rects[:, 0] <= x)
+            & (x < rects[:, 2])
+            & (rects[:, 1] <= y)
+            & (y < rects[:, 3])
+        )  # Shape : (n_points, n_rects)
+
+        return inside.any(axis=1)
+
     def _flag_headers_footers(self, spans: list[TextSpan]) -> list[TextSpan]:
         """Flags spans that are headers and footers (inplace).
         A span is considered a header/footer if its exact bbox appears on more
@@ -361,10 +461,9 @@ class PdfParser(
             return
         min_body_fontsize = min(self.main_body_fontsizes)
 
-        # Pre-compute page heights once to avoid repeated document access
         page_heights: dict[int, float] = {
-            page.number: page.rect.height  # type: ignore : missing typing in pymupdf | Page.number : int, Rect.height : float
-            for page in self.document.pages(start=self.page_start, stop=self.page_end)  # type: ignore : missing typing in pymupdf
+            page_number: page_content["rect"].height  # type: ignore : missing typing in pymupdf | Rect.height : float
+            for page_number, page_content in self.pages_content.items()
         }
 
         for span in spans:
@@ -543,6 +642,7 @@ class PdfParser(
         self.lines = []
         self.blocks = []
         self.tables = []
+        self.pages_content = {}
         self.toc = []
         self.main_title = ""
         self.document_fontsizes = []
@@ -553,3 +653,4 @@ class PdfParser(
         # release cached page images — the PIL objects can be large
         self._page_images = None
         self._page_images_resolution = 100
+        self._font_digests = {}
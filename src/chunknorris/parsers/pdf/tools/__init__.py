@@ -1,10 +1,12 @@
 from .components import Link, TextBlock, TextLine, TextSpan
-from .components_ml import PdfPageSnapshot
+from .components_ml import PdfPagePredictionCache, PdfPageSnapshot
 from .components_tables import Cell, PdfTable, TableFinder
 from .export import PdfExport
 from .extract_links import PdfLinkExtraction
 from .extract_tables import PdfTableExtraction
 from .extract_toc import PdfTocExtraction
 from .page_classification import PdfPageClassification
+from .page_visitor import PageExtractor, PdfPageVisitor
 from .plot import PdfPlotter
+from .profiling import PdfProfileReport, PdfProfiling, StageProfile
 from .utils import DocSpecsExtraction, PdfParserState
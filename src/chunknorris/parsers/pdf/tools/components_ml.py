@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import TYPE_CHECKING
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Callable
 
 from ....ml.pdf_page_classifiers.types import PdfPagePrediction
 
@@ -11,25 +15,56 @@ if TYPE_CHECKING:
     from PIL import Image
 
 
-@dataclass
+@dataclass(init=False)
 class PdfPageSnapshot:
     """A rendered snapshot of a single PDF page, optionally annotated with
     classifier predictions.
 
-    Images are stored by reference — they point to the same ``PIL.Image``
-    objects cached in ``PdfParser._page_images``, so holding a list of
-    snapshots does not duplicate memory.
+    The image is either given at creation, or rendered on first access with
+    ``render_image`` (as done by :meth:`PdfParser.classify_pages`, so that
+    pages that do not need embedding are never rendered at full resolution).
+    Lazily rendered images come from the document that was classified: access
+    them before parsing another document, as they can't be rendered once the
+    document is closed (a ``ValueError`` is raised).
 
     Attributes:
         page_number: Zero-based page index within the source document.
         image: The rendered PIL image for this page.
         predictions: Raw output dict from the page classifier, or ``None``
             if :meth:`PdfParser.classify_pages` has not been called yet.
+        from_cache: Whether the predictions come from a
+            :class:`PdfPagePredictionCache` instead of the classifier.
     """
 
     page_number: int
-    image: Image.Image
-    predictions: PdfPagePrediction | None = None
+    predictions: PdfPagePrediction | None
+    from_cache: bool
+    _image: Image.Image | None = field(repr=False, compare=False)
+    _render_image: Callable[[], Image.Image] | None = field(repr=False, compare=False)
+
+    def __init__(
+        self,
+        page_number: int,
+        image: Image.Image | None = None,
+        predictions: PdfPagePrediction | None = None,
+        render_image: Callable[[], Image.Image] | None = None,
+        from_cache: bool = False,
+    ) -> None:
+        if image is None and render_image is None:
+            raise ValueError("Either 'image' or 'render_image' must be provided.")
+        self.page_number = page_number
+        self.predictions = predictions
+        self.from_cache = from_cache
+        self._image = image
+        self._render_image = render_image
+
+    @property
+    def image(self) -> Image.Image:
+        """The rendered PIL image for this page, rendered on first access if needed."""
+        if self._image is None:
+            self._image = self._render_image()  # type: ignore[misc] : set if no image
+            self._render_image = None
+        return self._image
 
     @property
     def needs_image_embedding(self) -> bool:
@@ -56,3 +91,118 @@ class PdfPageSnapshot:
                 "Predictions not computed yet. Call classify_pages() first."
             )
         return list(self.predictions.predicted_classes)
+
+
+class PdfPagePredictionCache:
+    """On-disk cache of the page classifier's predictions, stored in a SQLite file.
+    Keys are built by :meth:`PdfParser.classify_pages` from the content of the page,
+    the model variant, its weights and the threshold, so that the unchanged pages of a
+    re-ingested document are neither rendered nor classified again.
+    When full, the least recently used predictions are evicted.
+    Can be shared by several threads and processes.
+
+    Example::
+
+        cache = PdfPagePredictionCache("page_predictions.sqlite")
+        parser = PdfParser(enable_ml_features=True, prediction_cache=cache)
+    """
+
+    def __init__(self, filepath: str, max_entries: int = 100_000) -> None:
+        """Initializes a prediction cache.
+
+        Args:
+            filepath (str): the path to the SQLite file. Created if it does not exist.
+            max_entries (int, optional): the number of predictions to keep. Defaults to 100_000.
+        """
+        if max_entries < 1:
+            raise ValueError(
+                f"Invalid value for argument 'max_entries': expected a positive integer. Got '{max_entries}'."
+            )
+        self.filepath = filepath
+        self.max_entries = max_entries
+        self._connection: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> dict[str, Any]:
+        # connections and locks can't be sent to other processes
+        return {"filepath": self.filepath, "max_entries": self.max_entries}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__init__(**state)  # type: ignore[misc]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return (
+                self._get_connection()
+                .execute("SELECT COUNT(*) FROM predictions")
+                .fetchone()[0]
+            )
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Opens the SQLite file on first use. Meant to be called with self._lock held."""
+        if self._connection is None:
+            if os.path.dirname(self.filepath):
+                os.makedirs(os.path.dirname(self.filepath), exist_ok=True)
+            self._connection = sqlite3.connect(
+                self.filepath, timeout=30, check_same_thread=False
+            )
+            self._connection.executescript(
+                "CREATE TABLE IF NOT EXISTS predictions "
+                "(key TEXT PRIMARY KEY, prediction TEXT NOT NULL, last_used REAL NOT NULL);"
+                "CREATE INDEX IF NOT EXISTS predictions_last_used ON predictions (last_used);"
+            )
+        return self._connection
+
+    def get_many(self, keys: list[str]) -> dict[str, PdfPagePrediction]:
+        """Gets the cached predictions, and marks them as recently used.
+
+        Args:
+            keys (list[str]): the keys of the predictions.
+
+        Returns:
+            dict[str, PdfPagePrediction]: the predictions found, as {key: prediction}.
+        """
+        if not keys:
+            return {}
+        placeholders = ", ".join("?" * len(keys))
+        with self._lock, self._get_connection() as connection:
+            rows = connection.execute(
+                f"SELECT key, prediction FROM predictions WHERE key IN ({placeholders})",
+                keys,
+            ).fetchall()
+            connection.execute(
+                f"UPDATE predictions SET last_used = ? WHERE key IN ({placeholders})",
+                [time.time(), *keys],
+            )
+
+        return {
+            key: PdfPagePrediction.model_validate_json(value) for key, value in rows
+        }
+
+    def set_many(self, predictions: dict[str, PdfPagePrediction]) -> None:
+        """Stores predictions, then evicts the least recently used ones if the cache is full.
+
+        Args:
+            predictions (dict[str, PdfPagePrediction]): the predictions, as {key: prediction}.
+        """
+        if not predictions:
+            return
+        now = time.time()
+        with self._lock, self._get_connection() as connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO predictions (key, prediction, last_used) VALUES (?, ?, ?)",
+                [
+                    (key, prediction.model_dump_json(), now)
+                    for key, prediction in predictions.items()
+                ],
+            )
+            connection.execute(
+                "DELETE FROM predictions WHERE key IN (SELECT key FROM predictions "
+                "ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+
+    def clear(self) -> None:
+        """Removes all the predictions, for instance after a model update."""
+        with self._lock, self._get_connection() as connection:
+            connection.execute("DELETE FROM predictions")
@@ -238,6 +238,10 @@ class TableFinder:
     while maintaining table parsing capabilities
     """
 
+    # "l" (line) and "re" (rectangle) operators of a content stream. Operators
+    # always follow their operands, separated by whitespace.
+    _LINE_OPERATORS_PATTERN = re.compile(rb"\s(?:l|re)(?=[\s/\[<(%]|$)")
+
     def __init__(self, snap_tolerance: int = 3, line_width_threshold: int = 5):
         """Init a tablefinder
 
@@ -294,12 +298,39 @@ class TableFinder:
         # remove tables with no cells
         return [tab for tab in parsed_tables if tab[2].size]
 
+    @staticmethod
+    def has_line_work(page: pymupdf.Page) -> bool:
+        """Cheaply checks whether a page might contain lines, and therefore tables,
+        by looking for the line and rectangle operators in its content streams,
+        without interpreting them as page.get_drawings() does.
+        Might give false positives (e.g. text such as "(a l b) Tj"), but no false negatives.
+
+        Args:
+            page (pymupdf.Page): the page to check.
+
+        Returns:
+            bool: False if the page has no line nor rectangle.
+        """
+        document = page.parent  # type: ignore : missing typing in pymupdf -> Page.parent : Document
+        xrefs: list[int] = list(page.get_contents())  # type: ignore : missing typing in pymupdf -> Page.get_contents() -> list[int]
+        # form xobjects, including the nested ones, might contain lines too
+        xrefs.extend(xobject[0] for xobject in page.get_xobjects())  # type: ignore : missing typing in pymupdf -> Page.get_xobjects() -> list[tuple]
+        for xref in xrefs:
+            try:
+                stream = document.xref_stream(xref)
+            except Exception:  # pylint: disable=broad-exception-caught
+                return True  # let page.get_drawings() deal with broken streams
+            if stream is None or TableFinder._LINE_OPERATORS_PATTERN.search(stream):
+                return True
+
+        return False
+
     def _get_table_lines(self, page: pymupdf.Page) -> npt.NDArray[np.float32]:
         """Gets the lines that are likely to belong to a table.
 
-        Processes all drawings in a single pass: annotation filtering, rectangle-to-line
-        conversion, and coordinate extraction happen together to avoid creating intermediate
-        copies of the (potentially large) drawings list.
+        Uses page.get_cdrawings(), that gives coordinates as plain tuples, and only loops over
+        the drawings to gather their line and rectangle items in an array. Annotation filtering
+        and rectangle-to-line conversion are then done on the whole array.
 
         Args:
             page (pymupdf.Page): the page to get the drawings from.
@@ -308,29 +339,82 @@ class TableFinder:
             npt.NDArray[np.float32]: an array of line coordinates of shape (n_lines, 4)
                 where each row is x1, y1, x2, y2.
         """
-        drawings = page.get_drawings()  # type: ignore missing typing in pymupdf
-        ann_rects = [a.rect for a in page.annots()]  # type: ignore missing typing in pymupdf
+        drawings = page.get_cdrawings()  # type: ignore missing typing in pymupdf
+        # one row per line or rectangle item : (drawing index, is rectangle, x0, y0, x1, y1)
+        items = [
+            (
+                (drawing_idx, 0.0, *item[1], *item[2])
+                if item[0] == "l"
+                else (drawing_idx, 1.0, *item[1])
+            )
+            for drawing_idx, drawing in enumerate(drawings)
+            for item in drawing["items"]
+            if item[0] == "l" or item[0] == "re"
+        ]
+        if not items:
+            return np.empty(shape=(0, 4))
+        items_array = np.array(items, dtype=np.float64)
+
+        ann_rects = np.array([tuple(a.rect) for a in page.annots()], dtype=np.float64)  # type: ignore missing typing in pymupdf
+        if ann_rects.size:
+            drawings_rects = np.array([d["rect"] for d in drawings], dtype=np.float64)
+            in_annotation = TableFinder._get_contained_mask(drawings_rects, ann_rects)
+            items_array = items_array[~in_annotation[items_array[:, 0].astype(np.intp)]]
+
+        line_coordinates = items_array[:, 2:]
+        is_rect = items_array[:, 1] == 1.0
+        rects = line_coordinates[is_rect]
+        # same as pymupdf.Rect.normalize()
+        x0, x1 = np.minimum(rects[:, 0], rects[:, 2]), np.maximum(
+            rects[:, 0], rects[:, 2]
+        )
+        y0, y1 = np.minimum(rects[:, 1], rects[:, 3]), np.maximum(
+            rects[:, 1], rects[:, 3]
+        )
+        is_vertical = (x1 - x0) < self.line_width_threshold
+        is_horizontal = ~is_vertical & ((y1 - y0) < self.line_width_threshold)
+        mid_x, mid_y = (x0 + x1) / 2, (y0 + y1) / 2
+        rects_as_lines = np.where(
+            is_vertical[:, None],
+            np.stack([mid_x, y0, mid_x, y1], axis=1),
+            np.stack([x0, mid_y, x1, mid_y], axis=1),
+        )
+        # rectangles that are neither thin vertically nor horizontally are not lines
+        keep = np.ones(len(line_coordinates), dtype=bool)
+        keep[is_rect] = is_vertical | is_horizontal
+        line_coordinates[is_rect] = rects_as_lines
+        line_coordinates = line_coordinates[keep]
 
-        line_items: list[tuple[float, float, float, float]] = []
-        for drawing in drawings:
-            if ann_rects and any(ann.contains(drawing["rect"]) for ann in ann_rects):  # type: ignore
-                continue
-            for item in drawing["items"]:
-                if item[0] == "l":
-                    line_items.append((item[1].x, item[1].y, item[2].x, item[2].y))  # type: ignore
-                elif item[0] == "re":
-                    rect = item[1]
-                    if rect.width < self.line_width_threshold:  # type: ignore
-                        mid_x = (rect.x0 + rect.x1) / 2  # type: ignore
-                        line_items.append((mid_x, rect.y0, mid_x, rect.y1))  # type: ignore
-                    elif rect.height < self.line_width_threshold:  # type: ignore
-                        mid_y = (rect.y0 + rect.y1) / 2  # type: ignore
-                        line_items.append((rect.x0, mid_y, rect.x1, mid_y))  # type: ignore
-
-        if not line_items:
+        if not line_coordinates.size:
             return np.empty(shape=(0, 4))
-        line_coordinates = np.array(line_items, dtype=np.float32).round()
-        return TableFinder._filter_lines(line_coordinates)
+        return TableFinder._filter_lines(line_coordinates.astype(np.float32).round())
+
+    @staticmethod
+    def _get_contained_mask(
+        rects: npt.NDArray[np.float64], containers: npt.NDArray[np.float64]
+    ) -> npt.NDArray[np.bool_]:
+        """Checks which rectangles are contained in at least one of the containers,
+        in the sense of pymupdf.Rect.contains().
+
+        Args:
+            rects (npt.NDArray[np.float64]): the rectangles. Shape : (n_rects, 4).
+            containers (npt.NDArray[np.float64]): the containers. Shape : (n_containers, 4).
+
+        Returns:
+            npt.NDArray[np.bool_]: True if the rectangle is in a container. Shape : (n_rects,).
+        """
+        r = rects[:, None, :]
+        c = containers[None, :, :]
+        contained = (
+            (c[..., 0] <= r[..., 0])
+            & (r[..., 0] <= r[..., 2])
+            & (r[..., 2] <= c[..., 2])
+            & (c[..., 1] <= r[..., 1])
+            & (r[..., 1] <= r[..., 3])
+            & (r[..., 3] <= c[..., 3])
+        )  # Shape : (n_rects, n_containers)
+
+        return contained.any(axis=1)
 
     @staticmethod
     def _remove_drawings_from_annotations(
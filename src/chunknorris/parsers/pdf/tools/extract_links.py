@@ -5,19 +5,43 @@ import numpy.typing as npt
 import pymupdf  # type: ignore | no stub files
 
 from .components import Link, TextSpan
-from .utils import PdfParserState
+from .page_visitor import PageExtractor, PdfPageVisitor
 
 
-class PdfLinkExtraction(PdfParserState):
+class PdfLinkExtraction(PdfPageVisitor):
     """Class intended to be used to extract the links from the document
     and bind them to the corresponding spans.
     Intended to be a component inherited by pdfParser => PdfParser(PdfLinkExtraction)
     """
 
+    def _get_page_extractors(self) -> dict[str, PageExtractor]:
+        return super()._get_page_extractors() | {
+            "links": PageExtractor(
+                PdfLinkExtraction._extract_page_links,
+                trace_name="pdf.extract_spans",
+                profile_stages=("create_spans", "bind_links"),
+            )
+        }
+
+    @staticmethod
+    def _extract_page_links(page: pymupdf.Page) -> list[Link]:
+        """Gets the links of a page that point to an URI.
+
+        Args:
+            page (pymupdf.Page): the page.
+
+        Returns:
+            list[Link]: the links of the page.
+        """
+        return [
+            Link(uri=link["uri"], bbox=link["from"])
+            for link in page.links(kinds=(pymupdf.LINK_URI,))  # type: ignore | missing typing in pymupdf: Page.links() -> list[dict[str, str]]
+        ]
+
     def _bind_links_to_spans(self, spans: list[TextSpan]) -> list[TextSpan]:
         """In a pdf, links are just an invisible clickable box
         layered on top of a span.
-        This method gets the links of the pdf
+        This method gets the links of the pdf (extracted by _visit_pages())
         and binds them to their corresponding span.
 
         Args:
@@ -31,33 +55,75 @@ class PdfLinkExtraction(PdfParserState):
             for page_n, spans_on_page in groupby(spans, key=lambda span: span.page)
         }
         links_per_page_map: dict[int, list[Link]] = {
-            page.number: [  # type: ignore | missing typing in pymupdf: Page.number : int
-                Link(uri=link["uri"], bbox=link["from"])
-                for link in page.links(kinds=(pymupdf.LINK_URI,))  # type: ignore | missing typing in pymupdf: Page.links() -> list[dict[str, str]]
-            ]
-            for page in self.document.pages(self.page_start, self.page_end)  # type: ignore | missing typing in pymupdf: Document.Pages() -> Generator(Page)
+            page_n: page_content["links"]
+            for page_n, page_content in self.pages_content.items()
         }
         for page_n, links_on_page in links_per_page_map.items():
             if not links_on_page or page_n not in spans_per_page_map:
                 continue  # No links to bind on that page, or no spans to bind links to
             links_bboxes = np.array([link.bbox for link in links_per_page_map[page_n]])
             spans_bboxes = np.array([span.bbox for span in spans_per_page_map[page_n]])
-            intersection_areas = PdfLinkExtraction.calculate_intersection_areas(
+            candidates_per_link = PdfLinkExtraction._get_candidate_spans(
                 spans_bboxes, links_bboxes
-            )  # 2D matrix of intersection areas. Shape : (n_spans, n_links)
-            for i in range(intersection_areas.shape[1]):
-                corresponding_span_idx = (
+            )
+            for i, candidate_spans_idx in enumerate(candidates_per_link):
+                if not candidate_spans_idx.size:
+                    continue
+                intersection_areas = PdfLinkExtraction.calculate_intersection_areas(
+                    spans_bboxes[candidate_spans_idx], links_bboxes[i : i + 1]
+                )  # Shape : (n_candidate_spans, 1)
+                corresponding_candidate_idx = (
                     PdfLinkExtraction._get_span_corresponding_to_link(
-                        intersection_areas[:, i]
+                        intersection_areas[:, 0]
                     )
                 )
-                if corresponding_span_idx is not None:
-                    spans_per_page_map[page_n][corresponding_span_idx].link = (
-                        links_per_page_map[page_n][i]
-                    )
+                if corresponding_candidate_idx is not None:
+                    spans_per_page_map[page_n][
+                        candidate_spans_idx[corresponding_candidate_idx]
+                    ].link = links_per_page_map[page_n][i]
 
         return spans
 
+    @staticmethod
+    def _get_candidate_spans(
+        spans_bboxes: npt.NDArray[np.float32], links_bboxes: npt.NDArray[np.float32]
+    ) -> list[npt.NDArray[np.intp]]:
+        """Finds, for each link, the spans that might intersect it, so that links
+        are not compared to all the spans of the page.
+        The spans are indexed in a grid of horizontal bands, about one line high :
+        the candidates of a link are the spans of the bands the link overlaps.
+
+        Args:
+            spans_bboxes (npt.NDArray[np.float32]): the bboxes of the spans. Shape : (n_spans, 4).
+            links_bboxes (npt.NDArray[np.float32]): the bboxes of the links. Shape : (n_links, 4).
+
+        Returns:
+            list[npt.NDArray[np.intp]]: for each link, the sorted indexes of its candidate spans.
+        """
+        band_height = max(
+            float(np.median(spans_bboxes[:, 3] - spans_bboxes[:, 1])), 1.0
+        )
+        first_bands = np.floor(spans_bboxes[:, 1] / band_height).astype(np.intp)
+        last_bands = np.floor(spans_bboxes[:, 3] / band_height).astype(np.intp)
+        bands_count = np.maximum(last_bands - first_bands + 1, 1)
+        # one (band, span) entry per band covered by a span, sorted by band
+        entries_span_idx = np.repeat(np.arange(len(spans_bboxes)), bands_count)
+        entries_offset = np.arange(bands_count.sum()) - np.repeat(
+            np.cumsum(bands_count) - bands_count, bands_count
+        )
+        entries_band = np.repeat(first_bands, bands_count) + entries_offset
+        order = np.argsort(entries_band, kind="stable")
+        entries_band, entries_span_idx = entries_band[order], entries_span_idx[order]
+
+        links_first_band = np.floor(links_bboxes[:, 1] / band_height).astype(np.intp)
+        links_last_band = np.floor(links_bboxes[:, 3] / band_height).astype(np.intp)
+        starts = np.searchsorted(entries_band, links_first_band, side="left")
+        ends = np.searchsorted(entries_band, links_last_band, side="right")
+
+        return [
+            np.unique(entries_span_idx[start:end]) for start, end in zip(starts, ends)
+        ]
+
     @staticmethod
     def calculate_intersection_areas(
         spans_bboxes: npt.NDArray[np.float32], links_bboxes: npt.NDArray[np.float32]
@@ -126,10 +192,10 @@ class PdfLinkExtraction(PdfParserState):
         Returns:
             int: the index of the corresponding span in the list
         """
-        # Build a list of (span_idx, span/link_intersect_area) tuples, sorted by intersect area in descending order
-        idx_area_tuples = list(
-            zip(np.argsort(-intersect_areas), -np.sort(-intersect_areas))
-        )
+        # Build a list of (span_idx, span/link_intersect_area) tuples, sorted by intersect area in descending order.
+        # Spans with the same intersect area are kept in their order.
+        sorted_idx = np.argsort(-intersect_areas, kind="stable")
+        idx_area_tuples = list(zip(sorted_idx, intersect_areas[sorted_idx]))
 
         idx_area_tuples = [item for item in idx_area_tuples if item[1] > 0]
         if not idx_area_tuples:
@@ -1,20 +1,53 @@
 from itertools import groupby
 from operator import attrgetter
 
+import numpy as np
+import numpy.typing as npt
 import pymupdf  # type: ignore : no stubs
 
+from ....core.logger import LOGGER
 from ....decorators.decorators import mem_debug, timeit
 from .components import TextSpan
-from .components_tables import Cell, PdfTable
-from .utils import PdfParserState
+from .components_tables import Cell, PdfTable, TableFinder
+from .page_visitor import PageExtractor, PdfPageVisitor
 
 
-class PdfTableExtraction(PdfParserState):
+class PdfTableExtraction(PdfPageVisitor):
     """Tool that groups methods related to extraction of the tables of a pdf.
     Meant to be as inerited class PdfParser(PdfTableExtraction) as it uses some of
     the attributes of PdfParser, such as self.spans and self.document
     """
 
+    extract_tables: bool = True
+
+    def _get_page_extractors(self) -> dict[str, PageExtractor]:
+        extractors = super()._get_page_extractors()
+        if self.extract_tables:
+            extractors["tables"] = PageExtractor(
+                self._find_page_tables,
+                trace_name="pdf.find_tables",
+                profile_stages=("get_tables",),
+            )
+        return extractors
+
+    def _find_page_tables(
+        self, page: pymupdf.Page
+    ) -> list[tuple[npt.NDArray[np.float32], ...]] | None:
+        """Finds the tables of a page using its drawings, before binding them any span.
+        Pages without any line cannot contain tables : the extraction of their drawings is skipped.
+
+        Args:
+            page (pymupdf.Page): the page.
+
+        Returns:
+            list[tuple[npt.NDArray[np.float32], ...]] | None: the lines, intersections and cells of each table,
+                as returned by TableFinder.build_tables(). None if the page was skipped.
+        """
+        if not TableFinder.has_line_work(page):
+            return None
+        with mem_debug(f"page {page.number} - table extraction"):  # type: ignore : missing typing in pymupdf -> Page.number -> int
+            return self.table_finder.build_tables(page)
+
     @timeit
     def get_tables(self) -> list[PdfTable]:
         """Parses the table of the document. For this to work, tables
@@ -28,35 +61,57 @@ class PdfTableExtraction(PdfParserState):
             for page, spans_on_page in groupby(self.spans, key=lambda span: span.page)
         }
         tables: list[PdfTable] = []
-        for page in self.document.pages(start=self.page_start, stop=self.page_end):  # type: ignore : missing typing in pymupdf -> document.pages() : generator[Page]
-            tables.extend(self._extract_page_tables(page, spans_per_page))
+        for page_number, page_content in self.pages_content.items():
+            if page_content["tables"] is None:
+                continue
+            with self._profile_page("get_tables", page_number):
+                tables.extend(
+                    self._extract_page_tables(
+                        page_number, page_content["tables"], spans_per_page
+                    )
+                )
+        LOGGER.debug(
+            "Table detection skipped on %i pages without lines.",
+            self._count_pages_without_line_work(),
+        )
         return sorted(tables, key=attrgetter("order"))
 
+    def _count_pages_without_line_work(self) -> int:
+        """Counts the pages on which the table detection was skipped, as they have no lines.
+
+        Returns:
+            int: the number of pages.
+        """
+        return sum(
+            page_content["tables"] is None
+            for page_content in self.pages_content.values()
+        )
+
     def _extract_page_tables(
         self,
-        page: pymupdf.Page,  # type: ignore : missing typing in pymupdf
+        page_number: int,
+        tables_on_page: list[tuple[npt.NDArray[np.float32], ...]],
         spans_per_page: dict[int, list[TextSpan]],
     ) -> list[PdfTable]:
-        """Extracts tables from a single page.
+        """Builds the tables of a single page from the tables found by the TableFinder.
 
         Args:
-            page (pymupdf.Page): the page to process.
+            page_number (int): the number of the page to process.
+            tables_on_page (list[tuple[npt.NDArray[np.float32], ...]]): the tables found on the page.
             spans_per_page (dict): mapping of page number to spans on that page.
 
         Returns:
             list[PdfTable]: tables found on the page.
         """
-        with mem_debug(f"page {page.number} - table extraction"):  # type: ignore : missing typing in pymupdf -> Page.number -> int
-            tables = []
-            tables_on_page = self.table_finder.build_tables(page)
-            for _, _, tab_cells in tables_on_page:
-                if page.number not in spans_per_page or tab_cells.shape[0] == 1:  # type: ignore : missing typing in pymupdf -> Page.number -> int
-                    continue  # no spans available, or only one cell -> not a table
-                cells = self._get_table_cells(tab_cells, spans_per_page[page.number])  # type: ignore : missing typing in pymupdf -> Page.number -> int
-                # if at least 50% of cells contain a span
-                if sum(bool(cell.spans) for cell in cells) / len(cells) > 0.5:
-                    tables.append(PdfTable(cells, page.number))  # type: ignore : missing typing in pymupdf -> Page.number -> int
-            return tables
+        tables = []
+        for _, _, tab_cells in tables_on_page:
+            if page_number not in spans_per_page or tab_cells.shape[0] == 1:
+                continue  # no spans available, or only one cell -> not a table
+            cells = self._get_table_cells(tab_cells, spans_per_page[page_number])
+            # if at least 50% of cells contain a span
+            if sum(bool(cell.spans) for cell in cells) / len(cells) > 0.5:
+                tables.append(PdfTable(cells, page_number))
+        return tables
 
     def _get_table_cells(
         self, raw_cells: list[pymupdf.Rect], spans_on_page: list[TextSpan]
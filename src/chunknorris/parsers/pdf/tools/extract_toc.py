@@ -1,14 +1,16 @@
 import re
+from collections import defaultdict
 from itertools import groupby
 
-from thefuzz import fuzz  # type: ignore : no stubs
+import numpy as np
+from rapidfuzz import fuzz, process
 
 from ....decorators.decorators import mem_debug
 from .components import TocTitle
-from .utils import PdfParserState
+from .profiling import PdfProfiling
 
 
-class PdfTocExtraction(PdfParserState):
+class PdfTocExtraction(PdfProfiling):
     """Class intended to be used to extract the table of content
     of a document.
     Intended to be a component inherited by pdfParser => PdfParser(PdfTocExtraction)
@@ -19,17 +21,18 @@ class PdfTocExtraction(PdfParserState):
     _MAX_HEADER_TEXT_LENGTH: int = (
         100  # blocks longer than this are unlikely to be headers
     )
+    _TOC_MATCH_MIN_RATIO: int = 75  # min similarity of a block with a toc title
 
-    # Compiled patterns used to detect header levels from numeric schemas (e.g. 1., 1.1, 1.1.1)
-    _HEADER_PATTERNS: list[tuple[int, re.Pattern[str]]] = [
-        (3, re.compile(r"^(\d+)[\s\.\)]+(\d+)[\s\.\)]+(\d+)")),
-        (2, re.compile(r"^(\d+)[\s\.\)]+(\d+)")),
-        (1, re.compile(r"^(\d+)[\s\.\)]*")),
-    ]
-    # Compiled pattern used to detect table-of-content entries (title + dot leaders + page number)
-    _TOC_PATTERN: re.Pattern[str] = re.compile(
-        r"(.+?)(?:\s+)?[\.\_\-\s….]{5,}(?:\s+)?(?:[pP]\.\s*)?(\d+)"
+    # Compiled pattern used to detect header levels from numeric schemas (e.g. 1., 1.1, 1.1.1).
+    # The level is the number of numbers : "level_2" and "level_3" groups match if the schema has 2 or 3 numbers.
+    _HEADER_SCHEMA_PATTERN: re.Pattern[str] = re.compile(
+        r"^\d+(?P<level_2>[\s\.\)]+\d+(?P<level_3>[\s\.\)]+\d)?)?"
     )
+    # Compiled patterns used to detect table-of-content entries (title + dot leaders + page number).
+    # A line is a toc entry if a run of at least 5 leader characters is followed by the page number,
+    # optionally preceded by "p.".
+    _TOC_LEADERS_PATTERN: re.Pattern[str] = re.compile(r"[\.\_\-\s…]{5,}")
+    _TOC_PAGE_PATTERN: re.Pattern[str] = re.compile(r"(?:[pP]\.\s*)?(\d+)")
 
     @mem_debug("get_toc")
     def get_toc(self) -> list[TocTitle]:
@@ -48,21 +51,25 @@ class PdfTocExtraction(PdfParserState):
         toc_from_metadata = self.get_toc_from_metadata()
         # Run anyway as table of content might also be in document
         # and we want to flag the lines that belong to it
-        toc_from_document = self.get_toc_from_document()
+        with self._profile_stage("toc_from_document"):
+            toc_from_document = self.get_toc_from_document()
 
         toc = None
         if toc_from_metadata:
-            self._set_block_issectiontitle_with_toc(toc_from_metadata)
+            with self._profile_stage("toc_matching"):
+                self._set_block_issectiontitle_with_toc(toc_from_metadata)
             # sometime, the toc in metadata doesn't represent the toc in document.
             # So, if less than half of toc are found in doc, find toc in doc.
             if self.headers_have_been_found(toc_from_metadata):
                 toc = toc_from_metadata
         if toc is None and toc_from_document:
-            self._set_block_issectiontitle_with_toc(toc_from_document)
+            with self._profile_stage("toc_matching"):
+                self._set_block_issectiontitle_with_toc(toc_from_document)
             if self.headers_have_been_found(toc_from_document):
                 toc = toc_from_document
         if toc is None:
-            toc = self._set_block_issectiontitle_with_fontsize()
+            with self._profile_stage("toc_from_fontsize"):
+                toc = self._set_block_issectiontitle_with_fontsize()
 
         return toc or []
 
@@ -115,9 +122,9 @@ class PdfTocExtraction(PdfParserState):
             until_last_match_counter += 1
             if len(toc_titles) > 3 and until_last_match_counter > self._TOC_MAX_GAP:
                 break  # likely we have found a TOC and are now browsing through document
-            match = re.match(self._TOC_PATTERN, line.text)
+            match = self._match_toc_line(line.text)
             # regex may match ZIP codes or phone numbers => check page is less than 3 numbers
-            if match and len(match[2]) < 4:
+            if match and len(match[1]) < 4:
                 until_last_match_counter = 0
                 line.is_toc_element = True
                 # multiline toc title
@@ -125,17 +132,17 @@ class PdfTocExtraction(PdfParserState):
                     not self.lines[i - 1].is_toc_element
                     and self.lines[i - 2].is_toc_element
                 ):
-                    toc_text = self.lines[i - 1].text + match[1]
+                    toc_text = self.lines[i - 1].text + match[0]
                     x_offset = self.lines[i - 1].origin.x  # type: ignore : missing typing in pymupdf | Point.x : float
                     self.lines[i - 1].is_toc_element = True
                 # single line toc title
                 else:
-                    toc_text = match[1]
+                    toc_text = match[0]
                     x_offset = line.origin.x  # type: ignore : missing typing in pymupdf | Point.x : float
                 toc_titles.append(
                     TocTitle(
                         text=toc_text,
-                        page=int(match[2]),
+                        page=int(match[1]),
                         x_offset=int(x_offset),
                         source="regex",
                         source_page=line.page,
@@ -144,6 +151,35 @@ class PdfTocExtraction(PdfParserState):
 
         return toc_titles
 
+    @classmethod
+    def _match_toc_line(cls, text: str) -> tuple[str, str] | None:
+        """Checks whether a line is an entry of a table of content,
+        such as "1. Introduction ........ 4". Runs in linear time, even on
+        long lines full of dots or spaces.
+
+        Args:
+            text (str): the text of the line.
+
+        Returns:
+            tuple[str, str] | None: the title and the page number, or None if
+                the line is not a toc entry.
+        """
+        # the title cannot span several lines
+        max_title_end = text.find("\n")
+        if max_title_end == -1:
+            max_title_end = len(text)
+        for leaders in cls._TOC_LEADERS_PATTERN.finditer(text):
+            title_end = max(leaders.start(), 1)  # the title has at least 1 character
+            if title_end > max_title_end:
+                return None
+            if leaders.end() - title_end < 5:
+                continue
+            page = cls._TOC_PAGE_PATTERN.match(text, leaders.end())
+            if page is not None:
+                return text[:title_end], page[1]
+
+        return None
+
     @staticmethod
     def _infer_level_with_offset(toc_titles: list[TocTitle]) -> list[TocTitle]:
         """Given on a list of toc_tiles found in the document,
@@ -201,38 +237,77 @@ class PdfTocExtraction(PdfParserState):
         Returns:
             int | None: the header level. Returns None if the regex didn't match any level
         """
-        for level, pattern in self._HEADER_PATTERNS:
-            if re.match(pattern, header_text):
-                return level
+        match = self._HEADER_SCHEMA_PATTERN.match(header_text)
+        if match is None:
+            return None
+        if match["level_3"] is not None:
+            return 3
+        if match["level_2"] is not None:
+            return 2
+        return 1
 
     def _set_block_issectiontitle_with_toc(self, toc: list[TocTitle]) -> None:
         """After finding the toc, this modifies
         blocks among self.blocks attributes of the PdfParser
         to set which ones are the section's headers.
+
+        The blocks are indexed by page once. For each title, the blocks of
+        the surrounding pages are first looked up by their first line. If none matches
+        the title, the block with the most similar text is picked, all candidates being
+        scored at once.
         """
+        blocks_per_page: dict[int, list[int]] = defaultdict(list)
+        first_lines_per_page: dict[int, dict[str, int]] = defaultdict(dict)
+        for block_idx, block in enumerate(self.blocks):
+            blocks_per_page[block.page].append(block_idx)
+            first_lines_per_page[block.page].setdefault(
+                block.lines[0].text.lower(), block_idx
+            )
+        # {title page: (indexes of the blocks to consider, their lowered text)}
+        candidates_per_page: dict[int, tuple[list[int], list[str]]] = {}
         for title in toc:
             title_text_lower = title.text.lower()
             pages_to_look_on = range(title.page - 1, title.page + 2)
-            blocks_to_consider = (
-                block for block in self.blocks if block.page in pages_to_look_on
-            )
-            best_ratio, best_block = 0, None
-            for block in blocks_to_consider:
-                block_text_lower = block.text.lower()
-                # if the first line of the block corresponds to the title text -> toc title
-                if block.lines[0].text.lower() == title_text_lower:
-                    block.lines[0].is_toc_element = True
-                    best_ratio = 100
-                    best_block = block
-                    break
-                # else check if title text is similar to block text
-                ratio = fuzz.ratio(title_text_lower, block_text_lower)  # type: ignore : missing typing in fuzz | fuzz.ratio(s1 : str, s2: str) -> int
-                if ratio > best_ratio:
-                    best_ratio = ratio
-                    best_block = block
-            if best_block and best_ratio >= 75:
+            # if the first line of a block corresponds to the title text -> toc title
+            exact_matches = [
+                first_lines_per_page[page][title_text_lower]
+                for page in pages_to_look_on
+                if title_text_lower in first_lines_per_page.get(page, {})
+            ]
+            if exact_matches:
+                best_block = self.blocks[min(exact_matches)]
+                best_block.lines[0].is_toc_element = True
                 title.found = True
                 best_block.section_title = title
+                continue
+            # else check if title text is similar to block text
+            if title.page not in candidates_per_page:
+                block_idxs = sorted(
+                    block_idx
+                    for page in pages_to_look_on
+                    for block_idx in blocks_per_page.get(page, [])
+                )
+                candidates_per_page[title.page] = (
+                    block_idxs,
+                    [self.blocks[block_idx].text.lower() for block_idx in block_idxs],
+                )
+            block_idxs, block_texts_lower = candidates_per_page[title.page]
+            if not block_idxs:
+                continue
+            # ratios are rounded to integers, and ties are won by the first block
+            ratios = np.rint(
+                process.cdist(
+                    [title_text_lower],
+                    block_texts_lower,
+                    scorer=fuzz.ratio,
+                    score_cutoff=self._TOC_MATCH_MIN_RATIO - 1,
+                    dtype=np.float64,
+                )[0]
+            )
+            best_candidate = int(np.argmax(ratios))
+            if ratios[best_candidate] >= self._TOC_MATCH_MIN_RATIO:
+                title.found = True
+                self.blocks[block_idxs[best_candidate]].section_title = title
 
     def _set_block_issectiontitle_with_fontsize(self) -> list[TocTitle]:
         """Uses the fontize attribute of lines to assign
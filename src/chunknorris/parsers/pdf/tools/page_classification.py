@@ -10,13 +10,26 @@ Intended usage::
 
     snapshots = list(parser.classify_pages())          # all parsed pages
     to_embed  = parser.get_images_of_pages_to_embed()  # generator of images needing embedding
+
+To skip the unchanged pages of re-ingested documents, pass a
+``PdfPagePredictionCache`` to ``PdfParser(prediction_cache=...)``.
 """
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Generator
+import hashlib
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from functools import partial
+from typing import TYPE_CHECKING, Generator, Sequence
+
+import numpy as np
+import numpy.typing as npt
+import pymupdf  # type: ignore : no stubs
 
-from .components_ml import PdfPageSnapshot
+from ....ml.pdf_page_classifiers.types import PdfPagePrediction
+from .components_ml import PdfPagePredictionCache, PdfPageSnapshot
 from .utils import PdfParserState
 
 if TYPE_CHECKING:
@@ -25,6 +38,34 @@ if TYPE_CHECKING:
     from ....ml.pdf_page_classifiers.classifier_onnx import PDFPageClassifierONNX
     from ....ml.pdf_page_classifiers.classifier_ov import PDFPageClassifierOV
 
+# Thread rendering the next batch of pages while the current batch is classified.
+# A single thread, shared by all parsers : a pymupdf document must not be used
+# by several threads at once.
+_RENDER_EXECUTOR: ThreadPoolExecutor | None = None
+_RENDER_EXECUTOR_LOCK = threading.Lock()
+
+
+@dataclass
+class _PageBatch:
+    """A batch of pages, ready to be classified."""
+
+    page_numbers: range
+    cache_keys: dict[int, str]  # empty without prediction cache
+    cached_predictions: dict[int, PdfPagePrediction]
+    rendered_pages: list[int]  # pages not found in the cache
+    batch_input: npt.NDArray[np.float32]  # inputs of the rendered pages
+
+
+def _get_render_executor() -> ThreadPoolExecutor:
+    """Get the thread used to render pages, created on first use."""
+    global _RENDER_EXECUTOR  # pylint: disable=global-statement
+    with _RENDER_EXECUTOR_LOCK:
+        if _RENDER_EXECUTOR is None:
+            _RENDER_EXECUTOR = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="chunknorris-render"
+            )
+        return _RENDER_EXECUTOR
+
 
 class PdfPageClassification(PdfParserState):
     """Mixin that adds ML-based page classification to the PDF parser.
@@ -42,6 +83,7 @@ class PdfPageClassification(PdfParserState):
 
     _page_classifier: PDFPageClassifierOV | PDFPageClassifierONNX | None = None
     _ml_enabled: bool = False
+    prediction_cache: PdfPagePredictionCache | None = None
 
     def _load_page_classifier(self) -> None:
         """Load the classifier using the global backend preference.
@@ -66,17 +108,22 @@ class PdfPageClassification(PdfParserState):
 
         Pages are processed in batches of *batch_size* so that peak memory stays
         proportional to the batch rather than the full document.  When *images*
-        is ``None``, pages are rendered on demand via :meth:`_render_page`
-        (provided by ``PdfPlotter`` in the final MRO); images that do not need
-        embedding are released after each batch.
+        is ``None``, pages are rendered straight to the classifier's input size
+        into a preallocated batch, and the snapshots' images are only rendered
+        (via :meth:`_render_page`, provided by ``PdfPlotter`` in the final MRO)
+        when accessed.  The next batch is rendered in a background thread while
+        the current batch is classified; rendering is over before a batch is
+        yielded, so the document can be used between batches.  With a
+        ``prediction_cache``, pages whose content was already classified are
+        neither rendered nor classified.
 
         Args:
             images: Pre-rendered page images to classify.  When ``None``,
                 pages are rendered automatically from the parsed document.
             batch_size: Pages rendered and classified per iteration.  Larger
                 values trade memory for throughput.
-            resolution: Rendering resolution in DPI (ignored when *images*
-                is provided by the caller).
+            resolution: Resolution in DPI of the snapshots' images (ignored when
+                *images* is provided by the caller).
 
         Yields:
             :class:`PdfPageSnapshot` objects in page order.
@@ -109,18 +156,200 @@ class PdfPageClassification(PdfParserState):
             # Render and classify in batches — avoids loading all pages at once.
             end = self.page_end if self.page_end is not None else int(self.document.page_count)  # type: ignore[arg-type]
             page_indices = range(self.page_start, end)
-            for batch_start in range(0, len(page_indices), batch_size):
-                batch_range = page_indices[batch_start : batch_start + batch_size]
-                batch_imgs = [self._render_page(n, resolution) for n in batch_range]  # type: ignore[attr-defined]
-                preds = self._page_classifier.predict(
-                    batch_imgs, batch_size=len(batch_imgs)
+            batches = [
+                page_indices[batch_start : batch_start + batch_size]
+                for batch_start in range(0, len(page_indices), batch_size)
+            ]
+            if not batches:
+                return
+            classifier = self._page_classifier
+            document = self.document
+            size = classifier.image_size
+            # one batch being classified while the next one is rendered
+            buffers = [
+                np.empty((len(batches[0]), 3, size, size), dtype=np.float32)
+                for _ in range(2)
+            ]
+            executor = _get_render_executor()
+            rendering: Future[_PageBatch] = executor.submit(
+                self._prepare_batch, batches[0], buffers[0]
+            )
+            try:
+                for batch_idx, batch_range in enumerate(batches):
+                    batch = rendering.result()
+                    if batch_idx + 1 < len(batches):
+                        # rendered while the current batch is classified
+                        rendering = executor.submit(
+                            self._prepare_batch,
+                            batches[batch_idx + 1],
+                            buffers[(batch_idx + 1) % 2],
+                        )
+                    predictions = batch.cached_predictions.copy()
+                    if batch.rendered_pages:
+                        preds = classifier.predict_input(batch.batch_input)
+                        predictions.update(zip(batch.rendered_pages, preds))
+                    if self.prediction_cache is not None:
+                        self.prediction_cache.set_many(
+                            {
+                                batch.cache_keys[n]: predictions[n]
+                                for n in batch.rendered_pages
+                            }
+                        )
+                    wait([rendering])
+                    for n in batch_range:
+                        yield PdfPageSnapshot(
+                            page_number=n,
+                            predictions=predictions[n],
+                            # bound to this document, that raises once closed
+                            render_image=partial(self._render_document_page, document, n, resolution),  # type: ignore[attr-defined]
+                            from_cache=n in batch.cached_predictions,
+                        )
+            finally:
+                # the document might be closed once the generator is closed
+                wait([rendering])
+
+    def _prepare_batch(
+        self, page_numbers: range, buffer: npt.NDArray[np.float32]
+    ) -> _PageBatch:
+        """Get the cached predictions of a batch of pages, and render the other pages.
+
+        Args:
+            page_numbers: Indices of the pages of the batch.
+            buffer: Float32 array of shape (>= len(page_numbers), 3, image_size, image_size).
+
+        Returns:
+            The batch, ready to be classified.
+        """
+        cache_keys: dict[int, str] = {}
+        cached_predictions: dict[int, PdfPagePrediction] = {}
+        if self.prediction_cache is not None:
+            cache_keys = {n: self._get_prediction_cache_key(n) for n in page_numbers}
+            found = self.prediction_cache.get_many(list(cache_keys.values()))
+            cached_predictions = {
+                n: found[key] for n, key in cache_keys.items() if key in found
+            }
+        rendered_pages = [n for n in page_numbers if n not in cached_predictions]
+
+        return _PageBatch(
+            page_numbers=page_numbers,
+            cache_keys=cache_keys,
+            cached_predictions=cached_predictions,
+            rendered_pages=rendered_pages,
+            batch_input=self._render_pages_to_input(rendered_pages, buffer),
+        )
+
+    def _get_prediction_cache_key(self, page_number: int) -> str:
+        """Get the key of the prediction of a page in the prediction cache.
+        Built from the content of the page (content streams, images, forms, fonts,
+        annotations and geometry), the model variant, its weights and its input settings.
+
+        Args:
+            page_number: Index of the page.
+
+        Returns:
+            The key, as an hexadecimal digest.
+        """
+        classifier = self._page_classifier
+        assert classifier is not None
+        document = self.document
+        page = document.load_page(page_number)  # type: ignore : missing typing in pymupdf
+        digest = hashlib.blake2b(digest_size=20)
+        digest.update(
+            repr(
+                (
+                    classifier.variant,
+                    classifier.weights_digest,
+                    classifier.image_size,
+                    classifier.center_crop,
+                    classifier.threshold,
+                    tuple(page.rect),  # type: ignore : missing typing in pymupdf
+                    page.rotation,  # type: ignore : missing typing in pymupdf
                 )
-                for n, img, pred in zip(batch_range, batch_imgs, preds):  # type: ignore[arg-type]
-                    yield PdfPageSnapshot(
-                        page_number=n,
-                        image=img,
-                        predictions=pred,  # type: ignore[arg-type]
-                    )
+            ).encode()
+        )
+        resources_xrefs = sorted(
+            {xobject[0] for xobject in page.get_xobjects()}  # type: ignore : missing typing in pymupdf
+            | {image[0] for image in page.get_images()}  # type: ignore : missing typing in pymupdf
+        )
+        for xref in [*page.get_contents(), *resources_xrefs]:  # type: ignore : missing typing in pymupdf
+            digest.update(document.xref_stream_raw(xref) or b"")  # type: ignore : missing typing in pymupdf
+        for xref in sorted({font[0] for font in page.get_fonts()}):  # type: ignore : missing typing in pymupdf
+            digest.update(self._get_font_digest(xref))
+        for xref in page.annot_xrefs():  # type: ignore : missing typing in pymupdf
+            digest.update(document.xref_object(xref[0]).encode())  # type: ignore : missing typing in pymupdf
+
+        return digest.hexdigest()
+
+    def _get_font_digest(self, xref: int) -> bytes:
+        """Get the digest of a font of the document, from its dictionary
+        and its embedded program, if any. Computed once per font, as fonts
+        are shared by pages.
+
+        Args:
+            xref: Xref of the font.
+
+        Returns:
+            The digest.
+        """
+        font_digest = self._font_digests.get(xref)
+        if font_digest is None:
+            document = self.document
+            digest = hashlib.blake2b(digest_size=20)
+            digest.update(document.xref_object(xref).encode())  # type: ignore : missing typing in pymupdf
+            digest.update(document.extract_font(xref)[-1] or b"")  # type: ignore : missing typing in pymupdf
+            font_digest = self._font_digests[xref] = digest.digest()
+        return font_digest
+
+    def _render_pages_to_input(
+        self, page_numbers: Sequence[int], buffer: npt.NDArray[np.float32]
+    ) -> npt.NDArray[np.float32]:
+        """Render pages into a preallocated batch of classifier inputs.
+
+        Args:
+            page_numbers: Indices of the pages to render.
+            buffer: Float32 array of shape (>= len(page_numbers), 3, image_size, image_size).
+
+        Returns:
+            The part of *buffer* holding the rendered pages.
+        """
+        for i, page_number in enumerate(page_numbers):
+            self._render_page_to_input(page_number, buffer[i])
+        return buffer[: len(page_numbers)]
+
+    def _render_page_to_input(
+        self, page_number: int, out: npt.NDArray[np.float32]
+    ) -> None:
+        """Render a page straight to the classifier's input size : the center-crop
+        and the resize are done by MuPDF through the clip and the matrix,
+        and the pixmap's samples are normalized without copy into *out*.
+
+        Args:
+            page_number: Index of the page to render.
+            out: Float32 array of shape (3, image_size, image_size) to write to.
+        """
+        classifier = self._page_classifier
+        assert classifier is not None
+        size = classifier.image_size
+        page = self.document.load_page(page_number)  # type: ignore : missing typing in pymupdf
+        rect: pymupdf.Rect = page.rect  # type: ignore : missing typing in pymupdf
+        clip = rect
+        if classifier.center_crop:
+            side = min(rect.width, rect.height)  # type: ignore : missing typing in pymupdf | Rect.width : float
+            x0 = rect.x0 + (rect.width - side) / 2  # type: ignore : missing typing in pymupdf | Rect.x0 : float
+            y0 = rect.y0 + (rect.height - side) / 2  # type: ignore : missing typing in pymupdf | Rect.y0 : float
+            clip = pymupdf.Rect(x0, y0, x0 + side, y0 + side)
+        sx, sy = size / clip.width, size / clip.height  # type: ignore : missing typing in pymupdf | Rect.width : float
+        # translates the clip to the origin, so that the pixmap is size x size
+        matrix = pymupdf.Matrix(sx, 0, 0, sy, -clip.x0 * sx, -clip.y0 * sy)  # type: ignore : missing typing in pymupdf | Rect.x0 : float
+        pix = page.get_pixmap(matrix=matrix, clip=clip, alpha=False)  # type: ignore : missing typing in pymupdf
+        if (pix.width, pix.height) != (size, size):  # type: ignore : missing typing in pymupdf
+            pix = pymupdf.Pixmap(pix, size, size, None)  # type: ignore : missing typing in pymupdf
+        pixels = (
+            np.frombuffer(pix.samples_mv, dtype=np.uint8)  # type: ignore : missing typing in pymupdf
+            .reshape(size, pix.stride)[:, : size * 3]  # type: ignore : missing typing in pymupdf
+            .reshape(size, size, 3)
+        )
+        classifier.pixels_to_input(pixels, out)
 
     def get_images_of_pages_to_embed(
         self,
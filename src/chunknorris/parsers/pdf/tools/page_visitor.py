@@ -0,0 +1,59 @@
+from contextlib import ExitStack
+from dataclasses import dataclass
+from operator import attrgetter
+from typing import Any, Callable
+
+import pymupdf  # type: ignore : no stubs
+
+from ....core.instrumentation import trace
+from .profiling import PdfProfiling
+
+
+@dataclass(frozen=True)
+class PageExtractor:
+    """A function that extracts some content from a page, such as its links,
+    and the stage its time is attributed to.
+    """
+
+    extract: Callable[[pymupdf.Page], Any]
+    # name of the span recording each call, such as "pdf.find_tables"
+    trace_name: str | None = None
+    # profiled stages recording each call, outermost first, such as ("create_spans", "bind_links")
+    profile_stages: tuple[str, ...] = ()
+
+
+class PdfPageVisitor(PdfProfiling):
+    """Tool that loads each page of the document once, and runs on it
+    the extractors registered by the other tools (spans, links, tables...).
+    Meant to be inherited by PdfParser(PdfPageVisitor).
+    """
+
+    def _get_page_extractors(self) -> dict[str, PageExtractor]:
+        """Gets the extractors to run on each page, as {name: extractor}.
+        Tools register their extractors by overriding this method
+        and adding them to the extractors returned by super().
+
+        Returns:
+            dict[str, PageExtractor]: the extractors.
+        """
+        return {"rect": PageExtractor(attrgetter("rect"))}
+
+    def _visit_pages(self) -> None:
+        """Runs the extractors on each page of the page range, in a single pass over the document.
+        The extracted contents are stored in self.pages_content, as {page number: {extractor name: content}}.
+        Each call is recorded under the span and the profiled stages of its extractor,
+        so that the time spent is attributed to the stage the extractor belongs to.
+        """
+        extractors = self._get_page_extractors()
+        self.pages_content = {}
+        for page in self.document.pages(start=self.page_start, stop=self.page_end):  # type: ignore : missing typing in pymupdf -> document.pages() : generator[Page]
+            page_content: dict[str, Any] = {}
+            for name, extractor in extractors.items():
+                with ExitStack() as stack:
+                    if extractor.trace_name is not None:
+                        stack.enter_context(trace(extractor.trace_name))
+                    for stage in extractor.profile_stages:
+                        stack.enter_context(self._profile_stage(stage))
+                    stack.enter_context(self._profile_page(name, page.number))  # type: ignore : missing typing in pymupdf -> page.number: int
+                    page_content[name] = extractor.extract(page)
+            self.pages_content[page.number] = page_content  # type: ignore : missing typing in pymupdf -> page.number: int
@@ -343,5 +343,13 @@ class PdfPlotter(PdfParserState):
 
     def _render_page(self, page_number: int, resolution: int) -> Image.Image:
         """Render a single PDF page to a PIL image."""
-        pix = self.document.load_page(page_number).get_pixmap(dpi=resolution, alpha=False)  # type: ignore
+        return PdfPlotter._render_document_page(self.document, page_number, resolution)  # type: ignore
+
+    @staticmethod
+    def _render_document_page(
+        document: pymupdf.Document, page_number: int, resolution: int
+    ) -> Image.Image:
+        """Render a single page of a given document to a PIL image.
+        Raises a ValueError if the document is closed."""
+        pix = document.load_page(page_number).get_pixmap(dpi=resolution, alpha=False)  # type: ignore
         return Image.frombuffer("RGB", (pix.width, pix.height), pix.samples, "raw", "RGB", 0, 1)  # type: ignore
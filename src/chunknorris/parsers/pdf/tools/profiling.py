@@ -0,0 +1,234 @@
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
+from typing import ContextManager, Generator
+
+import pymupdf  # type: ignore : no stubs
+
+from ....exceptions.exceptions import PdfParserException
+from .utils import PdfParserState
+
+
+@dataclass
+class StageProfile:
+    """Measures of a stage of the parsing. Allocations are in bytes,
+    and only account for memory allocated by python (not by pymupdf's C code).
+    """
+
+    calls: int = 0
+    wall_time: float = 0.0
+    cpu_time: float = 0.0
+    allocated: int = 0  # net allocations, still allocated at the end of the stage
+    peak_allocated: int = 0  # peak allocations during the stage
+
+
+@dataclass
+class PdfProfileReport:
+    """Profile of the parsing of a document, obtained with PdfParser(profile=True).
+    Stages are named after the stages containing them, such as "create_spans/bind_links".
+    """
+
+    stages: dict[str, StageProfile] = field(default_factory=dict)
+    # {page number: {stage: seconds}}
+    page_times: dict[int, dict[str, float]] = field(default_factory=dict)
+
+    def slowest_pages(self, n: int = 5) -> list[tuple[int, float]]:
+        """Gets the pages that took the most time to process.
+
+        Args:
+            n (int, optional): the number of pages to get. Defaults to 5.
+
+        Returns:
+            list[tuple[int, float]]: the page numbers and their processing time in seconds,
+                the slowest first.
+        """
+        page_totals = [
+            (page, sum(stage_times.values()))
+            for page, stage_times in self.page_times.items()
+        ]
+        page_totals.sort(key=lambda item: item[1], reverse=True)
+
+        return page_totals[:n]
+
+    def to_text(self, n_pages: int = 5) -> str:
+        """Formats the report as a human readable text.
+
+        Args:
+            n_pages (int, optional): the number of slowest pages to show. Defaults to 5.
+
+        Returns:
+            str: the report.
+        """
+        lines = [
+            f"{'stage':<40} {'calls':>6} {'wall (s)':>9} {'cpu (s)':>9} {'alloc (MB)':>11} {'peak (MB)':>10}"
+        ]
+        for name, stage in self.stages.items():
+            lines.append(
+                f"{name:<40} {stage.calls:>6} {stage.wall_time:>9.3f} {stage.cpu_time:>9.3f} "
+                f"{stage.allocated / 1e6:>11.2f} {stage.peak_allocated / 1e6:>10.2f}"
+            )
+        if self.page_times:
+            lines.append("")
+            lines.append("Slowest pages:")
+            for page, total_time in self.slowest_pages(n_pages):
+                details = ", ".join(
+                    f"{stage}: {seconds:.3f}s"
+                    for stage, seconds in self.page_times[page].items()
+                )
+                lines.append(f"  page {page:<5} {total_time:.3f}s ({details})")
+
+        return "\n".join(lines)
+
+    def __str__(self) -> str:
+        return self.to_text()
+
+
+@dataclass
+class _StageFrame:
+    name: str  # full name of the stage
+    peak: int  # peak allocations seen by the stage so far, in bytes
+
+
+class PdfProfiler:
+    """Records the wall time, CPU time and python allocations of the stages,
+    and the time spent on each page.
+    """
+
+    def __init__(self) -> None:
+        self.report = PdfProfileReport()
+        # the stages being recorded, innermost last
+        self._stack: list[_StageFrame] = []
+        self._started_tracemalloc = False
+
+    def start(self) -> None:
+        """Starts tracing allocations, if not already traced."""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+
+    def stop(self) -> None:
+        """Stops tracing allocations, if tracing was started by the profiler."""
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    @contextmanager
+    def stage(self, name: str) -> Generator[None, None, None]:
+        """Records a stage. Stages can be nested.
+
+        Args:
+            name (str): the name of the stage.
+        """
+        full_name = f"{self._stack[-1].name}/{name}" if self._stack else name
+        tracing = tracemalloc.is_tracing()
+        mem_start = 0
+        if tracing:
+            mem_start, peak = tracemalloc.get_traced_memory()
+            if self._stack:
+                # the peak is reset below : keep the peak seen by the enclosing stage
+                self._stack[-1].peak = max(self._stack[-1].peak, peak)
+            tracemalloc.reset_peak()
+        # registered before running, so that stages are listed in execution order
+        stage = self.report.stages.setdefault(full_name, StageProfile())
+        frame = _StageFrame(full_name, mem_start)
+        self._stack.append(frame)
+        wall_start, cpu_start = time.perf_counter(), time.process_time()
+        try:
+            yield
+        finally:
+            wall_time = time.perf_counter() - wall_start
+            cpu_time = time.process_time() - cpu_start
+            self._stack.pop()
+            stage.calls += 1
+            stage.wall_time += wall_time
+            stage.cpu_time += cpu_time
+            if tracing:
+                mem_end, peak = tracemalloc.get_traced_memory()
+                peak = max(peak, frame.peak)
+                stage.allocated += mem_end - mem_start
+                stage.peak_allocated = max(stage.peak_allocated, peak - mem_start)
+                if self._stack:
+                    self._stack[-1].peak = max(self._stack[-1].peak, peak)
+
+    @contextmanager
+    def page(self, stage: str, page_number: int) -> Generator[None, None, None]:
+        """Records the time spent on a page by a stage.
+
+        Args:
+            stage (str): the name of the stage.
+            page_number (int): the page number.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            page_times = self.report.page_times.setdefault(page_number, {})
+            page_times[stage] = page_times.get(stage, 0.0) + (
+                time.perf_counter() - start
+            )
+
+
+class PdfProfiling(PdfParserState):
+    """Tool that groups methods related to the profiling of the parsing.
+    Meant to be inherited by PdfParser(PdfProfiling).
+    """
+
+    profile: bool = False
+    profile_report: PdfProfileReport | None = None
+    _profiler: PdfProfiler | None = None
+
+    @contextmanager
+    def _profiling(self) -> Generator[None, None, None]:
+        """Profiles the parsing of a document if profiling is enabled.
+        The report is available in self.profile_report afterwards.
+        """
+        if not self.profile:
+            yield
+            return
+        self._profiler = PdfProfiler()
+        self._profiler.start()
+        try:
+            yield
+        finally:
+            self._profiler.stop()
+            self.profile_report = self._profiler.report
+            self._profiler = None
+
+    def _profile_stage(self, name: str) -> ContextManager[None]:
+        """Records a stage if profiling is enabled."""
+        if self._profiler is None:
+            return nullcontext()
+        return self._profiler.stage(name)
+
+    def _profile_page(self, stage: str, page_number: int) -> ContextManager[None]:
+        """Records the time spent on a page if profiling is enabled."""
+        if self._profiler is None:
+            return nullcontext()
+        return self._profiler.page(stage, page_number)
+
+    def dump_slowest_pages(self, output_filepath: str, n: int = 5) -> list[int]:
+        """Saves the slowest pages of the last parsed document in a new PDF file,
+        to investigate or share them. Requires PdfParser(profile=True).
+
+        Args:
+            output_filepath (str): the path of the PDF file to write.
+            n (int, optional): the number of pages to save. Defaults to 5.
+
+        Returns:
+            list[int]: the numbers of the saved pages, in document order.
+        """
+        if self.profile_report is None:
+            raise PdfParserException(
+                "No profile report available. Parse a document with PdfParser(profile=True) first."
+            )
+        page_numbers = sorted(page for page, _ in self.profile_report.slowest_pages(n))
+        output_document = pymupdf.open()
+        for page_number in page_numbers:
+            output_document.insert_pdf(  # type: ignore : missing typing in pymupdf
+                self.document, from_page=page_number, to_page=page_number
+            )
+        output_document.save(output_filepath)  # type: ignore : missing typing in pymupdf
+        output_document.close()  # type: ignore : missing typing in pymupdf
+
+        return page_numbers
@@ -1,5 +1,5 @@
 from collections import Counter
-from typing import TYPE_CHECKING, Literal
+from typing import TYPE_CHECKING, Any, Literal
 
 import pymupdf  # type: ignore : no stubs
 
@@ -33,11 +33,16 @@ class PdfParserState:
         self.tables: list[PdfTable] = []
         self.main_body_fontsizes: list[float] = []
         self.document_fontsizes: list[float] = []
+        # Contents extracted from each page by PdfPageVisitor, as {page number: {extractor name: content}}
+        self.pages_content: dict[int, dict[str, Any]] = {}
         # Page image cache — populated lazily by get_pages_as_images().
         # Stored here so cleanup_memory() can release them and PdfPageClassification
         # can reference the same objects without duplication.
         self._page_images: list[PILImage] | None = None
         self._page_images_resolution: int = 100
+        # Digests of the fonts of the document, as {xref: digest}.
+        # Fonts are shared by pages, so each is hashed once for the prediction cache keys.
+        self._font_digests: dict[int, bytes] = {}
 
     @property
     def document(self) -> pymupdf.Document:
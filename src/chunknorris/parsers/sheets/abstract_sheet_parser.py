@@ -1,9 +1,9 @@
-import re
-from typing import Generic
+from typing import Generic, Iterable, Iterator
 
+import numpy as np
 import pandas as pd
 
-from ...core.components import MarkdownDoc
+from ...core.components import MarkdownDoc, MarkdownLine
 from ..abstract_parser import AbstractParser, InputT
 
 
@@ -14,12 +14,12 @@ class AbstractSheetParser(AbstractParser[InputT], Generic[InputT]):
 
     @staticmethod
     def convert_df_to_markdown_table(df: pd.DataFrame) -> str:
-        """Converts a DataFrame to a markdown-formatted table.
-        Pre-process:
-        - Remove \\n in text columns
-        Post-process:
-        - Replace runs of 3+ spaces with 2 spaces.
-        - Collapse separator rows to exactly `---`.
+        """Converts a DataFrame to a compact markdown-formatted table.
+        Rows are built column-wise from the columns' values, without padding:
+        - \\n are replaced by spaces and pipes are escaped.
+        - Floats are formatted with 6 significant digits (like tabulate does).
+        - Missing values (None, NaN) of non-numeric columns are empty cells.
+        - Numeric columns are right-aligned (`---:`), others left-aligned (`:---`).
 
         Args:
             df (pd.DataFrame): the dataframe to convert.
@@ -27,17 +27,84 @@ class AbstractSheetParser(AbstractParser[InputT], Generic[InputT]):
         Returns:
             str: a markdown formatted table.
         """
-        df = df.copy()
-        dtypes = df.apply(  # type: ignore | x: pd.Series[Any] -> pd.Series[str]
-            lambda x: pd.api.types.infer_dtype(x, skipna=True)  # type: ignore
-        )
-        string_cols = dtypes[dtypes == "string"].index  # type: ignore
-        df[string_cols] = df[string_cols].apply(lambda x: x.str.replace("\n", " "))  # type: ignore
-        md_string = df.to_markdown(index=False)
-        md_string = re.sub(r"\s{3,}", "  ", md_string)
-        md_string = re.sub(r"-{3,}", "---", md_string)
-
-        return md_string
+        if df.columns.empty:
+            return ""
+        header: list[str] = []
+        separator: list[str] = []
+        columns: list[pd.Series] = []
+        for col_name, col in df.items():
+            values, is_numeric = AbstractSheetParser._format_column(col)
+            header.append(AbstractSheetParser._escape_cell(str(col_name)))
+            separator.append("---:" if is_numeric else ":---")
+            columns.append(values)
+        lines = [
+            "| " + " | ".join(header) + " |",
+            "|" + "|".join(separator) + "|",
+        ]
+        if not df.empty:
+            # others are passed as arrays so that no index alignment is performed
+            rows = columns[0].str.cat(  # type: ignore | missing typing in pandas
+                [values.to_numpy() for values in columns[1:]], sep=" | "
+            )
+            lines.extend(("| " + rows + " |").tolist())  # type: ignore | missing typing in pandas
+
+        return "\n".join(lines)
+
+    @staticmethod
+    def _format_column(col: pd.Series) -> tuple[pd.Series, bool]:
+        """Formats the values of a column as markdown table cells.
+
+        Args:
+            col (pd.Series): the column.
+
+        Returns:
+            tuple[pd.Series, bool]: the formatted values,
+                and whether the column holds numbers.
+        """
+        is_bool = pd.api.types.is_bool_dtype(col)
+        if is_bool or pd.api.types.is_integer_dtype(col):
+            return AbstractSheetParser._blank_na(col, col.astype(str)), not is_bool
+        if pd.api.types.is_float_dtype(col):
+            values = np.char.mod("%g", col.to_numpy(dtype=float, na_value=np.nan))
+            values = pd.Series(values, index=col.index, dtype=object)
+            return AbstractSheetParser._blank_na(col, values), True
+        # missing values are empty cells, as with tabulate
+        values = col.astype(str).mask(col.isna(), "")
+        non_null = col.dropna()
+        match pd.api.types.infer_dtype(non_null, skipna=True):
+            case "integer" | "floating" | "mixed-integer-float" | "decimal":
+                is_numeric = True
+            case "string":
+                is_numeric = bool(pd.to_numeric(non_null, errors="coerce").notna().all())  # type: ignore | missing typing in pandas
+            case _:
+                is_numeric = False
+        if values.str.contains("[\n|]", regex=True).any():  # type: ignore | missing typing in pandas
+            values = values.str.replace("\n", " ", regex=False).str.replace(
+                "|", "\\|", regex=False
+            )
+        return values, is_numeric
+
+    @staticmethod
+    def _blank_na(col: pd.Series, values: pd.Series) -> pd.Series:
+        """Empties the cells of the pd.NA values of nullable dtypes,
+        such as Int64, Float64 or boolean.
+
+        Args:
+            col (pd.Series): the column.
+            values (pd.Series): the formatted values of the column.
+
+        Returns:
+            pd.Series: the formatted values, with empty cells where col is pd.NA.
+        """
+        if isinstance(col.dtype, np.dtype):
+            # numpy dtypes have no pd.NA, NaN floats are rendered as "nan"
+            return values
+        return values.mask(col.isna(), "")
+
+    @staticmethod
+    def _escape_cell(text: str) -> str:
+        """Makes a text fit in a single markdown table cell."""
+        return text.replace("\n", " ").replace("|", "\\|")
 
     @staticmethod
     def convert_df_to_json_lines(df: pd.DataFrame) -> str:
@@ -62,14 +129,55 @@ class AbstractSheetParser(AbstractParser[InputT], Generic[InputT]):
         Returns:
             MarkdownDoc: the resulting document.
         """
+        md_string = AbstractSheetParser._render_df(df, output_format)
+        return MarkdownDoc.from_string(md_string)
+
+    @staticmethod
+    def _iter_dfs_lines(
+        dfs: Iterable[pd.DataFrame], output_format: str
+    ) -> Iterator[MarkdownLine]:
+        """Renders DataFrames one after the other and yields their lines.
+        Used to stream large sheets read by batches: only one batch is held in memory.
+        With "markdown_table", each batch is rendered as a table
+        with its own header, tables being separated by an empty line.
+
+        Args:
+            dfs (Iterable[pd.DataFrame]): the dataframes to convert.
+            output_format (str): either "markdown_table" or "json_lines".
+
+        Yields:
+            MarkdownLine: the lines of the resulting document.
+        """
+        line_idx = 0
+        for df in dfs:
+            if df.empty:
+                continue
+            md_string = AbstractSheetParser._render_df(df, output_format)
+            if output_format == "markdown_table" and line_idx:
+                yield MarkdownLine(text="", line_idx=line_idx)
+                line_idx += 1
+            for text in md_string.rstrip("\n").split("\n"):
+                yield MarkdownLine(text=text, line_idx=line_idx)
+                line_idx += 1
+
+    @staticmethod
+    def _render_df(df: pd.DataFrame, output_format: str) -> str:
+        """Renders a DataFrame to a string using the given output format.
+
+        Args:
+            df (pd.DataFrame): the dataframe to convert.
+            output_format (str): either "markdown_table" or "json_lines".
+
+        Returns:
+            str: the rendered dataframe.
+        """
         match output_format:
             case "markdown_table":
-                md_string = AbstractSheetParser.convert_df_to_markdown_table(df)
+                return AbstractSheetParser.convert_df_to_markdown_table(df)
             case "json_lines":
-                md_string = AbstractSheetParser.convert_df_to_json_lines(df)
+                return AbstractSheetParser.convert_df_to_json_lines(df)
             case _:
                 raise ValueError(
                     f"Invalid value for argument 'output_format': expected one of "
                     f"['markdown_table', 'json_lines']. Got '{output_format}'."
                 )
-        return MarkdownDoc.from_string(md_string)
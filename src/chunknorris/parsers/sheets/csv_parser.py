@@ -1,10 +1,10 @@
 import csv
 from io import StringIO
-from typing import Literal
+from typing import Iterator, Literal
 
 import pandas as pd
 
-from ...core.components import MarkdownDoc
+from ...core.components import MarkdownDoc, MarkdownLine
 from .abstract_sheet_parser import AbstractSheetParser
 
 _VALID_OUTPUT_FORMATS = ("markdown_table", "json_lines")
@@ -18,6 +18,7 @@ class CSVParser(AbstractSheetParser[str]):
         csv_delimiter: str | None = None,
         output_format: Literal["markdown_table", "json_lines"] = "json_lines",
         n_sample_lines: int = 5,
+        chunksize: int | None = None,
     ) -> None:
         """Initializes a CSV parser.
 
@@ -31,6 +32,11 @@ class CSVParser(AbstractSheetParser[str]):
                 Defaults to "json_lines".
             n_sample_lines (int, optional): Number of lines sampled for delimiter detection.
                 Only used when csv_delimiter is None. Defaults to 5.
+            chunksize (int | None, optional): If set, files are read and rendered by batches
+                of chunksize rows, so that memory stays flat regardless of the file size.
+                With "markdown_table", each batch is a table with the column headers repeated.
+                Use iter_file_lines() to consume the lines without holding the whole document.
+                If None, the whole file is read at once. Defaults to None.
         """
         if output_format not in _VALID_OUTPUT_FORMATS:
             raise ValueError(
@@ -40,6 +46,7 @@ class CSVParser(AbstractSheetParser[str]):
         self.csv_delimiter = csv_delimiter
         self.output_format = output_format
         self.n_sample_lines = n_sample_lines
+        self.chunksize = chunksize
 
     def parse_file(self, filepath: str) -> MarkdownDoc:
         """Parses a CSV file to a MarkdownDoc.
@@ -50,6 +57,8 @@ class CSVParser(AbstractSheetParser[str]):
         Returns:
             MarkdownDoc: the parsed document.
         """
+        if self.chunksize is not None:
+            return MarkdownDoc(content=list(self.iter_file_lines(filepath)))
         if not filepath.lower().endswith(".csv"):
             raise ValueError("Only .csv files can be passed to CSVParser.")
         delimiter = self.csv_delimiter or self._detect_delimiter_from_file(
@@ -58,6 +67,26 @@ class CSVParser(AbstractSheetParser[str]):
         df = pd.read_csv(filepath, delimiter=delimiter)  # type: ignore | missing typing in pandas
         return self._df_to_markdown_doc(df, self.output_format)
 
+    def iter_file_lines(self, filepath: str) -> Iterator[MarkdownLine]:
+        """Streams a CSV file: reads it by batches of chunksize rows
+        (10 000 if chunksize is None) and yields the lines of each rendered batch.
+
+        Args:
+            filepath (str): path to the .csv file.
+
+        Yields:
+            MarkdownLine: the lines of the parsed document.
+        """
+        if not filepath.lower().endswith(".csv"):
+            raise ValueError("Only .csv files can be passed to CSVParser.")
+        delimiter = self.csv_delimiter or self._detect_delimiter_from_file(
+            filepath, self.n_sample_lines
+        )
+        with pd.read_csv(  # type: ignore | missing typing in pandas
+            filepath, delimiter=delimiter, chunksize=self.chunksize or 10_000
+        ) as reader:
+            yield from self._iter_dfs_lines(reader, self.output_format)
+
     def parse_string(self, string: str) -> MarkdownDoc:
         """Parses a CSV-formatted string to a MarkdownDoc.
 
@@ -1,12 +1,19 @@
+from concurrent.futures import ProcessPoolExecutor
 from io import BytesIO
+from itertools import chain, islice, repeat
 from pathlib import Path
-from typing import Literal
+from typing import Any, Iterator, Literal
 
+import openpyxl
 import pandas as pd
+from pandas.io.parsers import TextParser
 
-from ...core.components import MarkdownDoc
+from ...core.components import MarkdownDoc, MarkdownLine
 from .abstract_sheet_parser import AbstractSheetParser
 
+_VALID_ENGINES = ("pandas", "streaming")
+_STREAMING_SUFFIXES = (".xlsx", ".xlsm")
+
 
 class ExcelParser(AbstractSheetParser[bytes]):
     """Parser for spreadsheets, such as Excel workbooks (.xslx). For a list of handled filetypes,
@@ -15,6 +22,9 @@ class ExcelParser(AbstractSheetParser[bytes]):
     def __init__(
         self,
         output_format: Literal["markdown_table", "json_lines", "auto"] = "auto",
+        engine: Literal["pandas", "streaming"] = "pandas",
+        batch_size: int = 10_000,
+        max_workers: int = 1,
     ) -> None:
         """Initializes an Excel parser
 
@@ -24,8 +34,25 @@ class ExcelParser(AbstractSheetParser[bytes]):
                 - json_lines : each row of the table will be output as a JSON line. Better for chunking as headers are preserved.
                 - auto : will detect which format is the more suitable. CSV-like sheet will be converset to JSON lines.
                 Defaults to "auto".
+            engine (Literal["pandas", "streaming"], optional): how the workbook is read.
+                - pandas : every sheet is loaded at once with pandas.read_excel().
+                - streaming : (.xlsx and .xlsm only) sheets are read row by row with openpyxl in read-only mode,
+                  and converted by batches of batch_size rows, so that sheets are never fully loaded.
+                  With "auto" output format, the format of a sheet is determined on its first batch.
+                Defaults to "pandas".
+            batch_size (int, optional): number of rows converted at once with the streaming engine. Defaults to 10_000.
+            max_workers (int, optional): number of worker processes converting sheets in parallel
+                with the streaming engine. Sheets are output in workbook order. Defaults to 1.
         """
+        if engine not in _VALID_ENGINES:
+            raise ValueError(
+                f"Invalid value for argument 'engine': expected one of "
+                f"{list(_VALID_ENGINES)}. Got '{engine}'."
+            )
         self.output_format = output_format
+        self.engine = engine
+        self.batch_size = batch_size
+        self.max_workers = max_workers
 
     def parse_file(self, filepath: str) -> MarkdownDoc:
         """Parses a excel-like file to markdown.
@@ -36,6 +63,13 @@ class ExcelParser(AbstractSheetParser[bytes]):
         Returns:
             MarkdownDoc: the markdown formatted excel file.
         """
+        if self.engine == "streaming":
+            if Path(filepath).suffix.lower() not in _STREAMING_SUFFIXES:
+                raise ValueError(
+                    f"ExcelParser's streaming engine cannot parse {Path(filepath).suffix.lower()} files."
+                )
+            return MarkdownDoc(content=list(self.iter_workbook_lines(filepath)))
+
         sheets = self.read_file(filepath)
         md_string = self.convert_sheets_to_output_format(sheets)
 
@@ -50,6 +84,9 @@ class ExcelParser(AbstractSheetParser[bytes]):
         Returns:
             MarkdownDoc: the markdown formatted excel file
         """
+        if self.engine == "streaming":
+            return MarkdownDoc(content=list(self.iter_workbook_lines(string)))
+
         sheets = pd.read_excel(BytesIO(string), sheet_name=None)  # type: ignore | missing typing in pandas.
         md_string = self.convert_sheets_to_output_format(sheets)
 
@@ -89,26 +126,148 @@ class ExcelParser(AbstractSheetParser[bytes]):
         Returns:
             str: the formatted string
         """
-        output_string = ""
+        output_parts: list[str] = []
 
         for sheet_name, df in sheets.items():
-            output_string += f"## {sheet_name}\n\n"
-
-            format_to_use = self.output_format
-            if self.output_format == "auto":
-                format_to_use = self._determine_best_format(df)
-
-            match format_to_use:
-                case "markdown_table":
-                    output_string += self.convert_df_to_markdown_table(df) + "\n\n"
-                case "json_lines":
-                    output_string += self.convert_df_to_json_lines(df) + "\n\n"
-                case _:
-                    raise ValueError(
-                        f"Invalid value for argument 'output_format': expected one of ['markdown_table', 'json_lines']. Got '{format_to_use}'."
-                    )
-
-        return output_string
+            output_parts.append(f"## {sheet_name}\n\n")
+            output_parts.append(self._render_df(df, self._get_format_to_use(df)))
+            output_parts.append("\n\n")
+
+        return "".join(output_parts)
+
+    def convert_workbook_streaming(self, file: str | bytes) -> str:
+        """Converts a workbook to the specified output format, reading
+        its sheets row by row. If max_workers > 1, sheets are converted
+        in parallel worker processes.
+
+        Args:
+            file (str | bytes): the path to a .xlsx/.xlsm file, or its content as bytes.
+
+        Returns:
+            str: the formatted string
+        """
+        return "\n".join(line.text for line in self.iter_workbook_lines(file))
+
+    def iter_workbook_lines(self, file: str | bytes) -> Iterator[MarkdownLine]:
+        """Streams a workbook: reads its sheets row by row, and yields the lines
+        of each batch of batch_size rows as soon as it is rendered.
+        If max_workers > 1, sheets are converted in parallel worker processes,
+        each sheet being held in memory until it is yielded.
+
+        Args:
+            file (str | bytes): the path to a .xlsx/.xlsm file, or its content as bytes.
+
+        Yields:
+            MarkdownLine: the lines of the parsed document.
+        """
+        workbook = openpyxl.load_workbook(
+            BytesIO(file) if isinstance(file, bytes) else file,
+            read_only=True,
+            data_only=True,
+        )
+        sheet_names = workbook.sheetnames
+        workbook.close()
+
+        if self.max_workers > 1 and len(sheet_names) > 1:
+            with ProcessPoolExecutor(
+                max_workers=min(self.max_workers, len(sheet_names))
+            ) as executor:
+                sheets_texts: Iterator[list[str]] = executor.map(
+                    self._convert_sheet_streaming, repeat(file), sheet_names
+                )
+                texts = chain.from_iterable(sheets_texts)
+                yield from self._number_lines(texts)
+        else:
+            texts = chain.from_iterable(
+                self._iter_sheet_texts(file, sheet_name) for sheet_name in sheet_names
+            )
+            yield from self._number_lines(texts)
+
+    @staticmethod
+    def _number_lines(texts: Iterator[str]) -> Iterator[MarkdownLine]:
+        for line_idx, text in enumerate(texts):
+            yield MarkdownLine(text=text, line_idx=line_idx)
+
+    def _convert_sheet_streaming(self, file: str | bytes, sheet_name: str) -> list[str]:
+        """Converts one sheet of a workbook in a worker process.
+
+        Args:
+            file (str | bytes): the path to a .xlsx/.xlsm file, or its content as bytes.
+            sheet_name (str): the name of the sheet to convert.
+
+        Returns:
+            list[str]: the lines of the formatted sheet, with its title.
+        """
+        return list(self._iter_sheet_texts(file, sheet_name))
+
+    def _iter_sheet_texts(self, file: str | bytes, sheet_name: str) -> Iterator[str]:
+        """Converts one sheet of a workbook batch by batch, with _iter_dfs_lines().
+        The output format of the sheet is determined on its first batch.
+
+        Args:
+            file (str | bytes): the path to a .xlsx/.xlsm file, or its content as bytes.
+            sheet_name (str): the name of the sheet to convert.
+
+        Yields:
+            str: the lines of the formatted sheet, with its title.
+        """
+        yield f"## {sheet_name}"
+        yield ""
+        workbook = openpyxl.load_workbook(
+            BytesIO(file) if isinstance(file, bytes) else file,
+            read_only=True,
+            data_only=True,
+        )
+        try:
+            batches = self._iter_sheet_batches(workbook[sheet_name])
+            first_batch = next(batches, None)
+            if first_batch is not None:
+                dfs = chain([first_batch], batches)
+                format_to_use = self._get_format_to_use(first_batch)
+                for line in self._iter_dfs_lines(dfs, format_to_use):
+                    yield line.text
+        finally:
+            workbook.close()
+        yield ""
+
+    def _iter_sheet_batches(self, worksheet: Any) -> Iterator[pd.DataFrame]:
+        """Reads a read-only worksheet by batches of batch_size rows.
+        Cells are converted the same way pandas.read_excel() does,
+        the first row being used as header for every batch.
+
+        Args:
+            worksheet (Any): the openpyxl read-only worksheet.
+
+        Yields:
+            pd.DataFrame: the batches of the sheet.
+        """
+        rows = (
+            ["" if value is None else value for value in row]
+            for row in worksheet.iter_rows(values_only=True)
+        )
+        # blank rows are skipped, so the header is the first non-blank row
+        header = next((row for row in rows if any(value != "" for value in row)), None)
+        if header is None:
+            return
+        while batch := list(islice(rows, self.batch_size)):
+            df = TextParser([header] + batch, header=0).read()  # type: ignore | missing typing in pandas
+            if not df.empty:
+                yield df
+
+    def _get_format_to_use(
+        self, df: pd.DataFrame
+    ) -> Literal["markdown_table", "json_lines"]:
+        """Gets the output format to use for a sheet, resolving the "auto" format.
+
+        Args:
+            df (pd.DataFrame): the sheet's dataframe.
+
+        Returns:
+            Literal["markdown_table", "json_lines"]: the format to use.
+        """
+        if self.output_format == "auto":
+            return self._determine_best_format(df)
+        return self.output_format
 
     def _determine_best_format(
         self, df: pd.DataFrame
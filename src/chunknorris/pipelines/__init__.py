@@ -1,3 +1,33 @@
+# Pipelines are imported lazily : importing one pipeline
+# must not pull the parsers (and heavy dependencies) of the others
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from .abstract_pipeline import AbstractPipeline
 from .base_pipeline import BasePipeline
-from .wikit_pipeline import WikitJsonPipeline
+
+if TYPE_CHECKING:
+    from .async_pipeline import AsyncPipeline
+    from .corpus_pipeline import CorpusPipeline
+    from .wikit_pipeline import WikitJsonPipeline
+
+_LAZY_IMPORTS = {
+    "AsyncPipeline": ".async_pipeline",
+    "CorpusPipeline": ".corpus_pipeline",
+    "WikitJsonPipeline": ".wikit_pipeline",
+}
+
+__all__ = ["AbstractPipeline", "BasePipeline", *_LAZY_IMPORTS]
+
+
+# module __getattr__ and __dir__ are dunder names set by PEP 562
+def __getattr__(name: str) -> Any:  # pylint: disable=invalid-name
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_LAZY_IMPORTS[name], __name__), name)
+    globals()[name] = value  # cache, so that __getattr__ is called once per name
+    return value
+
+
+def __dir__() -> list[str]:  # pylint: disable=invalid-name
+    return sorted(__all__)
@@ -0,0 +1,282 @@
+import asyncio
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from types import TracebackType
+from typing import Any, Callable
+
+from ..chunkers.abstract_chunker import AbstractChunker
+from ..core.components import Chunk
+from ..core.instrumentation import SpanRecord
+from ..core.logger import LOGGER
+from ..parsers.abstract_parser import AnyParser
+from .corpus_pipeline import CorpusPipeline
+from .workers import (
+    chunk_bytes_in_worker,
+    chunk_file_in_worker,
+    get_worker_result,
+    init_worker,
+    submit_to_worker,
+)
+
+
+class AsyncPipeline:
+    """Asyncio-native pipeline, meant to be used in async services.
+    Files are dispatched to a parser based on their extension (see CorpusPipeline),
+    and parsed and chunked in a bounded pool of worker processes so that the event loop is never blocked.
+
+    - Concurrency can be limited per file type (e.g. PDFs, that might need OCR, are heavier than markdown).
+      Documents waiting for a slot of their file type are not admitted yet,
+      so that they do not hold back the documents of the other types.
+    - At most max_pending documents are admitted at once: further calls wait for a slot (back-pressure).
+    - Each document can be given a timeout, that includes the time spent waiting for a slot.
+      If a call times out or is cancelled, the document is dropped if it has not started yet.
+      If it has started, it cannot be interrupted : it keeps its worker (and its slots) until it is done,
+      so a document that always times out should be rejected upstream rather than retried.
+    - If a worker process dies (out of memory, crash of a native library...),
+      the documents it was handling fail and the pool of workers is restarted.
+
+    Use it as an async context manager so that the worker processes are shut down:
+    ```
+    async with AsyncPipeline(MarkdownChunker()) as pipeline:
+        chunks = await pipeline.chunk_file("file.pdf")
+    ```
+    """
+
+    def __init__(
+        self,
+        chunker: AbstractChunker,
+        *,
+        parsers: dict[str, AnyParser] | None = None,
+        max_workers: int | None = None,
+        concurrency_limits: dict[str, int] | None = None,
+        max_pending: int = 100,
+        timeout: float | None = None,
+    ) -> None:
+        """Initializes an async pipeline.
+
+        Args:
+            chunker (AbstractChunker): the chunker to use for all files.
+            parsers (dict[str, AnyParser] | None, optional): the parser to use for each file extension,
+                such as {".pdf": PdfParser()}. If None, uses the default parsers of CorpusPipeline.
+                Defaults to None.
+            max_workers (int | None, optional): number of worker processes.
+                If None, uses all CPUs. Defaults to None.
+            concurrency_limits (dict[str, int] | None, optional): maximum number of documents
+                processed at once for some file extensions, such as {".pdf": 2}.
+                Other extensions are only limited by the number of workers. Defaults to None.
+            max_pending (int, optional): maximum number of documents admitted at once,
+                running or queued. Further calls wait until a document is done. Defaults to 100.
+            timeout (float | None, optional): default timeout per document, in seconds,
+                from the call to the result, waiting for slots included.
+                If None, documents have no timeout. Defaults to None.
+        """
+        self.pipeline = CorpusPipeline(chunker, parsers)
+        self.max_workers = max_workers
+        self.concurrency_limits = {
+            ext.lower(): limit for ext, limit in (concurrency_limits or {}).items()
+        }
+        self.max_pending = max_pending
+        self.timeout = timeout
+        self._executor: ProcessPoolExecutor | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._pending: asyncio.Semaphore | None = None
+        self._limits: dict[str, asyncio.Semaphore] = {}
+
+    async def __aenter__(self) -> "AsyncPipeline":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.shutdown()
+
+    def shutdown(self) -> None:
+        """Shuts down the worker processes. Documents that have not started are cancelled."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    async def chunk_file(
+        self, filepath: str, timeout: float | None = None
+    ) -> list[Chunk]:
+        """Parses and chunks a file in a worker process.
+
+        Args:
+            filepath (str): the path to the file. Its extension determines the parser.
+            timeout (float | None, optional): timeout in seconds.
+                If None, uses the pipeline's timeout. Defaults to None.
+
+        Raises:
+            TimeoutError: if the document is not chunked before the timeout.
+            BrokenProcessPool: if a worker process died while chunking the document.
+                The worker processes are restarted.
+
+        Returns:
+            list[Chunk]: the list of chunks.
+        """
+        fileext = os.path.splitext(filepath)[1].lower()
+        return await self._run(fileext, timeout, chunk_file_in_worker, filepath)
+
+    async def chunk_bytes(
+        self, content: bytes, fileext: str, timeout: float | None = None
+    ) -> list[Chunk]:
+        """Parses and chunks the content of a file in a worker process,
+        such as an uploaded file.
+
+        Args:
+            content (bytes): the content of the file.
+            fileext (str): the extension of the file, such as ".pdf". Determines the parser.
+            timeout (float | None, optional): timeout in seconds.
+                If None, uses the pipeline's timeout. Defaults to None.
+
+        Raises:
+            TimeoutError: if the document is not chunked before the timeout.
+            BrokenProcessPool: if a worker process died while chunking the document.
+                The worker processes are restarted.
+
+        Returns:
+            list[Chunk]: the list of chunks.
+        """
+        fileext = fileext.lower() if fileext.startswith(".") else f".{fileext.lower()}"
+        return await self._run(
+            fileext, timeout, chunk_bytes_in_worker, content, fileext
+        )
+
+    async def _run(
+        self,
+        fileext: str,
+        timeout: float | None,
+        func: Callable[..., list[Chunk]],
+        *args: Any,
+    ) -> list[Chunk]:
+        """Runs a task in the worker processes, respecting the
+        admission and per-extension limits.
+
+        Args:
+            fileext (str): the extension of the document.
+            timeout (float | None): timeout in seconds. If None, uses the pipeline's timeout.
+            func (Callable[..., list[Chunk]]): the function to run in a worker.
+            *args (Any): the arguments of the function.
+
+        Returns:
+            list[Chunk]: the result of the function.
+        """
+        if fileext not in self.pipeline.parsers:
+            raise ValueError(
+                f"No parser available for {fileext} files. Handled extensions are: {list(self.pipeline.parsers)}."
+            )
+        self._bind_to_running_loop()
+        # the admission is within the deadline : waiting for a slot counts in the latency
+        return await asyncio.wait_for(
+            self._admit_and_run(fileext, func, *args),
+            timeout if timeout is not None else self.timeout,
+        )
+
+    async def _admit_and_run(
+        self, fileext: str, func: Callable[..., list[Chunk]], *args: Any
+    ) -> list[Chunk]:
+        """Waits for a slot of the file type, then for an admission slot,
+        and runs the task in the worker processes.
+
+        Args:
+            fileext (str): the extension of the document.
+            func (Callable[..., list[Chunk]]): the function to run in a worker.
+            *args (Any): the arguments of the function.
+
+        Returns:
+            list[Chunk]: the result of the function.
+        """
+        assert self._pending is not None
+        # the slot of the file type is taken first, so that documents waiting
+        # for it do not hold admission slots needed by other file types
+        semaphores = [self._pending]
+        if fileext in self._limits:
+            semaphores.insert(0, self._limits[fileext])
+
+        acquired: list[asyncio.Semaphore] = []
+        try:
+            for semaphore in semaphores:
+                await semaphore.acquire()
+                acquired.append(semaphore)
+            executor = self._get_executor()
+            try:
+                future = submit_to_worker(executor, func, *args)
+            except BrokenProcessPool:
+                # broken by another document : this one can run in the new pool
+                self._restart_executor(executor)
+                executor = self._get_executor()
+                future = submit_to_worker(executor, func, *args)
+        except BaseException:
+            AsyncPipeline._release(acquired)
+            raise
+
+        # slots are released when the task is really done, not when the caller gives up
+        loop = asyncio.get_running_loop()
+
+        def release_slots(_: Future[tuple[list[Chunk], list[SpanRecord]]]) -> None:
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(AsyncPipeline._release, semaphores)
+
+        future.add_done_callback(release_slots)
+        try:
+            result = await asyncio.shield(asyncio.wrap_future(future))
+        except asyncio.CancelledError:
+            # only cancels the task if it has not started
+            if not future.cancel():
+                LOGGER.warning(
+                    "Chunking of a %s document given up, but it keeps its worker busy until it is done.",
+                    fileext,
+                )
+            raise
+        except BrokenProcessPool:
+            self._restart_executor(executor)
+            raise
+
+        return get_worker_result(result)
+
+    @staticmethod
+    def _release(semaphores: list[asyncio.Semaphore]) -> None:
+        for semaphore in semaphores:
+            semaphore.release()
+
+    def _bind_to_running_loop(self) -> None:
+        """(Re)creates the semaphores if the pipeline is used from a new event loop,
+        as asyncio primitives cannot be shared between loops.
+        """
+        loop = asyncio.get_running_loop()
+        if loop is self._loop:
+            return
+        self._loop = loop
+        self._pending = asyncio.Semaphore(self.max_pending)
+        self._limits = {
+            ext: asyncio.Semaphore(limit)
+            for ext, limit in self.concurrency_limits.items()
+        }
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Gets the pool of worker processes, starting it if needed."""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                initializer=init_worker,
+                initargs=(self.pipeline,),
+            )
+        return self._executor
+
+    def _restart_executor(self, broken_executor: ProcessPoolExecutor) -> None:
+        """Drops the pool of worker processes after one of them died : a new one
+        is started by the next call. Documents that fail at the same time
+        on the same pool only restart it once.
+
+        Args:
+            broken_executor (ProcessPoolExecutor): the pool that was found broken.
+        """
+        if self._executor is not broken_executor:
+            return
+        LOGGER.error("A worker process died. Restarting the worker processes.")
+        broken_executor.shutdown(wait=False, cancel_futures=True)
+        self._executor = None
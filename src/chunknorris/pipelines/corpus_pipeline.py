@@ -0,0 +1,352 @@
+import os
+from argparse import ArgumentParser
+from typing import Any, Iterator
+
+from ..chunkers.abstract_chunker import AbstractChunker
+from ..chunkers.markdown_chunker import MarkdownChunker
+from ..core.components import Chunk
+from ..core.instrumentation import trace
+from ..core.logger import LOGGER
+from ..core.writers import JsonLinesWriter
+from ..parsers.abstract_parser import AnyParser
+from .workers import map_in_workers
+
+# Rough processing cost of a PDF page, expressed in bytes of other file types.
+# Used to schedule the biggest files first.
+PDF_PAGE_COST = 100_000
+
+
+class CorpusPipeline:
+    """Chunks a corpus of files of mixed types (PDF, DOCX, HTML, CSV, notebooks...).
+    Each file is dispatched to a parser based on its extension.
+    """
+
+    parsers: dict[str, AnyParser]
+    chunker: AbstractChunker
+
+    def __init__(
+        self,
+        chunker: AbstractChunker,
+        parsers: dict[str, AnyParser] | None = None,
+    ) -> None:
+        """Initializes a corpus pipeline.
+
+        Args:
+            chunker (AbstractChunker): the chunker to use for all files.
+            parsers (dict[str, AnyParser] | None, optional): the parser to use for each file extension,
+                such as {".pdf": PdfParser()}. If None, uses the default parsers of
+                all handled extensions. Defaults to None.
+        """
+        self.chunker = chunker
+        self.parsers = (
+            CorpusPipeline.get_default_parsers()
+            if parsers is None
+            else {ext.lower(): parser for ext, parser in parsers.items()}
+        )
+
+    @staticmethod
+    def get_default_parsers() -> dict[str, AnyParser]:
+        """Gets the parsers used by default, for each handled file extension.
+        Wikit JSON documents are not parsed by default, as ".json" files are not
+        all Wikit documents : register a WikitJsonParser for them explicitly.
+
+        Returns:
+            dict[str, AnyParser]: the parsers, as {extension: parser}.
+        """
+        # pylint: disable=import-outside-toplevel # parsers pull heavy dependencies
+        from ..parsers import (
+            CSVParser,
+            DocxParser,
+            ExcelParser,
+            HTMLParser,
+            JupyterNotebookParser,
+            MarkdownParser,
+            PdfParser,
+        )
+
+        html_parser = HTMLParser()
+        excel_parser = ExcelParser()
+        return {
+            ".md": MarkdownParser(),
+            ".html": html_parser,
+            ".htm": html_parser,
+            ".pdf": PdfParser(),
+            ".docx": DocxParser(),
+            ".csv": CSVParser(),
+            ".xlsx": excel_parser,
+            ".xls": excel_parser,
+            ".xlsm": excel_parser,
+            ".ods": excel_parser,
+            ".ipynb": JupyterNotebookParser(),
+        }
+
+    def chunk_file(self, filepath: str) -> list[Chunk]:
+        """Chunks a file, using the parser corresponding to its extension.
+
+        Args:
+            filepath (str): the path to the file.
+
+        Returns:
+            list[Chunk]: the list of chunks.
+        """
+        fileext = os.path.splitext(filepath)[1].lower()
+        if fileext not in self.parsers:
+            raise ValueError(
+                f"No parser available for {fileext} files. Handled extensions are: {list(self.parsers)}."
+            )
+        with trace("pipeline.chunk_file", labels={"file_type": fileext}) as stage:
+            parsed_doc = self.parsers[fileext].parse_file(filepath)
+            chunks = self.chunker.chunk(parsed_doc)
+            stage.set(chunk_count=len(chunks))
+
+        return chunks
+
+    def chunk_directory(
+        self,
+        input_dir: str,
+        output_filepath: str,
+        max_workers: int | None = None,
+        remove_links: bool = False,
+    ) -> dict[str, str]:
+        """Chunks all the files of a directory that have a parser, recursively.
+        Files are chunked in parallel worker processes, the biggest files first
+        (PDFs by page count) so that no long file is left alone at the end of the run.
+        The chunks are appended to a JSON lines file as soon as a file is chunked,
+        one chunk per line. The file is gzip-compressed if its name ends with ".gz".
+
+        Args:
+            input_dir (str): the path to the directory.
+            output_filepath (str): the path to the JSON lines file where to save the chunks.
+            max_workers (int | None, optional): number of worker processes.
+                If None, uses all CPUs. If 1, files are chunked in the current process.
+                Defaults to None.
+            remove_links (bool, optional): whether or not links should be removed
+                from the chunk's text content. Defaults to False.
+
+        Returns:
+            dict[str, str]: the errors, as {filepath: error message}.
+                Empty if all files were chunked.
+        """
+        if not os.path.isdir(input_dir):
+            raise ValueError("input_dir must point to an existing directory.")
+
+        filepaths = self.get_filepaths(input_dir)
+        filepaths.sort(key=CorpusPipeline.estimate_cost, reverse=True)
+        LOGGER.info("Chunking %i files...", len(filepaths))
+
+        errors: dict[str, str] = {}
+        with JsonLinesWriter(output_filepath) as writer:
+            for filepath, result in self._run_tasks(
+                filepaths, max_workers, remove_links
+            ):
+                if isinstance(result, str):
+                    errors[filepath] = result
+                    continue
+                for record in result:
+                    writer.write(record)
+        LOGGER.info(
+            "%i chunks obtained from %i files. %i files failed.",
+            writer.n_records,
+            len(filepaths) - len(errors),
+            len(errors),
+        )
+
+        return errors
+
+    def get_filepaths(self, input_dir: str) -> list[str]:
+        """Gets the paths of the files of a directory that have a parser, recursively.
+
+        Args:
+            input_dir (str): the path to the directory.
+
+        Returns:
+            list[str]: the filepaths.
+        """
+        return [
+            os.path.join(dirpath, filename)
+            for dirpath, _, filenames in os.walk(input_dir)
+            for filename in sorted(filenames)
+            if os.path.splitext(filename)[1].lower() in self.parsers
+        ]
+
+    @staticmethod
+    def estimate_cost(filepath: str) -> float:
+        """Estimates the processing cost of a file, to schedule the biggest files first.
+        The cost of PDFs is based on their page count, the cost of other files on their size.
+
+        Args:
+            filepath (str): the path to the file.
+
+        Returns:
+            float: the estimated cost, in bytes.
+        """
+        if filepath.lower().endswith(".pdf"):
+            import pymupdf  # type: ignore # pylint: disable=import-outside-toplevel
+
+            try:
+                with pymupdf.open(filepath) as document:  # type: ignore : missing typing in pymupdf
+                    return document.page_count * PDF_PAGE_COST  # type: ignore : missing typing in pymupdf
+            except Exception:  # pylint: disable=broad-exception-caught
+                pass  # the parser will report the error
+        return os.path.getsize(filepath)
+
+    def _run_tasks(
+        self, filepaths: list[str], max_workers: int | None, remove_links: bool
+    ) -> Iterator[tuple[str, list[dict[str, Any]] | str]]:
+        """Chunks the files, in a pool of worker processes if more than one worker is requested.
+        Tasks are submitted in the order of the filepaths.
+
+        Args:
+            filepaths (list[str]): the files to chunk.
+            max_workers (int | None): number of worker processes. If None, uses all CPUs.
+            remove_links (bool): whether or not links should be removed from the chunk's text content.
+
+        Yields:
+            tuple[str, list[dict[str, Any]] | str]: the filepath and its chunk records
+                (or error message), as files complete.
+        """
+        if max_workers == 1 or len(filepaths) <= 1:
+            for filepath in filepaths:
+                yield filepath, self._chunk_file_safely(filepath, remove_links)
+            return
+
+        tasks = [(filepath, remove_links) for filepath in filepaths]
+        for (filepath, _), result in map_in_workers(
+            self, "_chunk_file_safely", tasks, max_workers
+        ):
+            yield filepath, result
+
+    def _chunk_file_safely(
+        self, filepath: str, remove_links: bool
+    ) -> list[dict[str, Any]] | str:
+        """Chunks a file, capturing the errors.
+
+        Args:
+            filepath (str): the path to the file.
+            remove_links (bool): whether or not links should be removed from the chunk's text content.
+
+        Returns:
+            list[dict[str, Any]] | str: the chunk records, or the error message
+                if the file could not be chunked.
+        """
+        try:
+            chunks = self.chunk_file(filepath)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            return f"{type(e).__name__}: {e}"
+
+        return [
+            {"source": filepath} | JsonLinesWriter.chunk_to_record(chunk, remove_links)
+            for chunk in chunks
+        ]
+
+
+def parse_arguments(argv: list[str] | None = None):
+    """Parse the given command-line arguments."""
+
+    parser = ArgumentParser(
+        prog="chunknorris ingest",
+        description="Chunks all the files of a directory and saves the chunks in a JSON lines file",
+    )
+    parser.add_argument(
+        "--input_dir",
+        type=str,
+        required=True,
+        help="Path to the directory containing the files to chunk",
+    )
+    parser.add_argument(
+        "--output_filepath",
+        type=str,
+        required=True,
+        help="Path to the JSON lines file where to save the chunks",
+    )
+    parser.add_argument(
+        "--max_workers",
+        type=int,
+        default=None,
+        help="Number of worker processes. Defaults to the number of CPUs.",
+    )
+    parser.add_argument(
+        "--max_headers_to_use",
+        type=str,
+        choices=["h1", "h2", "h3", "h4", "h5"],
+        default="h4",
+        help="The maximum level of titles to use for chunking",
+    )
+    parser.add_argument(
+        "--max_chunk_word_count",
+        type=int,
+        default=250,
+        help="Soft limit of chunk size (in words). Chunks bigger than this limit will be subdivided with lower level headers if available.",
+    )
+    parser.add_argument(
+        "--hard_max_chunk_word_count",
+        type=int,
+        default=400,
+        help="Hard limit of chunk size (in words). Chunks bigger than that will be subdivided so that each subchunk has less words than specified value.",
+    )
+    parser.add_argument(
+        "--min_chunk_word_count",
+        type=int,
+        default=15,
+        help="Minium amount a word a chunk must have. If lower, the chunk is discarded.",
+    )
+    parser.add_argument(
+        "--remove_links",
+        type=bool,
+        default=False,
+        help="Whether or not the links should be removed.",
+    )
+    parser.add_argument(
+        "--use_ocr",
+        type=str,
+        choices=["auto", "never", "always"],
+        default="auto",
+        help="For PDF only : whether or not OCR should be used.",
+    )
+    parser.add_argument(
+        "--ocr_language",
+        type=str,
+        default="fra+eng",
+        help='For PDF only : the languages to consider for OCR. Must be a string of 3 letter codes languages separated by "+", such as "eng+fra"',
+    )
+    parser.add_argument(
+        "--extract_tables",
+        type=bool,
+        default=True,
+        help="For PDF only : whether or not tables should be extracted",
+    )
+
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None):
+    args = parse_arguments(argv)
+
+    chunker = MarkdownChunker(
+        max_headers_to_use=args.max_headers_to_use,
+        max_chunk_word_count=args.max_chunk_word_count,
+        hard_max_chunk_word_count=args.hard_max_chunk_word_count,
+        min_chunk_word_count=args.min_chunk_word_count,
+    )
+    from ..parsers import PdfParser  # pylint: disable=import-outside-toplevel
+
+    parsers = CorpusPipeline.get_default_parsers()
+    parsers[".pdf"] = PdfParser(
+        extract_tables=args.extract_tables,
+        ocr_language=args.ocr_language,
+        use_ocr=args.use_ocr,
+    )
+    pipeline = CorpusPipeline(chunker, parsers)
+    errors = pipeline.chunk_directory(
+        args.input_dir,
+        args.output_filepath,
+        max_workers=args.max_workers,
+        remove_links=args.remove_links,
+    )
+    for filepath, error in errors.items():
+        LOGGER.error("Failed to chunk %s: %s", filepath, error)
+    LOGGER.info("Chunks saved at %s", args.output_filepath)
+
+
+if __name__ == "__main__":
+    main()
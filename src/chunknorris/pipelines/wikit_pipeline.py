@@ -1,13 +1,19 @@
 import glob
+import hashlib
 import json
 import os
 from argparse import ArgumentParser
+from typing import Any, Iterator
 
 from ..chunkers.markdown_chunker import MarkdownChunker
 from ..core.components import Chunk
+from ..core.logger import LOGGER
 from ..decorators.decorators import validate_args
 from ..parsers.json.wikit_parser import WikitJsonParser
 from ..schemas.schemas import WikitJSONDocument, WikitJSONDocumentChunk
+from .workers import map_in_workers
+
+MANIFEST_FILENAME = ".manifest.jsonl"
 
 
 class WikitJsonPipeline:
@@ -62,16 +68,41 @@ class WikitJsonPipeline:
         json_content.has_part = self._format_chunks(chunks)
         self._save_content_as_wikit_json(json_content, output_filepath)
 
-    def chunk_directory(self, input_dir: str) -> None:
-        """Chunks the json files of entire directory, recursively
+    def chunk_directory(
+        self,
+        input_dir: str,
+        max_workers: int | None = 1,
+        force: bool = False,
+    ) -> dict[str, str]:
+        """Chunks the json files of entire directory, recursively.
+        Files are chunked in parallel worker processes, and saved
+        with the same tree structure in the "<input_dir>-chunked" directory.
+
+        The run is resumable: each file successfully chunked is recorded
+        in a manifest in the output directory, along with its modification time, its hash
+        and a fingerprint of the settings of the parser and the chunker.
+        Files that are unchanged since they were last chunked with the same settings are skipped.
+        A file that fails does not stop the run: its error is returned.
 
         Args:
             input_dir (str): the path to directory
+            max_workers (int | None, optional): number of worker processes.
+                If None, uses all CPUs. If 1, files are chunked in the current process.
+                Defaults to 1.
+            force (bool, optional): if True, all files are chunked again,
+                even if they are up to date. Defaults to False.
+
+        Returns:
+            dict[str, str]: the errors, as {filepath: error message}.
+                Empty if all files were chunked.
         """
         if not os.path.isdir(input_dir) and os.path.exists(input_dir):
             raise ValueError("input_dir must point to an existing directory.")
 
-        output_dir = os.path.dirname(input_dir) + "-chunked"
+        output_dir = os.path.normpath(input_dir) + "-chunked"
+        manifest_filepath = os.path.join(output_dir, MANIFEST_FILENAME)
+        manifest = {} if force else WikitJsonPipeline._read_manifest(manifest_filepath)
+        config = self._get_config_fingerprint()
 
         filepaths: list[str] = [
             subdir
@@ -79,9 +110,164 @@ class WikitJsonPipeline:
             for subdir in glob.glob(os.path.join(dir[0], "*.json"))
         ]
 
+        tasks: list[tuple[str, str, str | None]] = []
         for filepath in filepaths:
-            output_filepath = filepath.replace(input_dir, output_dir)
-            self.chunk_and_save(filepath, output_filepath)
+            relative_filepath = os.path.relpath(filepath, input_dir)
+            output_filepath = os.path.join(output_dir, relative_filepath)
+            entry = manifest.get(relative_filepath)
+            if entry is not None and entry.get("config") != config:
+                entry = None  # chunked with other settings
+            stat = os.stat(filepath)
+            if (
+                entry is not None
+                and entry["mtime"] == stat.st_mtime
+                and entry["size"] == stat.st_size
+                and os.path.exists(output_filepath)
+            ):
+                continue
+            expected_hash = (
+                entry["sha256"]
+                if entry is not None and os.path.exists(output_filepath)
+                else None
+            )
+            tasks.append((filepath, output_filepath, expected_hash))
+
+        errors: dict[str, str] = {}
+        if not tasks:
+            return errors
+        os.makedirs(output_dir, exist_ok=True)
+        # entries are appended as files complete, so that an interrupted run can be resumed
+        with open(manifest_filepath, "a", encoding="utf-8") as manifest_file:
+            for filepath, result in self._run_tasks(tasks, max_workers):
+                if "error" in result:
+                    errors[filepath] = result["error"]
+                    continue
+                result["path"] = os.path.relpath(filepath, input_dir)
+                result["config"] = config
+                manifest_file.write(json.dumps(result) + "\n")
+                manifest_file.flush()
+                manifest[result["path"]] = result
+        # then compacted : one entry per file still in the input directory
+        relative_filepaths = {
+            os.path.relpath(filepath, input_dir) for filepath in filepaths
+        }
+        WikitJsonPipeline._write_manifest(
+            manifest_filepath,
+            [entry for path, entry in manifest.items() if path in relative_filepaths],
+        )
+
+        return errors
+
+    def _get_config_fingerprint(self) -> str:
+        """Gets a fingerprint of the settings of the parser and the chunker,
+        so that the files are chunked again when the settings change.
+        Settings that are not JSON serializable (such as a tokenizer) only account for their type.
+
+        Returns:
+            str: the fingerprint.
+        """
+        config = {
+            component_name: [type(component).__qualname__, vars(component)]
+            for component_name, component in (
+                ("parser", self.parser),
+                ("chunker", self.chunker),
+            )
+        }
+        serialized_config = json.dumps(
+            config, sort_keys=True, default=lambda value: type(value).__qualname__
+        )
+
+        return hashlib.sha256(serialized_config.encode("utf-8")).hexdigest()[:16]
+
+    def _run_tasks(
+        self, tasks: list[tuple[str, str, str | None]], max_workers: int | None
+    ) -> Iterator[tuple[str, dict[str, Any]]]:
+        """Runs the chunking tasks of chunk_directory(), in a pool of
+        worker processes if more than one worker is requested.
+
+        Args:
+            tasks (list[tuple[str, str, str | None]]): the (filepath, output_filepath, expected_hash) to process.
+            max_workers (int | None): number of worker processes. If None, uses all CPUs.
+
+        Yields:
+            tuple[str, dict[str, Any]]: the filepath and the result of its task, as they complete.
+        """
+        if max_workers == 1 or len(tasks) == 1:
+            for task in tasks:
+                yield task[0], self._chunk_and_save_safely(*task)
+            return
+
+        for task, result in map_in_workers(
+            self, "_chunk_and_save_safely", tasks, max_workers
+        ):
+            yield task[0], result
+
+    def _chunk_and_save_safely(
+        self, filepath: str, output_filepath: str, expected_hash: str | None = None
+    ) -> dict[str, Any]:
+        """Chunks and saves a file, capturing the errors.
+        If the hash of the file's content is the expected one,
+        the file is not chunked again.
+
+        Args:
+            filepath (str): the path to the json file.
+            output_filepath (str): the path of the output json.
+            expected_hash (str | None, optional): the hash of the file's content
+                when it was last chunked. Defaults to None.
+
+        Returns:
+            dict[str, Any]: the manifest entry of the file (mtime, size, sha256),
+                or {"error": message} if the file could not be chunked.
+        """
+        try:
+            stat = os.stat(filepath)
+            with open(filepath, "rb") as file:
+                sha256 = hashlib.sha256(file.read()).hexdigest()
+            if sha256 != expected_hash:
+                self.chunk_and_save(filepath, output_filepath)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            return {"error": f"{type(e).__name__}: {e}"}
+
+        return {"mtime": stat.st_mtime, "size": stat.st_size, "sha256": sha256}
+
+    @staticmethod
+    def _read_manifest(manifest_filepath: str) -> dict[str, dict[str, Any]]:
+        """Reads the manifest of the files already chunked.
+        Later entries override earlier ones.
+
+        Args:
+            manifest_filepath (str): the path to the manifest.
+
+        Returns:
+            dict[str, dict[str, Any]]: the entries, as {relative filepath: entry}.
+        """
+        manifest: dict[str, dict[str, Any]] = {}
+        if not os.path.exists(manifest_filepath):
+            return manifest
+        with open(manifest_filepath, "r", encoding="utf-8") as file:
+            for line in file:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # line truncated by an interrupted run
+                manifest[entry["path"]] = entry
+
+        return manifest
+
+    @staticmethod
+    def _write_manifest(manifest_filepath: str, entries: list[dict[str, Any]]) -> None:
+        """Rewrites the manifest of the files already chunked.
+        The file is replaced atomically, so that it is never read half written.
+
+        Args:
+            manifest_filepath (str): the path to the manifest.
+            entries (list[dict[str, Any]]): the entries.
+        """
+        tmp_filepath = f"{manifest_filepath}.tmp"
+        with open(tmp_filepath, "w", encoding="utf-8") as file:
+            for entry in entries:
+                file.write(json.dumps(entry) + "\n")
+        os.replace(tmp_filepath, manifest_filepath)
 
     def _save_content_as_wikit_json(
         self, content: WikitJSONDocument, out_filepath: str
@@ -96,8 +282,9 @@ class WikitJsonPipeline:
         if not os.path.exists(output_dir):
             os.makedirs(output_dir)
 
+        # model_dump_json() serializes natively, without building python dicts first
         with open(out_filepath, "w", encoding="utf-8") as file:
-            json.dump(content.model_dump(), file, ensure_ascii=False, indent=4)
+            file.write(content.model_dump_json(indent=4))
 
     def _format_chunks(self, chunks: list[Chunk]) -> list[WikitJSONDocumentChunk]:
         """Formats the chunks according to the input json file
@@ -176,6 +363,17 @@ def parse_arguments():
         default=15,
         help="Minium amount a word a chunk must have. If lower, the chunk is discarded.",
     )
+    parser.add_argument(
+        "--max_workers",
+        type=int,
+        default=1,
+        help="Number of worker processes. Use 0 for the number of CPUs. Defaults to 1.",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Chunk all files again, even those that are up to date.",
+    )
 
     return parser.parse_args()
 
@@ -191,7 +389,11 @@ def main():
         min_chunk_word_count=args.min_chunk_word_count,
     )
     pipeline = WikitJsonPipeline(parser=parser, chunker=chunker)
-    pipeline.chunk_directory(args.input_dir)
+    errors = pipeline.chunk_directory(
+        args.input_dir, max_workers=args.max_workers or None, force=args.force
+    )
+    for filepath, error in errors.items():
+        LOGGER.error("Failed to chunk %s: %s", filepath, error)
 
 
 if __name__ == "__main__":
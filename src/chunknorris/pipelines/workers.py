@@ -0,0 +1,144 @@
+import os
+import tempfile
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, as_completed
+from typing import TYPE_CHECKING, Any, Callable, Iterator, TypeVar
+
+from ..core.components import Chunk
+from ..core.instrumentation import (
+    SpanRecord,
+    call_recording_spans,
+    get_worker_options,
+    replay_spans,
+)
+
+if TYPE_CHECKING:
+    from .corpus_pipeline import CorpusPipeline
+    from .wikit_pipeline import WikitJsonPipeline
+
+# Functions run in the worker processes of the pipelines and of ChunkingServer.
+# The pool of workers must be started with initializer=init_worker.
+
+ResultT = TypeVar("ResultT")
+
+# pipeline used by the worker process
+_WORKER_PIPELINE: "CorpusPipeline | WikitJsonPipeline | None" = None
+
+
+def init_worker(pipeline: "CorpusPipeline | WikitJsonPipeline") -> None:
+    """Sets the pipeline used by a worker process. Meant to be
+    the initializer of the pool of worker processes.
+
+    Args:
+        pipeline (CorpusPipeline | WikitJsonPipeline): the pipeline.
+    """
+    global _WORKER_PIPELINE  # pylint: disable=global-statement
+    _WORKER_PIPELINE = pipeline
+
+
+def chunk_file_in_worker(filepath: str) -> list[Chunk]:
+    """Chunks a file in a worker process.
+
+    Args:
+        filepath (str): the path to the file. Its extension determines the parser.
+
+    Returns:
+        list[Chunk]: the list of chunks.
+    """
+    assert _WORKER_PIPELINE is not None
+    return _WORKER_PIPELINE.chunk_file(filepath)
+
+
+def chunk_bytes_in_worker(content: bytes, fileext: str) -> list[Chunk]:
+    """Chunks the content of a file in a worker process.
+    The content is written to a temporary file, as some parsers only read files.
+
+    Args:
+        content (bytes): the content of the file.
+        fileext (str): the extension of the file, such as ".pdf". Determines the parser.
+
+    Returns:
+        list[Chunk]: the list of chunks.
+    """
+    assert _WORKER_PIPELINE is not None
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        filepath = os.path.join(tmp_dir, "document" + fileext)
+        with open(filepath, "wb") as file:
+            file.write(content)
+        return _WORKER_PIPELINE.chunk_file(filepath)
+
+
+def call_pipeline_method_in_worker(method_name: str, *args: Any) -> Any:
+    """Calls a method of the pipeline of a worker process.
+
+    Args:
+        method_name (str): the name of the method, such as "_chunk_file_safely".
+        *args (Any): the arguments of the method.
+
+    Returns:
+        Any: the result of the method.
+    """
+    assert _WORKER_PIPELINE is not None
+    return getattr(_WORKER_PIPELINE, method_name)(*args)
+
+
+def submit_to_worker(
+    executor: Executor, function: Callable[..., ResultT], *args: Any
+) -> "Future[tuple[ResultT, list[SpanRecord]]]":
+    """Submits a task to a pool of worker processes. The spans emitted by
+    the task are sent back with its result : get it with get_worker_result().
+
+    Args:
+        executor (Executor): the pool of worker processes.
+        function (Callable[..., ResultT]): the function to run in a worker.
+        *args (Any): the arguments of the function.
+
+    Returns:
+        Future[tuple[ResultT, list[SpanRecord]]]: the future of the task.
+    """
+    return executor.submit(call_recording_spans, get_worker_options(), function, *args)
+
+
+def get_worker_result(result_and_spans: tuple[ResultT, list[SpanRecord]]) -> ResultT:
+    """Gets the result of a task submitted with submit_to_worker(),
+    and sends the spans it emitted to the collector of the current process.
+
+    Args:
+        result_and_spans (tuple[ResultT, list[SpanRecord]]): the result of the future of the task.
+
+    Returns:
+        ResultT: the result of the function.
+    """
+    result, spans = result_and_spans
+    replay_spans(spans)
+    return result
+
+
+def map_in_workers(
+    pipeline: "CorpusPipeline | WikitJsonPipeline",
+    method_name: str,
+    tasks: list[tuple[Any, ...]],
+    max_workers: int | None,
+) -> Iterator[tuple[tuple[Any, ...], Any]]:
+    """Calls a method of a pipeline on each task, in a pool of worker processes.
+    Tasks are submitted in order.
+
+    Args:
+        pipeline (CorpusPipeline | WikitJsonPipeline): the pipeline, sent to each worker process.
+        method_name (str): the name of the method to call.
+        tasks (list[tuple[Any, ...]]): the arguments of each call.
+        max_workers (int | None): number of worker processes. If None, uses all CPUs.
+
+    Yields:
+        tuple[tuple[Any, ...], Any]: each task and the result of its call, as they complete.
+    """
+    with ProcessPoolExecutor(
+        max_workers=max_workers, initializer=init_worker, initargs=(pipeline,)
+    ) as executor:
+        futures = {
+            submit_to_worker(
+                executor, call_pipeline_method_in_worker, method_name, *task
+            ): task
+            for task in tasks
+        }
+        for future in as_completed(futures):
+            yield futures[future], get_worker_result(future.result())
@@ -0,0 +1,394 @@
+import json
+import os
+import socketserver
+import threading
+from argparse import ArgumentParser
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures import wait
+from concurrent.futures.process import BrokenProcessPool
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable
+from urllib.parse import parse_qs, urlparse
+
+from .chunkers.abstract_chunker import AbstractChunker
+from .chunkers.markdown_chunker import MarkdownChunker
+from .core.logger import LOGGER
+from .core.writers import JsonLinesWriter
+from .parsers.abstract_parser import AnyParser
+from .pipelines.corpus_pipeline import CorpusPipeline
+from .pipelines.workers import (
+    chunk_bytes_in_worker,
+    get_worker_result,
+    init_worker,
+    submit_to_worker,
+)
+
+
+class ChunkingServer:
+    """Long-running chunking server, holding a pool of warm worker processes
+    with the parsers and chunker already loaded. Avoids paying the interpreter startup
+    and the imports of each CLI invocation.
+
+    Endpoints:
+    - POST /chunk?ext=.pdf : the body is the content of the file. Returns {"chunks": [...]},
+      each chunk having the same fields as with save_chunks().
+      The extension can also be given through the "filename" query parameter.
+    - GET /health : returns {"status": "ok", "workers": <number of workers>}.
+
+    If a worker process dies (out of memory, crash of a native library...),
+    the request it was handling fails and the pool of workers is restarted.
+    """
+
+    def __init__(
+        self,
+        chunker: AbstractChunker,
+        parsers: dict[str, AnyParser] | None = None,
+        max_workers: int | None = None,
+        timeout: float | None = None,
+        remove_links: bool = False,
+    ) -> None:
+        """Initializes the server and starts its worker processes.
+
+        Args:
+            chunker (AbstractChunker): the chunker to use for all files.
+            parsers (dict[str, AnyParser] | None, optional): the parser to use for each file extension.
+                If None, uses the default parsers of CorpusPipeline. Defaults to None.
+            max_workers (int | None, optional): number of worker processes.
+                If None, uses all CPUs. Defaults to None.
+            timeout (float | None, optional): timeout per document, in seconds.
+                If None, documents have no timeout. Defaults to None.
+            remove_links (bool, optional): whether or not links should be removed
+                from the chunk's text content. Defaults to False.
+        """
+        self.pipeline = CorpusPipeline(chunker, parsers)
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.timeout = timeout
+        self.remove_links = remove_links
+        self._executor = self._create_executor()
+        self._executor_lock = threading.Lock()
+        self._http_server: socketserver.BaseServer | None = None
+        self._ready = threading.Event()
+        self.start_workers()
+
+    def _create_executor(self) -> ProcessPoolExecutor:
+        """Creates the pool of worker processes."""
+        return ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            initializer=init_worker,
+            initargs=(self.pipeline,),
+        )
+
+    def _restart_executor(self, broken_executor: ProcessPoolExecutor) -> None:
+        """Replaces the pool of worker processes after one of them died.
+        Requests that fail at the same time on the same pool only restart it once.
+
+        Args:
+            broken_executor (ProcessPoolExecutor): the pool that was found broken.
+        """
+        with self._executor_lock:
+            if self._executor is not broken_executor:
+                return
+            LOGGER.error("A worker process died. Restarting the worker processes.")
+            broken_executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = self._create_executor()
+
+    def _submit(
+        self, func: Callable[..., Any], *args: Any
+    ) -> tuple[ProcessPoolExecutor, Future[Any]]:
+        """Submits a task to the worker processes, restarting them if they are broken.
+        Its result must be obtained with get_worker_result().
+
+        Args:
+            func (Callable[..., Any]): the function to run in a worker.
+            *args (Any): the arguments of the function.
+
+        Returns:
+            tuple[ProcessPoolExecutor, Future[Any]]: the pool running the task, and the future of the task.
+        """
+        executor = self._executor
+        try:
+            return executor, submit_to_worker(executor, func, *args)
+        except BrokenProcessPool:
+            # broken by another request : this task can run in the new pool
+            self._restart_executor(executor)
+            executor = self._executor
+            return executor, submit_to_worker(executor, func, *args)
+
+    def start_workers(self) -> None:
+        """Starts the worker processes, so that the first requests do not pay
+        the startup of a process. Only spawns the processes : the parsers and
+        the chunker are loaded when the pipeline is sent to each worker by init_worker(),
+        but the lazy initializations of the parsers still happen on their first document.
+        """
+        futures = [self._submit(os.getpid)[1] for _ in range(self.max_workers)]
+        wait(futures)
+
+    def chunk_bytes(self, content: bytes, fileext: str) -> list[dict[str, Any]]:
+        """Chunks the content of a file in a worker process.
+
+        Args:
+            content (bytes): the content of the file.
+            fileext (str): the extension of the file, such as ".pdf".
+
+        Raises:
+            TimeoutError: if the document is not chunked before the timeout.
+            BrokenProcessPool: if the worker process died while chunking the document.
+                The worker processes are restarted.
+
+        Returns:
+            list[dict[str, Any]]: the chunk records.
+        """
+        fileext = fileext.lower() if fileext.startswith(".") else f".{fileext.lower()}"
+        if fileext not in self.pipeline.parsers:
+            raise ValueError(
+                f"No parser available for {fileext} files. Handled extensions are: {list(self.pipeline.parsers)}."
+            )
+        executor, future = self._submit(chunk_bytes_in_worker, content, fileext)
+        try:
+            chunks = get_worker_result(future.result(timeout=self.timeout))
+        except FutureTimeoutError as e:
+            # not the builtin TimeoutError before python 3.11
+            future.cancel()  # only cancels the task if it has not started
+            raise TimeoutError("Timeout while chunking the document.") from e
+        except BrokenProcessPool:
+            self._restart_executor(executor)
+            raise
+
+        return [
+            JsonLinesWriter.chunk_to_record(chunk, self.remove_links)
+            for chunk in chunks
+        ]
+
+    def serve_forever(
+        self, host: str = "127.0.0.1", port: int = 8000, unix_socket: str | None = None
+    ) -> None:
+        """Serves requests until shutdown() is called.
+
+        Args:
+            host (str, optional): the host to listen on. Defaults to "127.0.0.1".
+            port (int, optional): the port to listen on. Defaults to 8000.
+            unix_socket (str | None, optional): if provided, listen on this Unix socket
+                instead of host and port. Defaults to None.
+        """
+        if unix_socket is not None:
+            if os.path.exists(unix_socket):
+                os.remove(unix_socket)
+            self._http_server = _ThreadingUnixHTTPServer(
+                unix_socket, _ChunkingRequestHandler
+            )
+            LOGGER.info("Serving on unix socket %s", unix_socket)
+        else:
+            self._http_server = ThreadingHTTPServer(
+                (host, port), _ChunkingRequestHandler
+            )
+            LOGGER.info("Serving on http://%s:%i", host, port)
+        self._http_server.chunking_server = self  # type: ignore : attribute read by the request handler
+        self._ready.set()
+        try:
+            self._http_server.serve_forever()
+        finally:
+            self._ready.clear()
+            self._http_server.server_close()
+
+    def wait_until_ready(self, timeout: float | None = None) -> bool:
+        """Waits until the server listens, when serve_forever() runs in another thread.
+
+        Args:
+            timeout (float | None, optional): the maximum time to wait, in seconds.
+                If None, waits forever. Defaults to None.
+
+        Returns:
+            bool: whether the server is listening.
+        """
+        return self._ready.wait(timeout)
+
+    def shutdown(self) -> None:
+        """Stops serving and shuts down the worker processes."""
+        if self._http_server is not None:
+            self._http_server.shutdown()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+class _ThreadingUnixHTTPServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+
+class _ChunkingRequestHandler(BaseHTTPRequestHandler):
+    """Handles the requests of a ChunkingServer."""
+
+    def do_GET(self) -> None:  # pylint: disable=invalid-name
+        if urlparse(self.path).path != "/health":
+            self._send_json(404, {"error": "Not found."})
+            return
+        server: ChunkingServer = self.server.chunking_server  # type: ignore : set by ChunkingServer
+        self._send_json(200, {"status": "ok", "workers": server.max_workers})
+
+    def do_POST(self) -> None:  # pylint: disable=invalid-name
+        url = urlparse(self.path)
+        if url.path != "/chunk":
+            self._send_json(404, {"error": "Not found."})
+            return
+        query = parse_qs(url.query)
+        fileext = (
+            query.get("ext", [""])[0]
+            or os.path.splitext(query.get("filename", [""])[0])[1]
+        )
+        if not fileext:
+            self._send_json(
+                400,
+                {"error": "The file extension must be given with ?ext= or ?filename="},
+            )
+            return
+        content = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        server: ChunkingServer = self.server.chunking_server  # type: ignore : set by ChunkingServer
+        try:
+            chunks = server.chunk_bytes(content, fileext)
+        except ValueError as e:
+            self._send_json(400, {"error": str(e)})
+        except TimeoutError:
+            self._send_json(504, {"error": "Timeout while chunking the document."})
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            self._send_json(500, {"error": f"{type(e).__name__}: {e}"})
+        else:
+            self._send_json(200, {"chunks": chunks})
+
+    def _send_json(self, status: int, content: dict[str, Any]) -> None:
+        body = json.dumps(content, ensure_ascii=False).encode("utf8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def address_string(self) -> str:
+        # client_address is an empty string on unix sockets
+        return self.client_address[0] if self.client_address else "unix"
+
+    def log_message(
+        self, format: str, *args: Any
+    ) -> None:  # pylint: disable=redefined-builtin
+        LOGGER.debug("%s - " + format, self.address_string(), *args)
+
+
+def parse_arguments(argv: list[str] | None = None):
+    """Parse the given command-line arguments."""
+
+    parser = ArgumentParser(
+        prog="chunknorris serve",
+        description="Long-running server chunking the files it receives, with warm worker processes",
+    )
+    parser.add_argument(
+        "--host",
+        type=str,
+        default="127.0.0.1",
+        help="The host to listen on.",
+    )
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=8000,
+        help="The port to listen on.",
+    )
+    parser.add_argument(
+        "--unix_socket",
+        type=str,
+        default=None,
+        help="Path to a unix socket to listen on, instead of host and port.",
+    )
+    parser.add_argument(
+        "--max_workers",
+        type=int,
+        default=None,
+        help="Number of worker processes. Defaults to the number of CPUs.",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=None,
+        help="Timeout per document, in seconds.",
+    )
+    parser.add_argument(
+        "--max_headers_to_use",
+        type=str,
+        choices=["h1", "h2", "h3", "h4", "h5"],
+        default="h4",
+        help="The maximum level of titles to use for chunking",
+    )
+    parser.add_argument(
+        "--max_chunk_word_count",
+        type=int,
+        default=250,
+        help="Soft limit of chunk size (in words). Chunks bigger than this limit will be subdivided with lower level headers if available.",
+    )
+    parser.add_argument(
+        "--hard_max_chunk_word_count",
+        type=int,
+        default=400,
+        help="Hard limit of chunk size (in words). Chunks bigger than that will be subdivided so that each subchunk has less words than specified value.",
+    )
+    parser.add_argument(
+        "--min_chunk_word_count",
+        type=int,
+        default=15,
+        help="Minium amount a word a chunk must have. If lower, the chunk is discarded.",
+    )
+    parser.add_argument(
+        "--remove_links",
+        type=bool,
+        default=False,
+        help="Whether or not the links should be removed.",
+    )
+    parser.add_argument(
+        "--use_ocr",
+        type=str,
+        choices=["auto", "never", "always"],
+        default="auto",
+        help="For PDF only : whether or not OCR should be used.",
+    )
+    parser.add_argument(
+        "--ocr_language",
+        type=str,
+        default="fra+eng",
+        help='For PDF only : the languages to consider for OCR. Must be a string of 3 letter codes languages separated by "+", such as "eng+fra"',
+    )
+    parser.add_argument(
+        "--extract_tables",
+        type=bool,
+        default=True,
+        help="For PDF only : whether or not tables should be extracted",
+    )
+
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None):
+    args = parse_arguments(argv)
+
+    chunker = MarkdownChunker(
+        max_headers_to_use=args.max_headers_to_use,
+        max_chunk_word_count=args.max_chunk_word_count,
+        hard_max_chunk_word_count=args.hard_max_chunk_word_count,
+        min_chunk_word_count=args.min_chunk_word_count,
+    )
+    from .parsers import PdfParser  # pylint: disable=import-outside-toplevel
+
+    parsers = CorpusPipeline.get_default_parsers()
+    parsers[".pdf"] = PdfParser(
+        extract_tables=args.extract_tables,
+        ocr_language=args.ocr_language,
+        use_ocr=args.use_ocr,
+    )
+    server = ChunkingServer(
+        chunker,
+        parsers,
+        max_workers=args.max_workers,
+        timeout=args.timeout,
+        remove_links=args.remove_links,
+    )
+    try:
+        server.serve_forever(args.host, args.port, args.unix_socket)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.shutdown()
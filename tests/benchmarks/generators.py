@@ -0,0 +1,287 @@
+import json
+import random
+from typing import Callable
+
+import nbformat
+import pandas as pd
+import pymupdf  # type: ignore : no stubs
+from openpyxl import Workbook
+
+# Deterministic generators of synthetic documents, used by the benchmarks.
+# The same seed always produces the same documents.
+
+WORDS = (
+    "the report presents results of analysis for each department during fiscal year "
+    "revenue growth margin customer contract product service network operations "
+    "security compliance audit risk strategy market region quarter budget forecast "
+    "employee training process quality delivery performance indicator objective"
+).split()
+
+
+def _sentence(rng: random.Random, n_words: int = 14) -> str:
+    words = rng.choices(WORDS, k=n_words)
+    return " ".join(words).capitalize() + "."
+
+
+def _paragraph(rng: random.Random, n_sentences: int = 5) -> str:
+    return " ".join(_sentence(rng, rng.randint(8, 20)) for _ in range(n_sentences))
+
+
+def generate_pdf(filepath: str, n_pages: int = 50, seed: int = 0) -> None:
+    """Generates a PDF with headers and footers, section titles,
+    two-columns text, links, ruled tables and a table of content.
+
+    Args:
+        filepath (str): the path of the PDF to write.
+        n_pages (int, optional): the number of pages. Defaults to 50.
+        seed (int, optional): the random seed. Defaults to 0.
+    """
+    rng = random.Random(seed)
+    document = pymupdf.open()
+    toc: list[list[int | str]] = []
+    for page_idx in range(n_pages):
+        page = document.new_page(width=595, height=842)
+        page.insert_text((50, 30), "ACME Corporation - Annual report", fontsize=8)
+        page.insert_text((280, 820), f"Page {page_idx + 1}", fontsize=8)
+        title = f"{page_idx + 1}. {_sentence(rng, 4)[:-1]}"
+        page.insert_text((50, 70), title, fontsize=16)
+        toc.append([1, title, page_idx + 1])
+        for x in (50, 310):
+            rect = pymupdf.Rect(x, 90, x + 235, 430)
+            page.insert_textbox(rect, _paragraph(rng, 12), fontsize=9)
+        link_rect = pymupdf.Rect(50, 440, 250, 452)
+        page.insert_text((50, 450), "See the online documentation", fontsize=9)
+        page.insert_link(
+            {
+                "kind": pymupdf.LINK_URI,
+                "from": link_rect,
+                "uri": f"https://example.com/doc/{page_idx}",
+            }
+        )
+        if page_idx % 2 == 0:
+            _draw_table(page, rng, top=480, n_rows=8, n_cols=4)
+        else:
+            page.insert_textbox(
+                pymupdf.Rect(50, 480, 545, 790), _paragraph(rng, 15), fontsize=9
+            )
+    document.set_toc(toc)
+    document.save(filepath)
+    document.close()
+
+
+def generate_toc_pdf(filepath: str, n_entries: int = 60, seed: int = 0) -> None:
+    """Generates a PDF starting with a table of content made of dot leaders lines,
+    mixed with adversarial lines : long runs of spaces or dots without page number,
+    that make backtracking regexes stall.
+
+    Args:
+        filepath (str): the path of the PDF to write.
+        n_entries (int, optional): the number of entries of the table of content. Defaults to 60.
+        seed (int, optional): the random seed. Defaults to 0.
+    """
+    rng = random.Random(seed)
+    document = pymupdf.open()
+    entries_per_page = 30
+    n_toc_pages = -(-n_entries // entries_per_page)
+    titles = [f"{idx + 1}. {_sentence(rng, 3)[:-1]}" for idx in range(n_entries)]
+    for toc_page_idx in range(n_toc_pages):
+        page = document.new_page(width=595, height=842)
+        page_titles = titles[
+            toc_page_idx * entries_per_page : (toc_page_idx + 1) * entries_per_page
+        ]
+        for line_idx, title in enumerate(page_titles):
+            entry_idx = toc_page_idx * entries_per_page + line_idx
+            y = 60 + line_idx * 25
+            page.insert_text(
+                (50, y),
+                f"{title} {'.' * 40} {n_toc_pages + entry_idx + 1}",
+                fontsize=8,
+            )
+            leaders = " " * 150 if line_idx % 2 else ". " * 100
+            page.insert_text((50, y + 10), f"Note{leaders}end", fontsize=3)
+    for title in titles:
+        page = document.new_page(width=595, height=842)
+        page.insert_text((50, 70), title, fontsize=16)
+        page.insert_textbox(
+            pymupdf.Rect(50, 90, 545, 790), _paragraph(rng, 20), fontsize=9
+        )
+    document.save(filepath)
+    document.close()
+
+
+def _draw_table(
+    page: pymupdf.Page, rng: random.Random, top: float, n_rows: int, n_cols: int
+) -> None:
+    left, width, row_height = 50.0, 495.0, 20.0
+    col_width = width / n_cols
+    for row in range(n_rows + 1):
+        y = top + row * row_height
+        page.draw_line((left, y), (left + width, y))
+    for col in range(n_cols + 1):
+        x = left + col * col_width
+        page.draw_line((x, top), (x, top + n_rows * row_height))
+    for row in range(n_rows):
+        for col in range(n_cols):
+            text = (
+                f"Column {col + 1}"
+                if row == 0
+                else str(rng.randint(0, 100_000)) if col else rng.choice(WORDS)
+            )
+            page.insert_text(
+                (left + col * col_width + 4, top + row * row_height + 14),
+                text,
+                fontsize=9,
+            )
+
+
+def generate_markdown(filepath: str, size_mb: float = 2.0, seed: int = 0) -> None:
+    """Generates a markdown file with nested headers, paragraphs,
+    bullet points, tables, code blocks and links.
+
+    Args:
+        filepath (str): the path of the file to write.
+        size_mb (float, optional): the approximate size of the file, in MB. Defaults to 2.0.
+        seed (int, optional): the random seed. Defaults to 0.
+    """
+    _write_until_size(filepath, size_mb, _markdown_section, seed)
+
+
+def _markdown_section(rng: random.Random, idx: int) -> str:
+    rows = "\n".join(
+        f"| {rng.choice(WORDS)} | {rng.randint(0, 1000)} | {rng.random():.3f} |"
+        for _ in range(6)
+    )
+    bullets = "\n".join(f"- {_sentence(rng, 8)}" for _ in range(4))
+    return (
+        f"# Chapter {idx}\n\n{_paragraph(rng)}\n\n"
+        f"## Section {idx}.1\n\n{_paragraph(rng, 8)} [link](https://example.com/{idx})\n\n"
+        f"{bullets}\n\n"
+        f"### Table {idx}\n\n| name | count | ratio |\n|---|---|---|\n{rows}\n\n"
+        f"## Section {idx}.2\n\n```python\nprint({idx})\n```\n\n{_paragraph(rng, 12)}\n\n"
+    )
+
+
+def generate_html(filepath: str, size_mb: float = 2.0, seed: int = 0) -> None:
+    """Generates an HTML file with nested headers, paragraphs,
+    lists, tables and links.
+
+    Args:
+        filepath (str): the path of the file to write.
+        size_mb (float, optional): the approximate size of the file, in MB. Defaults to 2.0.
+        seed (int, optional): the random seed. Defaults to 0.
+    """
+    _write_until_size(
+        filepath, size_mb, _html_section, seed, "<html><body>\n", "</body></html>\n"
+    )
+
+
+def _html_section(rng: random.Random, idx: int) -> str:
+    rows = "".join(
+        f"<tr><td>{rng.choice(WORDS)}</td><td>{rng.randint(0, 1000)}</td></tr>"
+        for _ in range(6)
+    )
+    items = "".join(f"<li>{_sentence(rng, 8)}</li>" for _ in range(4))
+    return (
+        f"<h1>Chapter {idx}</h1><p>{_paragraph(rng)}</p>\n"
+        f'<h2>Section {idx}.1</h2><p>{_paragraph(rng, 8)} <a href="https://example.com/{idx}">link</a></p>\n'
+        f"<ul>{items}</ul>\n"
+        f"<h3>Table {idx}</h3><table><tr><th>name</th><th>count</th></tr>{rows}</table>\n"
+        f"<h2>Section {idx}.2</h2><div><p>{_paragraph(rng, 12)}</p></div>\n"
+    )
+
+
+def _write_until_size(
+    filepath: str,
+    size_mb: float,
+    make_section: Callable[[random.Random, int], str],
+    seed: int,
+    prefix: str = "",
+    suffix: str = "",
+) -> None:
+    rng = random.Random(seed)
+    target_size = int(size_mb * 1_000_000)
+    size = 0
+    with open(filepath, "w", encoding="utf8") as file:
+        file.write(prefix)
+        idx = 0
+        while size < target_size:
+            section = make_section(rng, idx)
+            file.write(section)
+            size += len(section)
+            idx += 1
+        file.write(suffix)
+
+
+def _dataframe(n_rows: int, seed: int) -> pd.DataFrame:
+    rng = random.Random(seed)
+    return pd.DataFrame(
+        {
+            "id": range(n_rows),
+            "name": [rng.choice(WORDS) for _ in range(n_rows)],
+            "description": [_sentence(rng, 6) for _ in range(n_rows)],
+            "amount": [round(rng.uniform(0, 10_000), 2) for _ in range(n_rows)],
+            "quantity": [rng.randint(0, 500) for _ in range(n_rows)],
+            "active": [rng.random() > 0.5 for _ in range(n_rows)],
+        }
+    )
+
+
+def generate_csv(filepath: str, n_rows: int = 100_000, seed: int = 0) -> None:
+    """Generates a CSV file with text, numeric and boolean columns.
+
+    Args:
+        filepath (str): the path of the file to write.
+        n_rows (int, optional): the number of rows. Defaults to 100_000.
+        seed (int, optional): the random seed. Defaults to 0.
+    """
+    _dataframe(n_rows, seed).to_csv(filepath, index=False)
+
+
+def generate_xlsx(
+    filepath: str, n_rows: int = 50_000, n_sheets: int = 2, seed: int = 0
+) -> None:
+    """Generates an Excel workbook with text, numeric and boolean columns.
+
+    Args:
+        filepath (str): the path of the file to write.
+        n_rows (int, optional): the number of rows of each sheet. Defaults to 50_000.
+        n_sheets (int, optional): the number of sheets. Defaults to 2.
+        seed (int, optional): the random seed. Defaults to 0.
+    """
+    workbook = Workbook(write_only=True)
+    for sheet_idx in range(n_sheets):
+        sheet = workbook.create_sheet(f"Sheet{sheet_idx + 1}")
+        df = _dataframe(n_rows, seed + sheet_idx)
+        sheet.append(list(df.columns))
+        for row in df.itertuples(index=False):
+            sheet.append(list(row))
+    workbook.save(filepath)
+
+
+def generate_notebook(filepath: str, n_cells: int = 2_000, seed: int = 0) -> None:
+    """Generates a jupyter notebook alternating markdown and code cells with outputs.
+
+    Args:
+        filepath (str): the path of the file to write.
+        n_cells (int, optional): the number of cells. Defaults to 2_000.
+        seed (int, optional): the random seed. Defaults to 0.
+    """
+    rng = random.Random(seed)
+    notebook = nbformat.v4.new_notebook()
+    for idx in range(n_cells):
+        if idx % 2 == 0:
+            header = "#" * (1 + idx % 3)
+            notebook.cells.append(
+                nbformat.v4.new_markdown_cell(
+                    f"{header} Step {idx}\n\n{_paragraph(rng)}"
+                )
+            )
+        else:
+            cell = nbformat.v4.new_code_cell(
+                f"values = {json.dumps([rng.randint(0, 100) for _ in range(10)])}\nprint(sum(values))"
+            )
+            cell.outputs = [
+                nbformat.v4.new_output("stream", text=f"{rng.randint(0, 1000)}\n")
+            ]
+            notebook.cells.append(cell)
+    nbformat.write(notebook, filepath)
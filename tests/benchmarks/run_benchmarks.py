@@ -0,0 +1,442 @@
+import json
+import os
+import platform
+import sys
+import tempfile
+import threading
+import time
+from argparse import ArgumentParser
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from multiprocessing import get_context
+from typing import Any, Callable
+
+from chunknorris import set_log_level
+from chunknorris.chunkers import MarkdownChunker
+from chunknorris.core.instrumentation import (
+    InMemoryCollector,
+    SpanRecord,
+    _get_rss,
+    set_collector,
+    trace,
+)
+from chunknorris.parsers import (
+    CSVParser,
+    ExcelParser,
+    HTMLParser,
+    JupyterNotebookParser,
+    MarkdownParser,
+    PdfParser,
+)
+from chunknorris.parsers.abstract_parser import AnyParser
+
+from . import generators
+
+try:
+    import resource
+except ImportError:  # Unix only : on Windows, the peak comes from the sampled memory
+    resource = None
+
+# To run the benchmarks, use the following :
+# PYTHONPATH=src python -m tests.benchmarks.run_benchmarks
+# To update the stored baselines after an intended change :
+# PYTHONPATH=src python -m tests.benchmarks.run_benchmarks --save_baselines
+
+BASELINES_FILEPATH = os.path.join(os.path.dirname(__file__), "baselines.json")
+
+# metrics compared against the baselines. True if higher is better.
+COMPARED_METRICS = {
+    "pages_per_s": True,
+    "mb_per_s": True,
+    "chunks_per_s": True,
+    "peak_rss_mb": False,
+}
+
+
+class StagePeakCollector(InMemoryCollector):
+    """Collects the spans, and the peak resident memory of each stage.
+    The resident memory is sampled by a thread, so peaks shorter
+    than the sampling interval may be missed.
+    """
+
+    def __init__(self, interval: float = 0.005) -> None:
+        """Initializes the collector and starts sampling the resident memory.
+
+        Args:
+            interval (float, optional): seconds between two samples. Defaults to 0.005.
+        """
+        super().__init__()
+        self.interval = interval
+        self.peak_rss: dict[str, int] = {}
+        self._sample_times: list[float] = []
+        self._sample_rss: list[int] = []
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+        self._thread.start()
+
+    def _sample(self) -> None:
+        while not self._stop.is_set():
+            rss = _get_rss()
+            if rss is None:
+                return
+            self._sample_times.append(time.time())
+            self._sample_rss.append(rss)
+            self._stop.wait(self.interval)
+
+    def record(self, span: SpanRecord) -> None:
+        super().record(span)
+        # samples are appended in time order by a single thread
+        sample_count = len(self._sample_times)
+        start = bisect_left(self._sample_times, span.start_time, hi=sample_count)
+        end = bisect_right(
+            self._sample_times, span.start_time + span.duration, hi=sample_count
+        )
+        peak = max(self._sample_rss[start:end], default=0)
+        peak = max(peak, span.rss or 0)
+        self.peak_rss[span.name] = max(self.peak_rss.get(span.name, 0), peak)
+
+    def stop(self) -> None:
+        """Stops sampling the resident memory."""
+        self._stop.set()
+        self._thread.join()
+
+    @property
+    def max_sampled_rss(self) -> int:
+        """The highest resident memory sampled, in bytes."""
+        return max(self._sample_rss, default=0)
+
+
+@dataclass
+class BenchmarkCase:
+    """A synthetic document, and the parser to benchmark on it."""
+
+    name: str
+    filename: str
+    generate: Callable[[str, float], None]  # (filepath, scale)
+    get_parser: Callable[[], AnyParser]
+
+
+CASES = [
+    BenchmarkCase(
+        "pdf",
+        "document.pdf",
+        lambda filepath, scale: generators.generate_pdf(
+            filepath, n_pages=int(50 * scale)
+        ),
+        lambda: PdfParser(use_ocr="never"),
+    ),
+    BenchmarkCase(
+        "pdf_toc",
+        "toc.pdf",
+        lambda filepath, scale: generators.generate_toc_pdf(
+            filepath, n_entries=int(60 * scale)
+        ),
+        lambda: PdfParser(use_ocr="never"),
+    ),
+    BenchmarkCase(
+        "html",
+        "document.html",
+        lambda filepath, scale: generators.generate_html(filepath, size_mb=2 * scale),
+        HTMLParser,
+    ),
+    BenchmarkCase(
+        "markdown",
+        "document.md",
+        lambda filepath, scale: generators.generate_markdown(
+            filepath, size_mb=2 * scale
+        ),
+        MarkdownParser,
+    ),
+    BenchmarkCase(
+        "csv",
+        "document.csv",
+        lambda filepath, scale: generators.generate_csv(
+            filepath, n_rows=int(100_000 * scale)
+        ),
+        CSVParser,
+    ),
+    BenchmarkCase(
+        "xlsx",
+        "document.xlsx",
+        lambda filepath, scale: generators.generate_xlsx(
+            filepath, n_rows=int(20_000 * scale)
+        ),
+        ExcelParser,
+    ),
+    BenchmarkCase(
+        "notebook",
+        "document.ipynb",
+        lambda filepath, scale: generators.generate_notebook(
+            filepath, n_cells=int(2_000 * scale)
+        ),
+        JupyterNotebookParser,
+    ),
+]
+
+
+def run_case(case_name: str, filepath: str, repeat: int) -> dict[str, Any]:
+    """Parses and chunks the document of a case.
+    Meant to be run in a fresh process, so that the peak memory is the one of the case.
+
+    Args:
+        case_name (str): the name of the case.
+        filepath (str): the path to the generated document.
+        repeat (int): number of runs. The fastest run is kept.
+
+    Returns:
+        dict[str, Any]: the metrics of the case.
+    """
+    set_log_level("warning")
+    case = next(case for case in CASES if case.name == case_name)
+    size_mb = os.path.getsize(filepath) / 1e6
+    parser = case.get_parser()
+    chunker = MarkdownChunker()
+
+    best: dict[str, Any] = {}
+    max_sampled_rss = 0
+    for _ in range(repeat):
+        collector = StagePeakCollector()
+        set_collector(collector)
+        try:
+            start = time.perf_counter()
+            with trace("parse_file"):
+                parsed_doc = parser.parse_file(filepath)
+            parse_time = time.perf_counter() - start
+            start = time.perf_counter()
+            chunks = chunker.chunk(parsed_doc)
+            chunk_time = time.perf_counter() - start
+        finally:
+            set_collector(None)
+            collector.stop()
+        max_sampled_rss = max(max_sampled_rss, collector.max_sampled_rss)
+        if best and best["parse_seconds"] + best["chunk_seconds"] <= (
+            parse_time + chunk_time
+        ):
+            continue
+        stages = collector.summary()
+        page_count = next(
+            (stage["page_count"] for stage in stages if "page_count" in stage),
+            None,
+        )
+        best = {
+            "size_mb": round(size_mb, 3),
+            "parse_seconds": parse_time,
+            "chunk_seconds": chunk_time,
+            "chunk_count": len(chunks),
+            "mb_per_s": size_mb / parse_time,
+            "chunks_per_s": len(chunks) / chunk_time if chunk_time else 0.0,
+            "stages": {
+                stage["name"]: {
+                    "seconds": stage["total_duration"],
+                    "end_rss_mb": stage["max_rss"] / 1e6,
+                    "peak_rss_mb": collector.peak_rss.get(stage["name"], 0) / 1e6,
+                }
+                for stage in stages
+            },
+        }
+        if page_count:
+            best["pages_per_s"] = page_count / parse_time
+    best["peak_rss_mb"] = _get_peak_rss_mb(max_sampled_rss)
+
+    return best
+
+
+def _get_peak_rss_mb(max_sampled_rss: int) -> float:
+    if resource is None:
+        return max_sampled_rss / 1e6
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS, in kibibytes elsewhere
+    return peak / 1e6 if sys.platform == "darwin" else peak * 1024 / 1e6
+
+
+def get_machine_info() -> dict[str, Any]:
+    """Gets a description of the machine, stored with the baselines
+    as the metrics depend on it.
+
+    Returns:
+        dict[str, Any]: the platform, the CPU and the Python version.
+    """
+    cpu = platform.processor()
+    if os.path.exists("/proc/cpuinfo"):
+        with open("/proc/cpuinfo", "r", encoding="utf8") as file:
+            cpu = next(
+                (
+                    line.split(":", 1)[1].strip()
+                    for line in file
+                    if line.startswith("model name")
+                ),
+                cpu,
+            )
+    return {
+        "platform": platform.platform(),
+        "cpu": cpu or platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "python": platform.python_version(),
+    }
+
+
+def compare_to_baselines(
+    results: dict[str, dict[str, Any]],
+    baselines: dict[str, dict[str, Any]],
+    tolerance: float,
+) -> list[str]:
+    """Compares the results to the baselines.
+
+    Args:
+        results (dict[str, dict[str, Any]]): the metrics of each case.
+        baselines (dict[str, dict[str, Any]]): the stored metrics of each case.
+        tolerance (float): relative difference allowed before reporting a regression.
+
+    Returns:
+        list[str]: the regressions.
+    """
+    regressions: list[str] = []
+    for case_name, metrics in results.items():
+        baseline = baselines.get(case_name, {})
+        for metric, higher_is_better in COMPARED_METRICS.items():
+            if metric not in metrics or metric not in baseline:
+                continue
+            ratio = metrics[metric] / baseline[metric] if baseline[metric] else 1.0
+            if (higher_is_better and ratio < 1 - tolerance) or (
+                not higher_is_better and ratio > 1 + tolerance
+            ):
+                regressions.append(
+                    f"{case_name}.{metric}: {metrics[metric]:.2f} (baseline {baseline[metric]:.2f}, {ratio - 1:+.0%})"
+                )
+
+    return regressions
+
+
+def print_results(results: dict[str, dict[str, Any]]) -> None:
+    """Prints the metrics of each case, and the time spent in each stage."""
+    print(
+        f"{'case':<10} {'MB':>7} {'parse s':>8} {'chunk s':>8} {'pages/s':>8} {'MB/s':>7} {'chunks/s':>9} {'peak MB':>8}"
+    )
+    for case_name, metrics in results.items():
+        pages_per_s = metrics.get("pages_per_s")
+        print(
+            f"{case_name:<10} {metrics['size_mb']:>7.2f} {metrics['parse_seconds']:>8.3f} "
+            f"{metrics['chunk_seconds']:>8.3f} {pages_per_s or 0:>8.1f} {metrics['mb_per_s']:>7.2f} "
+            f"{metrics['chunks_per_s']:>9.0f} {metrics['peak_rss_mb']:>8.1f}"
+        )
+    for case_name, metrics in results.items():
+        print(f"\n{case_name} stages:")
+        for stage_name, stage in metrics["stages"].items():
+            print(
+                f"  {stage_name:<35} {stage['seconds']:>8.3f} s {stage['peak_rss_mb']:>8.1f} MB peak {stage['end_rss_mb']:>8.1f} MB at end"
+            )
+
+
+def parse_arguments():
+    """Parse the command-line arguments."""
+    argparser = ArgumentParser(
+        description="Benchmarks the parsers and the chunker on synthetic documents."
+    )
+    argparser.add_argument(
+        "--cases",
+        type=str,
+        nargs="+",
+        choices=[case.name for case in CASES],
+        default=[case.name for case in CASES],
+        help="The cases to run. Defaults to all cases.",
+    )
+    argparser.add_argument(
+        "--scale",
+        type=float,
+        default=1.0,
+        help="Multiplier of the size of the generated documents.",
+    )
+    argparser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="Number of runs of each case. The fastest run is kept.",
+    )
+    argparser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="Relative difference with the baselines allowed before reporting a regression.",
+    )
+    argparser.add_argument(
+        "--save_baselines",
+        action="store_true",
+        help="Store the results as the new baselines.",
+    )
+    argparser.add_argument(
+        "--output_filepath",
+        type=str,
+        default=None,
+        help="Path to a JSON file where to save the results.",
+    )
+
+    return argparser.parse_args()
+
+
+def main():
+    args = parse_arguments()
+    results: dict[str, dict[str, Any]] = {}
+    for case_name in args.cases:
+        case = next(case for case in CASES if case.name == case_name)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            filepath = os.path.join(tmp_dir, case.filename)
+            case.generate(filepath, args.scale)
+            # one fresh process per case, so that the peak memory is the one of the case
+            with ProcessPoolExecutor(
+                max_workers=1, mp_context=get_context("spawn")
+            ) as executor:
+                results[case_name] = executor.submit(
+                    run_case, case_name, filepath, args.repeat
+                ).result()
+    print_results(results)
+
+    if args.output_filepath:
+        with open(args.output_filepath, "w", encoding="utf8") as file:
+            json.dump(results, file, indent=4)
+
+    machine = get_machine_info()
+    if args.save_baselines:
+        baselines: dict[str, dict[str, Any]] = {}
+        if os.path.exists(BASELINES_FILEPATH):
+            with open(BASELINES_FILEPATH, "r", encoding="utf8") as file:
+                stored = json.load(file)
+            # baselines measured on another machine are not kept
+            if stored.get("machine") == machine:
+                baselines = stored["cases"]
+        for case_name, metrics in results.items():
+            baselines[case_name] = {
+                metric: round(metrics[metric], 3)
+                for metric in COMPARED_METRICS
+                if metric in metrics
+            } | {"scale": args.scale}
+        with open(BASELINES_FILEPATH, "w", encoding="utf8") as file:
+            json.dump({"machine": machine, "cases": baselines}, file, indent=4)
+        print(f"\nBaselines saved at {BASELINES_FILEPATH}")
+        return
+
+    if not os.path.exists(BASELINES_FILEPATH):
+        print("\nNo baselines found. Run with --save_baselines to create them.")
+        return
+    with open(BASELINES_FILEPATH, "r", encoding="utf8") as file:
+        stored = json.load(file)
+    if stored.get("machine") != machine:
+        print(
+            f"\nWarning: the baselines were measured on another machine ({stored.get('machine')})."
+        )
+    baselines = {
+        case_name: baseline
+        for case_name, baseline in stored["cases"].items()
+        if baseline.get("scale") == args.scale
+    }
+    regressions = compare_to_baselines(results, baselines, args.tolerance)
+    if regressions:
+        print("\nRegressions compared to the baselines:")
+        for regression in regressions:
+            print(f"  {regression}")
+        sys.exit(1)
+    print("\nNo regression compared to the baselines.")
+
+
+if __name__ == "__main__":
+    main()
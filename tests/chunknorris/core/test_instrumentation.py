@@ -0,0 +1,95 @@
+import shutil
+from pathlib import Path
+
+from chunknorris.chunkers import MarkdownChunker
+from chunknorris.core.components import MarkdownDoc
+from chunknorris.core.instrumentation import (
+    InMemoryCollector,
+    PrometheusTextFileCollector,
+    call_recording_spans,
+    get_worker_options,
+    replay_spans,
+    set_collector,
+    trace,
+)
+from chunknorris.parsers import MarkdownParser
+from chunknorris.pipelines.corpus_pipeline import CorpusPipeline
+
+
+def test_trace_disabled():
+    with trace("stage", page_count=1) as span:
+        span.set(span_count=2)
+
+
+def test_in_memory_collector(md_chunker: MarkdownChunker, md_standard_in: str):
+    collector = InMemoryCollector()
+    set_collector(collector)
+    try:
+        chunks = md_chunker.chunk(MarkdownDoc.from_string(md_standard_in))
+        with trace("outer", labels={"file_type": ".md"}, page_count=2):
+            with trace("inner", span_count=3):
+                pass
+    finally:
+        set_collector(None)
+
+    summary = {entry["name"]: entry for entry in collector.summary()}
+    assert {"chunker.toc_tree", "chunker.split", "chunker.tokenize"} <= set(summary)
+    assert summary["MarkdownChunker.chunk"]["chunk_count"] == len(chunks)
+    assert summary["outer"]["page_count"] == 2
+    assert summary["inner"]["labels"] == {"file_type": ".md"}
+    assert summary["inner"]["span_count"] == 3
+    assert summary["inner"]["max_rss"] > 0
+
+
+def test_prometheus_text_file_collector(
+    md_chunker: MarkdownChunker,
+    md_parser: MarkdownParser,
+    md_filepath: str,
+    tmp_path: Path,
+):
+    output_filepath = tmp_path / "chunknorris.prom"
+    collector = PrometheusTextFileCollector(str(output_filepath))
+    set_collector(collector)
+    try:
+        pipeline = CorpusPipeline(md_chunker, parsers={".md": md_parser})
+        pipeline.chunk_file(md_filepath)
+    finally:
+        set_collector(None)
+    collector.flush()
+
+    content = output_filepath.read_text()
+    assert "# TYPE chunknorris_stage_duration_seconds_total counter" in content
+    assert (
+        'chunknorris_stage_calls_total{stage="chunker.split",file_type=".md"} 1'
+        in content
+    )
+
+
+def test_replay_worker_spans(
+    md_chunker: MarkdownChunker,
+    md_parser: MarkdownParser,
+    md_filepath: str,
+    tmp_path: Path,
+):
+    assert call_recording_spans(None, sum, [1, 2]) == (3, [])
+    collector = InMemoryCollector()
+    set_collector(collector)
+    try:
+        result, spans = call_recording_spans(get_worker_options(), sum, [1, 2])
+        assert result == 3 and not spans and not collector.summary()
+        # the spans of the worker processes are replayed in the collector
+        input_dir = tmp_path / "input"
+        input_dir.mkdir()
+        for filename in ("a.md", "b.md"):
+            shutil.copy(md_filepath, input_dir / filename)
+        pipeline = CorpusPipeline(md_chunker, parsers={".md": md_parser})
+        pipeline.chunk_directory(
+            str(input_dir), str(tmp_path / "chunks.jsonl"), max_workers=2
+        )
+    finally:
+        set_collector(None)
+
+    summary = {entry["name"]: entry for entry in collector.summary()}
+    assert summary["pipeline.chunk_file"]["count"] == 2
+    assert summary["pipeline.chunk_file"]["labels"] == {"file_type": ".md"}
+    replay_spans([])  # no-op while instrumentation is disabled
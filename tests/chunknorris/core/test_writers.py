@@ -0,0 +1,35 @@
+import gzip
+import json
+from pathlib import Path
+
+import pytest
+
+from chunknorris.chunkers import MarkdownChunker
+from chunknorris.core.components import MarkdownDoc
+from chunknorris.core.writers import JsonLinesWriter
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_save_chunks_as_json_lines(
+    md_chunker: MarkdownChunker,
+    md_standard_in: str,
+    tmp_path: Path,
+    use_orjson: bool,
+):
+    chunks = md_chunker.chunk(MarkdownDoc.from_string(md_standard_in))
+    output_filepath = tmp_path / "chunks.jsonl.gz"
+    with JsonLinesWriter(str(output_filepath), use_orjson=use_orjson) as writer:
+        writer.write_chunks(chunks, source="file.md")
+    assert writer.n_records == len(chunks)
+    with gzip.open(output_filepath, "rt", encoding="utf8") as f:
+        records = [json.loads(line) for line in f]
+    assert [record["text"] for record in records] == [
+        chunk.get_text() for chunk in chunks
+    ]
+    assert all(record["source"] == "file.md" for record in records)
+
+    md_chunker.save_chunks(chunks, str(tmp_path / "chunks.jsonl"))
+    with open(tmp_path / "chunks.jsonl", "r", encoding="utf8") as f:
+        assert [json.loads(line) for line in f] == [
+            JsonLinesWriter.chunk_to_record(chunk) for chunk in chunks
+        ]
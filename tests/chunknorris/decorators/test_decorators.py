@@ -0,0 +1,27 @@
+import re
+
+import pytest
+
+from chunknorris import set_args_validation
+from chunknorris.decorators.decorators import validate_args
+
+
+@validate_args
+def _add(a: int, b: int | None = None) -> int:
+    return a + (b or 0)
+
+
+def test_validate_args():
+    assert _add(1, 2) == 3
+    with pytest.raises(ValueError, match="Argument 'a' must be of type int."):
+        _add("1")  # type: ignore : wrong type on purpose
+    with pytest.raises(
+        ValueError, match=re.escape("Argument 'b' must be of type int | None.")
+    ):
+        _add(1, "2")  # type: ignore : wrong type on purpose
+
+    set_args_validation(False)
+    try:
+        assert _add(1.5) == 1.5  # type: ignore : wrong type on purpose
+    finally:
+        set_args_validation(True)
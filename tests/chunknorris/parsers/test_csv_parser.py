@@ -1,3 +1,7 @@
+import json
+
+import pandas as pd
+
 from chunknorris.core.components import MarkdownDoc
 from chunknorris.parsers import CSVParser
 
@@ -20,3 +24,56 @@ def test_parse_string(csv_parser: CSVParser, csv_filepath: str):
         file_content = f.read()
     parser_output = csv_parser.parse_string(file_content)
     assert isinstance(parser_output, MarkdownDoc)
+
+
+def test_parse_file_by_chunks(csv_filepath: str):
+    parser = CSVParser(output_format="json_lines", chunksize=2)
+    streamed_lines = list(parser.iter_file_lines(csv_filepath))
+    whole_doc = CSVParser(output_format="json_lines").parse_file(csv_filepath)
+    # dtypes are inferred per batch, hence compare values rather than strings
+    assert [json.loads(line.text) for line in streamed_lines] == [
+        json.loads(line.text) for line in whole_doc.content if line.text
+    ]
+    assert [line.line_idx for line in streamed_lines] == list(
+        range(len(streamed_lines))
+    )
+
+    parser.output_format = "markdown_table"
+    parser_output = parser.parse_file(csv_filepath)
+    n_tables = sum("Training id" in line.text for line in parser_output.content)
+    assert n_tables == (len(streamed_lines) + 1) // 2
+
+
+def test_convert_df_to_markdown_table():
+    df = pd.DataFrame(
+        {"id": [1, 2], "score": [0.5, float("nan")], "text": ["a\nb", "c|d"]}
+    )
+    assert CSVParser.convert_df_to_markdown_table(df) == (
+        "| id | score | text |\n"
+        "|---:|---:|:---|\n"
+        "| 1 | 0.5 | a b |\n"
+        "| 2 | nan | c\\|d |"
+    )
+
+
+def test_convert_df_to_markdown_table_missing_values():
+    df = pd.DataFrame({"name": ["a", None, float("nan")], "count": [1, 2, 3]})
+    assert CSVParser.convert_df_to_markdown_table(df) == (
+        "| name | count |\n" "|:---|---:|\n" "| a | 1 |\n" "|  | 2 |\n" "|  | 3 |"
+    )
+    # pd.NA of nullable dtypes
+    df = pd.DataFrame(
+        {
+            "count": pd.array([1, None, 3], dtype="Int64"),
+            "ratio": pd.array([0.5, 1.0, None], dtype="Float64"),
+            "flag": pd.array([None, True, False], dtype="boolean"),
+            "name": pd.array(["a", "b", None], dtype="string"),
+        }
+    )
+    assert CSVParser.convert_df_to_markdown_table(df) == (
+        "| count | ratio | flag | name |\n"
+        "|---:|---:|:---|:---|\n"
+        "| 1 | 0.5 |  | a |\n"
+        "|  | 1 | True | b |\n"
+        "| 3 |  | False |  |"
+    )
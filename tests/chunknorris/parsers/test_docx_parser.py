@@ -20,3 +20,30 @@ def test_parse_tables(docx_parser: DocxParser, docx_tables_filepath: str):
     assert len(re.findall(r"\bCol2\b", table_as_md)) == 1
     assert len(re.findall(r"\bCol3 Col4\b", table_as_md)) == 1
     assert len(re.findall(r"\bCol5\b", table_as_md)) == 3
+
+
+def test_parse_file_xml_engine(docx_filepath: str, docx_tables_filepath: str):
+    parser = DocxParser(engine="xml")
+    parser_output = parser.parse_file(docx_filepath)
+    assert isinstance(parser_output, MarkdownDoc)
+    assert len(re.findall(r"\bNo\b", parser_output.to_string())) == 2
+    table_as_md = parser.parse_file(docx_tables_filepath).to_string()
+    assert len(re.findall(r"\bCol2\b", table_as_md)) == 1
+    assert len(re.findall(r"\bCol3 Col4\b", table_as_md)) == 1
+    assert len(re.findall(r"\bCol5\b", table_as_md)) == 3
+
+
+def test_xml_engine_main_text(docx_filepath: str):
+    def get_main_text(engine: str) -> str:
+        text = DocxParser(engine=engine).parse_file(docx_filepath).to_string()
+        text = re.sub(r"<[^>]+>|\]\([^)]*\)", "", text)  # html tags, link targets
+        text = re.sub(r"^\d+\. ", "", text, flags=re.MULTILINE)  # list numbering
+        return re.sub(r"\W+", "", text)
+
+    # same text as mammoth, including the text box of the cover page
+    assert get_main_text("xml") == get_main_text("mammoth")
+    assert "DUMMYDOCUMENTTITLE" in get_main_text("xml")
+    # no markdown emphasis in HTML tables
+    xml_text = DocxParser(engine="xml").parse_file(docx_filepath).to_string()
+    html_tables = re.findall(r"<table>.*?</table>", xml_text)
+    assert html_tables and not any("*" in table for table in html_tables)
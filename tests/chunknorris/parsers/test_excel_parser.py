@@ -30,3 +30,19 @@ def test_parse_string(excel_parser: ExcelParser, excel_filepath: str):
     assert sum(line.startswith("#") for line in lines) == 2
     assert sum(line.startswith("|") for line in lines) == 7
     assert sum(line.startswith("{") for line in lines) == 5
+
+
+def test_parse_file_streaming(excel_parser: ExcelParser, excel_filepath: str):
+    excel_parser.output_format = "auto"
+    expected_output = excel_parser.parse_file(excel_filepath).to_string()
+    streaming_parser = ExcelParser(output_format="auto", engine="streaming")
+    assert streaming_parser.parse_file(excel_filepath).to_string() == expected_output
+    streaming_parser.max_workers = 2
+    assert streaming_parser.parse_file(excel_filepath).to_string() == expected_output
+    # lines are yielded batch by batch, the first ones before the sheet is fully read
+    streaming_parser.max_workers, streaming_parser.batch_size = 1, 2
+    expected_output = streaming_parser.parse_file(excel_filepath).to_string()
+    lines = streaming_parser.iter_workbook_lines(excel_filepath)
+    first_line = next(lines)
+    assert first_line.text.startswith("## ")
+    assert MarkdownDoc(content=[first_line, *lines]).to_string() == expected_output
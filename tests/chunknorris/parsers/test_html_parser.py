@@ -13,3 +13,9 @@ def test_parse_string(
 def test_parse_file(html_parser: HTMLParser, html_filepath: str):
     parser_output = html_parser.parse_file(html_filepath)
     assert isinstance(parser_output, MarkdownDoc)
+
+
+def test_parse_table_without_header(html_parser: HTMLParser):
+    html_string = "<table><tr><td>Col1</td><td>Col2</td></tr><tr><td>a</td><td>1</td></tr></table>"
+    parser_output = html_parser.parse_string(html_string)
+    assert parser_output.to_string() == "| Col1 | Col2 |\n|:---|---:|\n| a | 1 |"
@@ -1,13 +1,29 @@
+import copy
+import pickle
 import re
+from pathlib import Path
 
+import numpy as np
 import pymupdf  # type: ignore -> no stubs
+import pytest
 from PIL.Image import Image as PILImage
+from rapidfuzz import fuzz
 
 from chunknorris import set_ml_backend
 from chunknorris.core.components import MarkdownDoc
+from chunknorris.core.instrumentation import InMemoryCollector, set_collector
 from chunknorris.ml.pdf_page_classifiers.classifier_onnx import PDFPageClassifierONNX
 from chunknorris.ml.pdf_page_classifiers.classifier_ov import PDFPageClassifierOV
+from chunknorris.ml.pdf_page_classifiers.types import PdfPagePrediction
 from chunknorris.parsers import PdfParser
+from chunknorris.parsers.pdf.tools import (
+    Link,
+    PdfLinkExtraction,
+    PdfPagePredictionCache,
+    TableFinder,
+    TextSpan,
+)
+from chunknorris.parsers.pdf.tools.components import TocTitle
 
 
 def test_parse_file(pdf_parser: PdfParser, pdf_filepath: str):
@@ -54,6 +70,175 @@ def test_parse_string(pdf_parser: PdfParser, pdf_filepath: str):
     assert isinstance(md_string, MarkdownDoc)
 
 
+def test_profile(pdf_filepath: str, tmp_path: Path):
+    parser = PdfParser(use_ocr="never", profile=True)
+    parser.parse_file(pdf_filepath)
+    report = parser.profile_report
+    assert report is not None
+    assert {
+        "create_spans/extract_spans",
+        "create_spans/bind_links",
+        "get_tables",
+        "get_toc/toc_matching",
+    } <= set(report.stages)
+    assert report.stages["create_spans"].cpu_time > 0
+    assert len(report.page_times) == parser.document.page_count  # type: ignore
+    assert {"rect", "spans", "links", "tables"} <= set(report.page_times[0])
+    output_filepath = tmp_path / "slowest_pages.pdf"
+    page_numbers = parser.dump_slowest_pages(str(output_filepath), n=2)
+    assert len(page_numbers) == 2
+    assert pymupdf.open(output_filepath).page_count == 2  # type: ignore
+
+
+def test_page_extractors_stages(pdf_tables_filepath: str):
+    collector = InMemoryCollector()
+    set_collector(collector)
+    try:
+        parser = PdfParser(use_ocr="never", profile=True)
+        parser.parse_file(pdf_tables_filepath)
+    finally:
+        set_collector(None)
+    page_count = parser.document.page_count  # type: ignore
+    find_tables = next(
+        stage for stage in collector.summary() if stage["name"] == "pdf.find_tables"
+    )
+    # one span per page for the table detection, and one for the binding to the spans
+    assert find_tables["count"] == page_count + 1
+    assert find_tables["page_count"] == page_count
+    assert find_tables["skipped_page_count"] == sum(
+        not TableFinder.has_line_work(page) for page in parser.document  # type: ignore
+    )
+    assert find_tables["total_duration"] > 0
+    report = parser.profile_report
+    assert report is not None
+    tables_time = sum(times["tables"] for times in report.page_times.values())
+    assert report.stages["get_tables"].wall_time >= tables_time > 0
+
+
+def test_bind_links_to_spans():
+    # lines of spans with integer coordinates, so that many intersection areas are tied
+    rng = np.random.default_rng(0)
+    spans_bboxes: list[tuple[int, int, int, int]] = []
+    for line in range(80):
+        x = 0
+        while x < 500:
+            width = int(rng.integers(5, 60))
+            height = 30 if rng.random() < 0.05 else 10  # some spans cover several lines
+            spans_bboxes.append((x, line * 12, x + width, line * 12 + height))
+            x += width
+    links_bboxes = [
+        (x, y, x + int(rng.integers(1, 120)), y + int(rng.integers(1, 40)))
+        for x, y in zip(rng.integers(0, 500, 600), rng.integers(0, 960, 600))
+    ]
+    # spans 1 and 2 have the same intersection area with the link, after span 0
+    spans_bboxes += [(0, 2000, 4, 2010), (4, 2000, 7, 2010), (7, 2000, 10, 2010)]
+    links_bboxes.append((0, 2000, 10, 2010))
+    spans = [
+        TextSpan(
+            bbox=bbox,  # type: ignore
+            text="text",
+            font="font",
+            color=0,
+            size=10,
+            flags=0,
+            ascender=1,
+            descender=0,
+            origin=bbox[:2],  # type: ignore
+            page=0,
+            orientation=(1, 0),
+        )
+        for bbox in spans_bboxes
+    ]
+    links = [Link(uri=f"https://{i}", bbox=bbox) for i, bbox in enumerate(links_bboxes)]  # type: ignore
+    parser = PdfParser()
+    parser.pages_content = {0: {"links": links}}
+    parser._bind_links_to_spans(spans)
+
+    # same binding as with the dense (n_spans, n_links) intersection matrix
+    intersection_areas = PdfLinkExtraction.calculate_intersection_areas(
+        np.array(spans_bboxes, dtype=np.float32),
+        np.array(links_bboxes, dtype=np.float32),
+    )
+    expected_links: list[Link | None] = [None] * len(spans)
+    for i, link in enumerate(links):
+        span_idx = PdfLinkExtraction._get_span_corresponding_to_link(
+            intersection_areas[:, i]
+        )
+        if span_idx is not None:
+            expected_links[span_idx] = link
+    assert sum(link is not None for link in expected_links) > 100
+    assert [span.link for span in spans] == expected_links
+    # ties are broken by the order of the spans
+    assert spans[-2].link is links[-1] and spans[-1].link is None
+
+
+def test_match_toc_line():
+    assert PdfParser._match_toc_line("1.2 Introduction ........ p. 12") == (
+        "1.2 Introduction",
+        "12",
+    )
+    assert PdfParser._match_toc_line("Annexes - - - - - 7 and more") == (
+        "Annexes",
+        "7",
+    )
+    # long runs of leaders without page number used to stall the regex
+    assert PdfParser._match_toc_line("Note" + " " * 500 + "end") is None
+    assert PdfParser._match_toc_line("Note" + ". " * 500) is None
+
+
+def test_set_block_issectiontitle_with_toc(pdf_parser: PdfParser, pdf_filepath: str):
+    def find_block_reference(title: TocTitle) -> int | None:
+        """Block matched by a title, looking at blocks one by one."""
+        best_block_idx, best_ratio = None, 0
+        for block_idx, block in enumerate(pdf_parser.blocks):
+            if block.page not in range(title.page - 1, title.page + 2):
+                continue
+            if block.lines[0].text.lower() == title.text.lower():
+                return block_idx
+            ratio = round(fuzz.ratio(title.text.lower(), block.text.lower()))
+            if ratio > best_ratio:
+                best_block_idx, best_ratio = block_idx, ratio
+        if best_ratio >= PdfParser._TOC_MATCH_MIN_RATIO:
+            return best_block_idx
+        return None
+
+    pdf_parser.parse_file(pdf_filepath)
+    # a copy of a block makes ties, won by the first block
+    pdf_parser.blocks.append(
+        copy.deepcopy(max(pdf_parser.blocks, key=lambda block: len(block.text)))
+    )
+    titles = [
+        TocTitle(text=title.text, source="regex", page=title.page)
+        for title in pdf_parser.get_toc_from_document()
+    ]
+    for block in pdf_parser.blocks:
+        if block.lines[0].text:
+            # first lines, and texts with typos
+            titles.append(
+                TocTitle(text=block.lines[0].text, source="regex", page=block.page)
+            )
+            titles.append(
+                TocTitle(text=block.text[1:] + "x", source="regex", page=block.page)
+            )
+    titles.append(TocTitle(text="Not in the document", source="regex", page=0))
+    expected_section_titles = [None] * len(pdf_parser.blocks)
+    for title in titles:
+        block_idx = find_block_reference(title)
+        if block_idx is not None:
+            expected_section_titles[block_idx] = title
+    for block in pdf_parser.blocks:
+        block.section_title = None
+
+    pdf_parser._set_block_issectiontitle_with_toc(titles)
+
+    assert all(
+        block.section_title is expected
+        for block, expected in zip(pdf_parser.blocks, expected_section_titles)
+    )
+    assert any(title.found for title in titles)
+    assert not titles[-1].found
+
+
 def test_get_pages_as_images(pdf_parser: PdfParser, pdf_filepath: str):
     pdf_parser.read_file(pdf_filepath)
 
@@ -83,3 +268,109 @@ def test_classify_pages(pdf_filepath: str):
     parser.read_file(pdf_filepath)
     preds = [pred for pred in parser.classify_pages()]
     assert len(preds) == parser.document.page_count  # type: ignore
+    assert parser._page_classifier.weights_digest  # type: ignore
+    # lazily rendered images can't come from another document
+    parser.read_file(pdf_filepath)
+    with pytest.raises(ValueError):
+        preds[0].image
+
+
+def test_prediction_cache(tmp_path: Path):
+    cache = PdfPagePredictionCache(str(tmp_path / "predictions.sqlite"), max_entries=2)
+    predictions = {
+        key: PdfPagePrediction(
+            needs_image_embedding=False,
+            predicted_classes=["text"],
+            probabilities={"text": proba},
+        )
+        for key, proba in [("a", 0.1), ("b", 0.2), ("c", 0.3)]
+    }
+    cache.set_many({"a": predictions["a"], "b": predictions["b"]})
+    assert cache.get_many(["a", "unknown"]) == {"a": predictions["a"]}
+    # "b" is the least recently used entry
+    cache.set_many({"c": predictions["c"]})
+    assert len(cache) == 2
+    assert cache.get_many(["a", "b", "c"]) == {
+        "a": predictions["a"],
+        "c": predictions["c"],
+    }
+    # the cache is shared by the copies sent to other processes
+    assert pickle.loads(pickle.dumps(cache)).get_many(["c"]) == {"c": predictions["c"]}
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_has_line_work(pdf_tables_filepath: str):
+    assert TableFinder.has_line_work(pymupdf.open(pdf_tables_filepath)[0])  # type: ignore
+    document = pymupdf.open()
+    page = document.new_page()  # type: ignore : missing typing in pymupdf
+    page.insert_text((50, 50), "Only text, l re")
+    assert not TableFinder.has_line_work(page)
+
+
+def test_get_table_lines(pdf_tables_filepath: str):
+    table_finder = TableFinder()
+
+    def get_table_lines_reference(page: pymupdf.Page) -> np.ndarray:
+        """Lines of a page, looking at the drawings of page.get_drawings() one by one."""
+        ann_rects = [annot.rect for annot in page.annots()]  # type: ignore
+        line_items = []
+        for drawing in page.get_drawings():  # type: ignore
+            if any(ann.contains(drawing["rect"]) for ann in ann_rects):
+                continue
+            for item in drawing["items"]:
+                if item[0] == "l":
+                    line_items.append((item[1].x, item[1].y, item[2].x, item[2].y))
+                elif item[0] == "re":
+                    rect = item[1]
+                    if rect.width < table_finder.line_width_threshold:
+                        mid_x = (rect.x0 + rect.x1) / 2
+                        line_items.append((mid_x, rect.y0, mid_x, rect.y1))
+                    elif rect.height < table_finder.line_width_threshold:
+                        mid_y = (rect.y0 + rect.y1) / 2
+                        line_items.append((rect.x0, mid_y, rect.x1, mid_y))
+        if not line_items:
+            return np.empty(shape=(0, 4))
+        line_coordinates = np.array(line_items, dtype=np.float32).round()
+        return TableFinder._filter_lines(line_coordinates)
+
+    document = pymupdf.open(pdf_tables_filepath)
+    for page in document:  # type: ignore
+        lines = table_finder._get_table_lines(page)
+        assert len(lines) > 0
+        assert np.array_equal(lines, get_table_lines_reference(page))
+        # drawings within annotations are ignored
+        page.add_rect_annot(pymupdf.Rect(0, 0, page.rect.width, page.rect.height / 5))
+        lines_out_of_annot = table_finder._get_table_lines(page)
+        assert 0 < len(lines_out_of_annot) < len(lines)
+        assert np.array_equal(lines_out_of_annot, get_table_lines_reference(page))
+
+
+def test_get_points_in_rects_mask():
+    rng = np.random.default_rng(0)
+    rects = rng.integers(0, 100, size=(20, 4)).astype(np.float32)
+    rects[:, 2:] = rects[:, :2] + rng.integers(1, 30, size=(20, 2))
+    # random points, and the corners and edge middles of each rectangle
+    x0, y0, x1, y1 = rects.T
+    points = np.concatenate(
+        [
+            rng.uniform(0, 130, size=(500, 2)).astype(np.float32),
+            *[
+                np.stack([x, y], axis=1)
+                for x in (x0, (x0 + x1) / 2, x1)
+                for y in (y0, (y0 + y1) / 2, y1)
+            ],
+        ]
+    )
+    expected = [
+        any(pymupdf.Rect(*rect).contains(pymupdf.Point(*point)) for rect in rects)
+        for point in points
+    ]
+
+    mask = PdfParser._get_points_in_rects_mask(points, rects)
+
+    assert mask.tolist() == expected
+    assert 0 < sum(expected) < len(expected)
+    assert not PdfParser._get_points_in_rects_mask(
+        points, np.empty((0, 4), dtype=np.float32)
+    ).any()
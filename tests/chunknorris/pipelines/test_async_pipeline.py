@@ -0,0 +1,91 @@
+import asyncio
+import os
+from concurrent.futures import wait
+
+import pytest
+
+from chunknorris.chunkers import MarkdownChunker
+from chunknorris.parsers import HTMLParser, MarkdownParser
+from chunknorris.pipelines import AsyncPipeline, BasePipeline
+
+
+def test_chunk_file_and_bytes(
+    md_chunker: MarkdownChunker, md_filepath: str, html_filepath: str
+):
+    async def chunk_documents() -> tuple[list[str], list[str]]:
+        async with AsyncPipeline(
+            md_chunker, max_workers=2, concurrency_limits={".html": 1}
+        ) as pipeline:
+            with open(html_filepath, "rb") as f:
+                html_content = f.read()
+            md_chunks, html_chunks = await asyncio.gather(
+                pipeline.chunk_file(md_filepath),
+                pipeline.chunk_bytes(html_content, "html"),
+            )
+        return [chunk.get_text() for chunk in md_chunks], [
+            chunk.get_text() for chunk in html_chunks
+        ]
+
+    md_texts, html_texts = asyncio.run(chunk_documents())
+    expected_md_chunks = BasePipeline(MarkdownParser(), md_chunker).chunk_file(
+        md_filepath
+    )
+    expected_html_chunks = BasePipeline(HTMLParser(), md_chunker).chunk_file(
+        html_filepath
+    )
+    assert md_texts == [chunk.get_text() for chunk in expected_md_chunks]
+    assert html_texts == [chunk.get_text() for chunk in expected_html_chunks]
+
+
+def test_timeout(md_chunker: MarkdownChunker, md_filepath: str):
+    async def chunk_document():
+        async with AsyncPipeline(md_chunker, max_workers=1) as pipeline:
+            await pipeline.chunk_file(md_filepath, timeout=1e-6)
+
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(chunk_document())
+
+
+def test_timeout_includes_admission(md_chunker: MarkdownChunker, md_filepath: str):
+    async def chunk_document():
+        async with AsyncPipeline(
+            md_chunker, max_workers=1, concurrency_limits={".md": 1}
+        ) as pipeline:
+            pipeline._bind_to_running_loop()
+            # the only slot for markdown files is taken
+            await pipeline._limits[".md"].acquire()
+            await pipeline.chunk_file(md_filepath, timeout=0.1)
+
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(chunk_document())
+
+
+def test_no_head_of_line_blocking(
+    md_chunker: MarkdownChunker, md_filepath: str, html_filepath: str
+):
+    async def chunk_documents() -> list[str]:
+        async with AsyncPipeline(
+            md_chunker, max_workers=1, max_pending=1, concurrency_limits={".html": 1}
+        ) as pipeline:
+            pipeline._bind_to_running_loop()
+            # the only slot for html files is taken : html documents wait for it
+            await pipeline._limits[".html"].acquire()
+            waiting_html = asyncio.create_task(pipeline.chunk_file(html_filepath))
+            await asyncio.sleep(0)
+            md_chunks = await pipeline.chunk_file(md_filepath, timeout=30)
+            waiting_html.cancel()
+        return [chunk.get_text() for chunk in md_chunks]
+
+    md_texts = asyncio.run(chunk_documents())
+    assert md_texts
+
+
+def test_restart_after_worker_crash(md_chunker: MarkdownChunker, md_filepath: str):
+    async def chunk_document() -> list[str]:
+        async with AsyncPipeline(md_chunker, max_workers=1) as pipeline:
+            # a worker process dies : the pool of workers is restarted
+            wait([pipeline._get_executor().submit(os._exit, 1)])
+            chunks = await pipeline.chunk_file(md_filepath, timeout=30)
+        return [chunk.get_text() for chunk in chunks]
+
+    assert asyncio.run(chunk_document())
@@ -0,0 +1,38 @@
+import json
+import shutil
+from pathlib import Path
+
+from chunknorris.chunkers import MarkdownChunker
+from chunknorris.pipelines import CorpusPipeline
+
+
+def test_chunk_directory(
+    md_chunker: MarkdownChunker,
+    md_filepath: str,
+    html_filepath: str,
+    csv_filepath: str,
+    tmp_path: Path,
+):
+    input_dir = tmp_path / "corpus"
+    (input_dir / "sub").mkdir(parents=True)
+    shutil.copy(md_filepath, input_dir / "file.md")
+    shutil.copy(html_filepath, input_dir / "sub" / "file.html")
+    shutil.copy(csv_filepath, input_dir / "file.csv")
+    (input_dir / "broken.pdf").write_bytes(b"not a pdf")
+    (input_dir / "ignored.txt").write_text("no parser", encoding="utf-8")
+    (input_dir / "ignored.json").write_text('{"not": "wikit"}', encoding="utf-8")
+    output_filepath = tmp_path / "chunks.jsonl"
+
+    pipeline = CorpusPipeline(md_chunker)
+    errors = pipeline.chunk_directory(
+        str(input_dir), str(output_filepath), max_workers=2
+    )
+    assert list(errors) == [str(input_dir / "broken.pdf")]
+    with open(output_filepath, "r", encoding="utf8") as f:
+        records = [json.loads(line) for line in f]
+    assert {Path(record["source"]).name for record in records} == {
+        "file.md",
+        "file.html",
+        "file.csv",
+    }
+    assert all(record["text"] for record in records)
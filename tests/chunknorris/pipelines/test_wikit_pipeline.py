@@ -1,3 +1,6 @@
+import shutil
+from pathlib import Path
+
 import pytest
 
 from chunknorris.chunkers import MarkdownChunker
@@ -24,3 +27,40 @@ def test_chunk_and_save(
 ):
     wikit_pipeline = WikitJsonPipeline(wikit_parser, md_chunker)
     wikit_pipeline.chunk_and_save(wikitjson_md_filepath)
+
+
+def test_chunk_directory(
+    wikit_parser: WikitJsonParser,
+    md_chunker: MarkdownChunker,
+    wikitjson_md_filepath: str,
+    tmp_path: Path,
+):
+    input_dir = tmp_path / "docs"
+    (input_dir / "sub").mkdir(parents=True)
+    shutil.copy(wikitjson_md_filepath, input_dir / "a.json")
+    shutil.copy(wikitjson_md_filepath, input_dir / "sub" / "b.json")
+    (input_dir / "broken.json").write_text("{not json", encoding="utf-8")
+    output_dir = tmp_path / "docs-chunked"
+    wikit_pipeline = WikitJsonPipeline(wikit_parser, md_chunker)
+
+    errors = wikit_pipeline.chunk_directory(str(input_dir) + "/", max_workers=2)
+    assert list(errors) == [str(input_dir / "broken.json")]
+    assert (output_dir / "a.json").exists() and (output_dir / "sub" / "b.json").exists()
+
+    # unchanged files are skipped, failed ones are retried
+    (output_dir / "a.json").unlink()
+    (output_dir / "sub" / "b.json").write_text("sentinel", encoding="utf-8")
+    errors = wikit_pipeline.chunk_directory(str(input_dir), max_workers=1)
+    assert list(errors) == [str(input_dir / "broken.json")]
+    assert (output_dir / "a.json").exists()
+    assert (output_dir / "sub" / "b.json").read_text(encoding="utf-8") == "sentinel"
+
+    # the manifest is compacted : one entry per chunked file
+    manifest_lines = (output_dir / ".manifest.jsonl").read_text().splitlines()
+    assert len(manifest_lines) == 2
+
+    # files are chunked again when the settings change
+    md_chunker.max_chunk_word_count += 1
+    errors = wikit_pipeline.chunk_directory(str(input_dir))
+    md_chunker.max_chunk_word_count -= 1
+    assert (output_dir / "sub" / "b.json").read_text(encoding="utf-8") != "sentinel"
@@ -0,0 +1,33 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+SRC_DIR = Path(__file__).parents[2] / "src"
+HEAVY_MODULES = ["pymupdf", "pandas", "numpy", "mammoth", "bs4", "rapidfuzz", "psutil"]
+
+
+def test_import_markdown_only_is_light():
+    # run in a fresh interpreter, as the test session already imported everything
+    code = (
+        "import json, sys, time\n"
+        "start = time.perf_counter()\n"
+        "from chunknorris.parsers import MarkdownParser\n"
+        "from chunknorris.chunkers import MarkdownChunker\n"
+        "from chunknorris.pipelines import BasePipeline\n"
+        "elapsed = time.perf_counter() - start\n"
+        "print(json.dumps({'elapsed': elapsed, 'modules': list(sys.modules)}))\n"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=os.environ | {"PYTHONPATH": str(SRC_DIR)},
+    ).stdout
+    result = json.loads(output)
+    loaded_heavy_modules = [
+        module for module in HEAVY_MODULES if module in result["modules"]
+    ]
+    assert not loaded_heavy_modules
@@ -0,0 +1,86 @@
+import json
+import os
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import wait
+
+import pytest
+
+from chunknorris.chunkers import MarkdownChunker
+from chunknorris.core.components import MarkdownDoc
+from chunknorris.parsers import MarkdownParser
+from chunknorris.server import ChunkingServer
+
+
+class SleepingParser(MarkdownParser):
+    """A parser slower than the timeout of the server."""
+
+    def parse_file(self, filepath: str) -> MarkdownDoc:
+        time.sleep(5)
+        return super().parse_file(filepath)
+
+
+def test_chunking_server(md_chunker: MarkdownChunker, md_filepath: str):
+    server = ChunkingServer(md_chunker, max_workers=1)
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"port": 0}, daemon=True
+    )
+    thread.start()
+    assert server.wait_until_ready(timeout=30)
+    port = server._http_server.server_address[1]  # type: ignore # pylint: disable=protected-access
+    base_url = f"http://127.0.0.1:{port}"
+    try:
+        with urllib.request.urlopen(f"{base_url}/health") as response:
+            assert json.loads(response.read())["status"] == "ok"
+
+        with open(md_filepath, "rb") as f:
+            request = urllib.request.Request(
+                f"{base_url}/chunk?filename=file.md", data=f.read(), method="POST"
+            )
+        with urllib.request.urlopen(request) as response:
+            chunks = json.loads(response.read())["chunks"]
+        assert chunks and all(chunk["text"] for chunk in chunks)
+
+        request = urllib.request.Request(
+            f"{base_url}/chunk?ext=.unknown", data=b"content", method="POST"
+        )
+        with pytest.raises(urllib.error.HTTPError) as e:
+            urllib.request.urlopen(request)
+        assert e.value.code == 400
+
+        # a worker process dies : the pool of workers is restarted
+        crash = server._executor.submit(os._exit, 1)  # pylint: disable=protected-access
+        wait([crash])
+        with open(md_filepath, "rb") as f:
+            request = urllib.request.Request(
+                f"{base_url}/chunk?ext=.md", data=f.read(), method="POST"
+            )
+        with urllib.request.urlopen(request) as response:
+            assert json.loads(response.read())["chunks"]
+    finally:
+        server.shutdown()
+        thread.join()
+
+
+def test_chunking_server_timeout(md_chunker: MarkdownChunker):
+    server = ChunkingServer(
+        md_chunker, {".md": SleepingParser()}, max_workers=1, timeout=0.5
+    )
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"port": 0}, daemon=True
+    )
+    thread.start()
+    assert server.wait_until_ready(timeout=30)
+    port = server._http_server.server_address[1]  # type: ignore # pylint: disable=protected-access
+    try:
+        request = urllib.request.Request(
+            f"http://127.0.0.1:{port}/chunk?ext=.md", data=b"# Title", method="POST"
+        )
+        with pytest.raises(urllib.error.HTTPError) as e:
+            urllib.request.urlopen(request)
+        assert e.value.code == 504
+    finally:
+        server.shutdown()
+        thread.join()